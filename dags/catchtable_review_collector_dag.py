@@ -13,12 +13,19 @@ import pandas as pd
 import os
 import time
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+try:
+    from curl_cffi import requests as curl_requests
+except ImportError:  # 없으면 Selenium 수집만 사용
+    curl_requests = None
+
 # ==============================================================================
 # Configuration
 # ==============================================================================
@@ -27,6 +34,41 @@ RESTAURANT_FILE = os.path.join(BASE_DIR, "캐치테이블_가게정보.csv")
 REVIEW_HISTORY_FILE = os.path.join(BASE_DIR, "review_count_history.csv")
 SUPABASE_CONN_ID = "xoosl033110_supabase_conn"
 SUPABASE_TABLE = "catchtable_reviews"
+# 리뷰 수집 샤드 수 (Airflow Variable로 조정, 샤드마다 워커에서 드라이버 1개 실행)
+SHARD_COUNT_VARIABLE = "catchtable_review_shards"
+DEFAULT_SHARD_COUNT = 4
+# 페이지 하나가 응답하지 않을 때 해당 가게만 건너뛰도록 하는 로딩 제한 시간 (초)
+PAGE_LOAD_TIMEOUT = 30
+# 샤드 태스크 최대 실행 시간 (초과 시 해당 샤드만 실패 후 재시도)
+SHARD_TIMEOUT = timedelta(minutes=30)
+
+# 리뷰 수 수집 방식 (Airflow Variable: 'api' = 큐레이션 API 우선, 'selenium' = 브라우저만 사용)
+# 응답 구조를 녹화한 실제 응답(dags/fixtures/curation/)으로 확인하기 전까지는 selenium이 기본값
+COUNT_MODE_VARIABLE = "catchtable_review_count_mode"
+DEFAULT_COUNT_MODE = "selenium"
+# 캐치테이블 큐레이션 목록 API (dags/test_catch.py 참고)
+CATCHTABLE_API_URL = "https://ct-api.catchtable.co.kr/api/v6/search/curation/list"
+CURATION_KEY = "classwars2-all"
+API_PAGE_SIZE = 20
+API_MAX_PAGES = 30
+API_MAX_WORKERS = 4
+API_TIMEOUT = 10
+API_HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "accept-language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "content-type": "application/json",
+    "origin": "https://app.catchtable.co.kr",
+    "referer": "https://app.catchtable.co.kr/",
+    "x-requested-with": "XMLHttpRequest",
+}
+# 응답 구조가 바뀌어도 찾을 수 있도록 후보 키를 순서대로 확인
+SHOP_ALIAS_KEYS = ('shopRef', 'shopAlias', 'alias', 'ref')
+SHOP_NAME_KEYS = ('shopName', 'name')
+REVIEW_COUNT_KEYS = ('reviewCount', 'totalReviewCount', 'reviewCnt')
+RATING_KEYS = ('avgScore', 'reviewScore', 'avgRating', 'rating')
+TOTAL_COUNT_KEYS = ('totalCount', 'totalElements', 'total')
+# API 리뷰 수가 히스토리보다 이 비율 이상 줄면 잘못 파싱한 값으로 보고 Selenium으로 다시 수집
+API_MAX_DROP_RATIO = 0.2
 
 
 def get_supabase_credentials():
@@ -48,6 +90,7 @@ def setup_driver():
     options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
     
     driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
     return driver
 
 
@@ -89,10 +132,129 @@ def get_review_count(driver, url, timeout=15):
         return None
 
 
-def collect_reviews(**context):
-    """리뷰 수 수집"""
-    print("=== Starting CatchTable Review Collection ===")
-    
+def curation_payload(offset):
+    """큐레이션 목록 API 요청 본문 (offset부터 API_PAGE_SIZE개)"""
+    return {
+        "paging": {"offset": str(offset), "size": API_PAGE_SIZE},
+        "divideType": "NON_DIVIDE",
+        "serviceType": None,
+        "curation": {"curationKey": CURATION_KEY},
+        "filters": {"contractedType": "ALL", "includeNotContracted": True},
+        "sort": {"sortType": "recommended"},
+    }
+
+
+def fetch_curation_page(offset):
+    """큐레이션 목록 1페이지 조회 (JSON)"""
+    response = curl_requests.post(
+        CATCHTABLE_API_URL,
+        headers=API_HEADERS,
+        json=curation_payload(offset),
+        impersonate="chrome",
+        timeout=API_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def find_value(node, keys):
+    """dict 하위에서 keys 중 처음 발견되는 값 (리스트 안으로는 내려가지 않음)"""
+    queue = [node]
+    while queue:
+        current = queue.pop(0)
+        for key in keys:
+            if current.get(key) not in (None, ''):
+                return current[key]
+        queue.extend(value for value in current.values() if isinstance(value, dict))
+    return None
+
+
+def to_number(value, cast=int):
+    """'1,488', '4.8점' 같은 값을 숫자로 변환 (실패 시 None)"""
+    if isinstance(value, (int, float)):
+        return cast(value)
+    match = re.search(r'\d+(?:\.\d+)?', str(value).replace(',', ''))
+    return cast(float(match.group(0))) if match else None
+
+
+def direct_value(node, keys):
+    """dict 자신 또는 바로 아래 dict에서 keys 중 처음 발견되는 값 (더 깊이는 찾지 않음)"""
+    for current in [node] + [value for value in node.values() if isinstance(value, dict)]:
+        for key in keys:
+            if current.get(key) not in (None, ''):
+                return current[key]
+    return None
+
+
+def extract_shops(data):
+    """
+    API 응답에서 가게 목록 추출 -> [{'alias', 'name', 'review_count', 'rating'}]
+    
+    가게 alias(문자열)가 그 dict에 직접 있고, 리뷰 수가 그 dict나 바로 아래 dict에 있는 것만 가게로 봄
+    (이름만 있거나 리뷰 수가 더 깊이 있는 dict는 가게가 아닌 것으로 보고 하위만 탐색)
+    """
+    shops = []
+    
+    def walk(node):
+        if isinstance(node, list):
+            for item in node:
+                walk(item)
+            return
+        if not isinstance(node, dict):
+            return
+        alias = next((node[key] for key in SHOP_ALIAS_KEYS if isinstance(node.get(key), str) and node[key]), None)
+        review_count = direct_value(node, REVIEW_COUNT_KEYS) if alias else None
+        if review_count is not None and to_number(review_count) is not None:
+            name = next((node[key] for key in SHOP_NAME_KEYS if node.get(key)), None)
+            rating = direct_value(node, RATING_KEYS)
+            shops.append({
+                'alias': alias,
+                'name': str(name) if name else None,
+                'review_count': to_number(review_count),
+                'rating': to_number(rating, float) if rating is not None else None,
+            })
+            return
+        for value in node.values():
+            walk(value)
+    
+    walk(data)
+    return shops
+
+
+def fetch_curation_shops():
+    """큐레이션 전체 가게 조회 (첫 페이지로 전체 개수 확인 후 나머지 페이지 동시 조회)"""
+    first_page = fetch_curation_page(0)
+    shops = extract_shops(first_page)
+    
+    total = find_value(first_page, TOTAL_COUNT_KEYS) if isinstance(first_page, dict) else None
+    total = to_number(total) if total is not None else None
+    
+    if total is not None:
+        offsets = list(range(API_PAGE_SIZE, min(total, API_PAGE_SIZE * API_MAX_PAGES), API_PAGE_SIZE))
+        with ThreadPoolExecutor(max_workers=API_MAX_WORKERS) as executor:
+            for page in executor.map(fetch_curation_page, offsets):
+                shops.extend(extract_shops(page))
+    else:
+        # 전체 개수를 모르면 빈 페이지(또는 덜 찬 페이지)가 나올 때까지 순서대로 조회
+        offset = API_PAGE_SIZE
+        page_shops = shops
+        while len(page_shops) >= API_PAGE_SIZE and offset < API_PAGE_SIZE * API_MAX_PAGES:
+            page_shops = extract_shops(fetch_curation_page(offset))
+            shops.extend(page_shops)
+            offset += API_PAGE_SIZE
+    
+    print(f"[API] {len(shops)} shops fetched (total: {total})")
+    return shops
+
+
+def shop_alias(url):
+    """가게 URL에서 alias 추출 (https://app.catchtable.co.kr/ct/shop/yyw?type=DINING -> yyw)"""
+    match = re.search(r'/ct/shop/([^/?#]+)', str(url))
+    return match.group(1) if match else None
+
+
+def load_restaurants():
+    """가게 정보 파일 로드 -> [{'idx', 'url', 'restaurant_name', 'chef_info', 'category'}]"""
     if not os.path.exists(RESTAURANT_FILE):
         print(f"[Error] Restaurant file not found: {RESTAURANT_FILE}")
         return []
@@ -103,88 +265,242 @@ def collect_reviews(**context):
         print("[Error] URL column not found in restaurant file")
         return []
     
-    # 기존 히스토리 로드
-    if os.path.exists(REVIEW_HISTORY_FILE):
-        df_history = pd.read_csv(REVIEW_HISTORY_FILE, encoding='utf-8-sig')
-    else:
-        df_history = pd.DataFrame(columns=['url', 'restaurant_name', 'review_count', 'last_updated'])
+    restaurants = []
+    for idx, row in df_restaurants.iterrows():
+        url = row.get('URL', '')
+        if not url or pd.isna(url):
+            continue
+        restaurants.append({
+            'idx': int(idx),
+            'url': url,
+            'restaurant_name': row.get('restaurant', row.get('가게명', f'Restaurant_{idx}')),
+            'chef_info': row.get('chief_info', row.get('셰프닉네임', '')),
+            'category': row.get('category', row.get('주요판매요리', '')),
+        })
+    return restaurants
+
+
+def load_history_counts():
+    """히스토리의 가게별 마지막 리뷰 수 {url: review_count}"""
+    if not os.path.exists(REVIEW_HISTORY_FILE):
+        return {}
+    df_history = pd.read_csv(REVIEW_HISTORY_FILE, encoding='utf-8-sig')
+    return {row['url']: int(row['review_count']) for _, row in df_history.iterrows()
+            if pd.notna(row['review_count'])}
+
+
+def api_count_plausible(review_count, previous_count):
+    """API 리뷰 수가 히스토리와 비교해 믿을 만한지 (리뷰 수는 거의 줄지 않으므로 크게 줄면 잘못 파싱한 값)"""
+    if previous_count is None or previous_count <= 0:
+        return review_count >= 0
+    return review_count >= previous_count * (1 - API_MAX_DROP_RATIO)
+
+
+def match_api_counts(restaurants, shops, history_counts, collected_at):
+    """
+    가게 목록과 API 가게를 URL alias로만 매칭 (이름이 같은 다른 지점이 섞이지 않도록 이름 매칭은 하지 않음)
+    
+    Returns:
+        (API 수집 결과 리스트, 히스토리보다 크게 줄어 거부한 가게 이름 리스트)
+    """
+    by_alias = {shop['alias']: shop for shop in shops}
+    counts, rejected = [], []
+    for restaurant in restaurants:
+        shop = by_alias.get(shop_alias(restaurant['url']))
+        if shop is None:
+            continue
+        if not api_count_plausible(shop['review_count'], history_counts.get(restaurant['url'])):
+            rejected.append(restaurant['restaurant_name'])
+            continue
+        counts.append({
+            **restaurant,
+            'review_count': shop['review_count'],
+            'rating': shop['rating'],
+            'collected_at': collected_at
+        })
+    return counts, rejected
+
+
+def collect_api_counts(**context):
+    """큐레이션 API로 리뷰 수/평점 일괄 수집
+    
+    API에서 찾은 가게만 반환하며, 나머지 가게(매칭 실패, 히스토리보다 리뷰 수가 크게 줄어든 가게)는
+    plan_review_shards에서 Selenium 샤드로 넘깁니다. API 호출이 실패하면 빈 결과를 반환해 전부 Selenium으로 수집합니다.
+    """
+    print("=== Collecting Review Counts via CatchTable API ===")
+    
+    mode = Variable.get(COUNT_MODE_VARIABLE, default_var=DEFAULT_COUNT_MODE)
+    if mode != 'api':
+        print(f"[Info] Count mode is '{mode}' - skipping API collection")
+        return []
+    if curl_requests is None:
+        print("[Warning] curl_cffi not installed - falling back to Selenium")
+        return []
+    
+    restaurants = load_restaurants()
+    if not restaurants:
+        return []
+    
+    try:
+        shops = fetch_curation_shops()
+    except Exception as e:
+        print(f"[Warning] CatchTable API request failed: {e} - falling back to Selenium")
+        return []
+    
+    today = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    counts, rejected = match_api_counts(restaurants, shops, load_history_counts(), today)
+    if rejected:
+        print(f"[Warning] API review count dropped sharply for {len(rejected)} restaurant(s) - "
+              f"re-collecting with Selenium: {', '.join(rejected)}")
+    
+    print(f"=== API Collection Complete. Matched: {len(counts)}/{len(restaurants)} restaurants ===")
+    return counts
+
+
+def plan_review_shards(**context):
+    """API로 수집하지 못한 가게를 샤드로 나누기 (샤드마다 collect_review_shard 태스크 1개로 매핑)"""
+    print("=== Planning CatchTable Review Shards ===")
+    
+    # API로 이미 수집한 가게는 제외하고 나머지만 Selenium 샤드로 수집
+    api_counts = context['ti'].xcom_pull(task_ids='collect_api_counts') or []
+    api_urls = {record['url'] for record in api_counts}
+    restaurants = [restaurant for restaurant in load_restaurants() if restaurant['url'] not in api_urls]
+    
+    if not restaurants:
+        print("[Info] All restaurants collected via API - no Selenium shards needed")
+        return []
+    
+    shard_count = int(Variable.get(SHARD_COUNT_VARIABLE, default_var=DEFAULT_SHARD_COUNT))
+    shard_count = max(1, min(shard_count, len(restaurants)))
+    # 라운드로빈 분배 (리뷰가 많은 가게가 한 샤드에 몰리지 않도록)
+    shards = [
+        {'shard_id': shard_id, 'restaurants': restaurants[shard_id::shard_count]}
+        for shard_id in range(shard_count)
+    ]
+    
+    print(f"=== {len(restaurants)} restaurants -> {len(shards)} shards ===")
+    return shards
+
+
+def collect_review_shard(shard_id, restaurants, **context):
+    """샤드 1개의 리뷰 수 수집 (샤드마다 별도 워커/드라이버)
+    
+    히스토리 파일은 merge_review_shards에서만 갱신하고,
+    여기서는 가게별 현재 리뷰 수만 반환합니다.
+    """
+    print(f"=== Starting CatchTable Review Collection (shard {shard_id}, {len(restaurants)} restaurants) ===")
     
     driver = None
-    collected_data = []
+    counts = []
     
     try:
         driver = setup_driver()
         today = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        for idx, row in df_restaurants.iterrows():
-            url = row.get('URL', '')
-            restaurant_name = row.get('restaurant', row.get('가게명', f'Restaurant_{idx}'))
-            chef_info = row.get('chief_info', row.get('셰프닉네임', ''))
-            category = row.get('category', row.get('주요판매요리', ''))
-            
-            if not url or pd.isna(url):
-                continue
+        for i, restaurant in enumerate(restaurants):
+            print(f"[shard {shard_id}] [{i + 1}/{len(restaurants)}] Checking: {restaurant['restaurant_name']}")
             
-            print(f"[{idx + 1}/{len(df_restaurants)}] Checking: {restaurant_name}")
-            
-            review_count = get_review_count(driver, url)
+            review_count = get_review_count(driver, restaurant['url'])
             
             if review_count is not None:
-                # 이전 리뷰 수 가져오기
-                previous_count = 0
-                existing = df_history[df_history['url'] == url]
-                if len(existing) > 0:
-                    previous_count = existing.iloc[0]['review_count']
-                
-                record = {
-                    'url': url,
-                    'restaurant_name': restaurant_name,
-                    'chef_info': chef_info,
-                    'category': category,
-                    'previous_count': previous_count,
-                    'review_count': review_count,
-                    'change_count': review_count - previous_count,
-                    'collected_at': today
-                }
-                collected_data.append(record)
-                
-                # 히스토리 업데이트
-                if len(existing) > 0:
-                    df_history.loc[df_history['url'] == url, ['review_count', 'last_updated']] = [review_count, today]
-                else:
-                    new_row = pd.DataFrame([{
-                        'url': url,
-                        'restaurant_name': restaurant_name,
-                        'review_count': review_count,
-                        'last_updated': today
-                    }])
-                    df_history = pd.concat([df_history, new_row], ignore_index=True)
+                counts.append({**restaurant, 'review_count': review_count, 'collected_at': today})
             
             time.sleep(1)
         
-        # 히스토리 저장
-        df_history.to_csv(REVIEW_HISTORY_FILE, index=False, encoding='utf-8-sig')
-        
-        # XCom으로 데이터 전달
-        context['ti'].xcom_push(key='collected_data', value=collected_data)
-        
-        print(f"=== Collection Complete. Updated: {len(collected_data)} restaurants ===")
-        return collected_data
+        print(f"=== Shard {shard_id} Complete. Collected: {len(counts)}/{len(restaurants)} restaurants ===")
+        return counts
         
-    except Exception as e:
-        print(f"[Error] Review collection failed: {e}")
-        return []
     finally:
         if driver:
             driver.quit()
 
 
+def merge_review_shards(**context):
+    """샤드 결과 병합 -> 히스토리 갱신 + Supabase 적재 데이터 XCom 전달
+    
+    실패한 샤드가 있어도(trigger_rule=all_done) 성공한 샤드 결과는 반영하고,
+    실패한 샤드의 가게는 히스토리가 그대로 남아 다음 실행에서 다시 비교됩니다.
+    """
+    print("=== Merging CatchTable Review Shards ===")
+    
+    ti = context['ti']
+    planned_shards = ti.xcom_pull(task_ids='plan_review_shards') or []
+    shard_results = [result for result in (ti.xcom_pull(task_ids='collect_review_shard') or [])
+                     if result is not None]
+    
+    counts = list(ti.xcom_pull(task_ids='collect_api_counts') or [])
+    for result in shard_results:
+        counts.extend(result)
+    # 샤드 완료 순서와 관계없이 가게 목록 순서로 정렬
+    counts.sort(key=lambda record: record['idx'])
+    
+    failed_shards = len(planned_shards) - len(shard_results)
+    if failed_shards > 0:
+        print(f"[Warning] {failed_shards} shard(s) returned no result")
+    
+    if not counts:
+        print("[Info] No review counts collected")
+        ti.xcom_push(key='collected_data', value=[])
+        return []
+    
+    # 기존 히스토리 로드
+    if os.path.exists(REVIEW_HISTORY_FILE):
+        df_history = pd.read_csv(REVIEW_HISTORY_FILE, encoding='utf-8-sig')
+    else:
+        df_history = pd.DataFrame(columns=['url', 'restaurant_name', 'review_count', 'last_updated'])
+    
+    collected_data = []
+    for row in counts:
+        url = row['url']
+        review_count = row['review_count']
+        collected_at = row['collected_at']
+        
+        # 이전 리뷰 수 가져오기
+        previous_count = 0
+        existing = df_history[df_history['url'] == url]
+        if len(existing) > 0:
+            previous_count = int(existing.iloc[0]['review_count'])
+        
+        collected_data.append({
+            'url': url,
+            'restaurant_name': row['restaurant_name'],
+            'chef_info': row['chef_info'],
+            'category': row['category'],
+            'previous_count': previous_count,
+            'review_count': review_count,
+            'change_count': review_count - previous_count,
+            'rating': row.get('rating'),
+            'collected_at': collected_at
+        })
+        
+        # 히스토리 업데이트
+        if len(existing) > 0:
+            df_history.loc[df_history['url'] == url, ['review_count', 'last_updated']] = [review_count, collected_at]
+        else:
+            new_row = pd.DataFrame([{
+                'url': url,
+                'restaurant_name': row['restaurant_name'],
+                'review_count': review_count,
+                'last_updated': collected_at
+            }])
+            df_history = pd.concat([df_history, new_row], ignore_index=True)
+    
+    # 히스토리 저장
+    df_history.to_csv(REVIEW_HISTORY_FILE, index=False, encoding='utf-8-sig')
+    
+    # XCom으로 데이터 전달
+    ti.xcom_push(key='collected_data', value=collected_data)
+    
+    print(f"=== Merge Complete. Updated: {len(collected_data)} restaurants ===")
+    return collected_data
+
+
 def load_reviews_to_supabase(**context):
     """수집된 리뷰 데이터를 Supabase에 적재"""
     print("=== Loading Reviews to Supabase ===")
     
     ti = context['ti']
-    collected_data = ti.xcom_pull(task_ids='collect_reviews', key='collected_data')
+    collected_data = ti.xcom_pull(task_ids='merge_review_shards', key='collected_data')
     
     if not collected_data:
         print("[Info] No new review data to load")
@@ -428,9 +744,27 @@ with DAG(
         python_callable=ensure_table_exists,
     )
     
-    collect_review_data = PythonOperator(
-        task_id='collect_reviews',
-        python_callable=collect_reviews,
+    collect_api = PythonOperator(
+        task_id='collect_api_counts',
+        python_callable=collect_api_counts,
+    )
+    
+    plan_shards = PythonOperator(
+        task_id='plan_review_shards',
+        python_callable=plan_review_shards,
+    )
+    
+    # 샤드별 동적 매핑 태스크 (Celery 워커들에 나뉘어 병렬 실행)
+    collect_shards = PythonOperator.partial(
+        task_id='collect_review_shard',
+        python_callable=collect_review_shard,
+        execution_timeout=SHARD_TIMEOUT,
+    ).expand(op_kwargs=plan_shards.output)
+    
+    merge_shards = PythonOperator(
+        task_id='merge_review_shards',
+        python_callable=merge_review_shards,
+        trigger_rule='all_done',
     )
     
     load_supabase = PythonOperator(
@@ -445,4 +779,4 @@ with DAG(
     
     end = EmptyOperator(task_id='end')
     
-    start >> ensure_table >> collect_review_data >> load_supabase >> save_snapshot >> end
+    start >> ensure_table >> collect_api >> plan_shards >> collect_shards >> merge_shards >> load_supabase >> save_snapshot >> end
@@ -0,0 +1,99 @@
+"""
+catchtable_review_collector_dag.py 큐레이션 API 리뷰 수 파싱/매칭 테스트
+
+    python -m pytest dags/tests
+
+- 아래 SAMPLE_PAGE는 손으로 만든 응답 예시로, 가게가 아닌 dict를 가게로 잡지 않는지와
+  매칭/히스토리 비교만 확인합니다 (실제 API 구조를 검증하지는 않음)
+- 실제 응답은 dags/test_catch.py가 저장한 catchtable_result.json을 dags/fixtures/curation/에
+  넣으면 test_recorded_pages가 함께 확인합니다 (그 전까지 수집 방식 기본값은 selenium)
+"""
+import glob
+import json
+import os
+import sys
+
+import pytest
+
+# DAG 모듈이 airflow/selenium을 모듈 맨 위에서 import
+pytest.importorskip("airflow")
+pytest.importorskip("selenium")
+
+DAGS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(DAGS_DIR)
+import catchtable_review_collector_dag as dag_module
+
+RECORDED_DIR = os.path.join(DAGS_DIR, 'fixtures', 'curation')
+
+
+def restaurant(idx, alias, name):
+    return {
+        'idx': idx,
+        'url': f"https://app.catchtable.co.kr/ct/shop/{alias}?type=DINING",
+        'restaurant_name': name,
+        'chef_info': '',
+        'category': '',
+    }
+
+
+# 손으로 만든 응답 예시
+SAMPLE_PAGE = {
+    "data": {
+        "totalCount": 3,
+        # 집계 정보 (이름과 하위 리뷰 수가 있지만 가게가 아님)
+        "aggregations": [{"name": "서울", "stats": {"detail": {"reviewCount": 5}}}],
+        "shopResults": {
+            "shops": [
+                {"shopRef": "yyw", "shopName": "유용욱 바베큐 연구소",
+                 "reviewInfo": {"reviewCount": "1,290", "avgScore": "4.8"}},
+                {"shopRef": "imok", "shopName": "IMOK Smoke Dining", "reviewCount": 1500, "avgScore": 4.7},
+                # 이름만 있는 가게는 매칭하지 않음
+                {"shopName": "라망 시크레", "reviewCount": 300},
+            ]
+        },
+    }
+}
+
+RESTAURANTS = [
+    restaurant(0, "yyw", "유용욱 바베큐 연구소"),
+    restaurant(1, "imok", "IMOK Smoke Dining"),
+    restaurant(2, "lamantsecret", "라망 시크레"),
+]
+
+
+def test_extract_shops():
+    assert dag_module.extract_shops(SAMPLE_PAGE) == [
+        {'alias': 'yyw', 'name': '유용욱 바베큐 연구소', 'review_count': 1290, 'rating': 4.8},
+        {'alias': 'imok', 'name': 'IMOK Smoke Dining', 'review_count': 1500, 'rating': 4.7},
+    ]
+
+
+def test_match_api_counts():
+    shops = dag_module.extract_shops(SAMPLE_PAGE)
+    counts, rejected = dag_module.match_api_counts(RESTAURANTS, shops, {}, "2026-01-20 09:00:00")
+
+    # alias로만 매칭 (이름만 같은 가게는 Selenium으로 수집)
+    assert [(record['idx'], record['review_count']) for record in counts] == [(0, 1290), (1, 1500)]
+    assert rejected == []
+
+
+def test_match_api_counts_rejects_sharp_drop():
+    shops = dag_module.extract_shops(SAMPLE_PAGE)
+    history = {RESTAURANTS[0]['url']: 1300, RESTAURANTS[1]['url']: 2500}
+    counts, rejected = dag_module.match_api_counts(RESTAURANTS, shops, history, "2026-01-20 09:00:00")
+
+    # 1300 -> 1290은 허용, 2500 -> 1500(40% 감소)은 거부
+    assert [record['idx'] for record in counts] == [0]
+    assert rejected == ["IMOK Smoke Dining"]
+
+
+@pytest.mark.parametrize('path', sorted(glob.glob(os.path.join(RECORDED_DIR, '*.json'))))
+def test_recorded_pages(path):
+    # 녹화한 실제 응답: 가게를 찾고, 가게 정보 파일의 가게와 alias로 매칭되어야 함
+    with open(path, encoding='utf-8') as f:
+        shops = dag_module.extract_shops(json.load(f))
+
+    assert shops
+    assert all(shop['review_count'] >= 0 for shop in shops)
+    aliases = {dag_module.shop_alias(record['url']) for record in dag_module.load_restaurants()}
+    assert aliases & {shop['alias'] for shop in shops}
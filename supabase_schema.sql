@@ -82,6 +82,61 @@ GROUP BY DATE(sensing_time), autonomous_district
 ORDER BY date DESC, district;
 
 
+-- =====================================================
+-- 5. 변경 알림 트리거 (대시보드 실시간 반영용)
+-- =====================================================
+-- 문(statement) 단위로 1번만 알림을 보냄 (DAG가 수천 행을 한 번에 넣어도 알림 1건)
+-- 대시보드는 LISTEN dashboard_changes 후 INSERT 알림이면 min_id(늦게 커밋된 작은 id 포함) 이후 행을 가져와 이미 가진 id는 건너뜀
+-- payload 예: {"table": "catchtable_reviews", "op": "INSERT", "min_id": 101, "max_id": 150, "rows": 50}
+CREATE OR REPLACE FUNCTION notify_dashboard_change() RETURNS TRIGGER AS $$
+DECLARE
+    changed_count BIGINT := 0;
+    min_id BIGINT;
+    max_id BIGINT;
+BEGIN
+    IF TG_OP <> 'TRUNCATE' THEN
+        SELECT COUNT(*), MIN(id), MAX(id) INTO changed_count, min_id, max_id FROM changed_rows;
+        -- 바뀐 행이 없으면 알림 생략 (ON CONFLICT DO NOTHING 등)
+        IF changed_count = 0 THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+
+    PERFORM pg_notify('dashboard_changes', json_build_object(
+        'table', TG_TABLE_NAME,
+        'op', TG_OP,
+        'min_id', min_id,
+        'max_id', max_id,
+        'rows', changed_count
+    )::TEXT);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 트리거 생성 (전이 테이블은 이벤트 하나에만 지정할 수 있어 이벤트별로 생성)
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['catchtable_reviews', 'seoul_floating_population'] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_notify_insert', tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_notify_update', tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_notify_delete', tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_notify_truncate', tbl);
+
+        EXECUTE format('CREATE TRIGGER %I AFTER INSERT ON %I REFERENCING NEW TABLE AS changed_rows '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION notify_dashboard_change()', tbl || '_notify_insert', tbl);
+        EXECUTE format('CREATE TRIGGER %I AFTER UPDATE ON %I REFERENCING NEW TABLE AS changed_rows '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION notify_dashboard_change()', tbl || '_notify_update', tbl);
+        EXECUTE format('CREATE TRIGGER %I AFTER DELETE ON %I REFERENCING OLD TABLE AS changed_rows '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION notify_dashboard_change()', tbl || '_notify_delete', tbl);
+        EXECUTE format('CREATE TRIGGER %I AFTER TRUNCATE ON %I '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION notify_dashboard_change()', tbl || '_notify_truncate', tbl);
+    END LOOP;
+END;
+$$;
+
+
 -- =====================================================
 -- RLS (Row Level Security) 설정 (선택사항)
 -- =====================================================
@@ -0,0 +1,424 @@
+"""
+흑백요리사2 대시보드 - 오프라인 산출물 번들 모듈
+
+대시보드가 필요로 하는 산출물(정제 데이터, 집계, 회귀 적합 결과, 단순화한 GeoJSON)을
+미리 계산해 data/artifacts/<버전>/ 폴더에 저장하고, 대시보드는 읽기 전용으로 엽니다.
+Streamlit Cloud 콜드 스타트 때 다시 계산하지 않고 파일만 읽으면 됩니다.
+
+대시보드가 Supabase에서 직접 읽는 서바이벌/트렌드 원본은 번들에 넣지 않고, 빌드할 때 쓴 데이터의
+내용 서명만 manifest에 기록합니다. 서바이벌 정제/회귀 산출물은 대시보드가 읽은 데이터의 서명이
+같을 때만 번들에서 읽습니다 (--source local로 빌드한 번들은 Supabase 데이터와 다르면 직접 계산).
+
+사용법 (야간 배치 등에서 실행):
+    python 대시보드용/artifact_bundle.py
+    python 대시보드용/artifact_bundle.py --source supabase --keep 5
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from data_processor import (
+    DATA_DIR,
+    load_reviews,
+    load_population,
+    load_restaurants,
+    calculate_review_changes,
+    get_daily_population_by_district,
+    get_data_path,
+    get_data_signature,
+    normalize_trend_data
+)
+
+# 번들 저장 위치
+ARTIFACTS_DIR = os.path.join(DATA_DIR, 'artifacts')
+# 최신 번들 버전을 가리키는 파일
+LATEST_FILE = 'LATEST'
+MANIFEST_FILE = 'manifest.json'
+# DASHBOARD_ARTIFACTS=0 이면 번들을 쓰지 않고 항상 계산
+ARTIFACTS_ENABLED = os.environ.get('DASHBOARD_ARTIFACTS', '1') not in ('0', 'false', 'False')
+# GeoJSON 단순화 허용 오차 (도 단위, 약 50m)
+GEOJSON_TOLERANCE = 0.0005
+# 대시보드가 직접 읽는 원본 (번들에는 내용 서명만 기록)
+SOURCE_NODES = ('chef_survival_raw', 'trend')
+
+
+def bundle_key(name: str, **params) -> str:
+    """산출물 이름 + 파라미터 -> 번들 안의 키 (예: logit, target_col='an' -> 'logit__an')"""
+    return '__'.join([name] + [str(value) for _, value in sorted(params.items())])
+
+
+def frame_signature(df: Optional[pd.DataFrame]) -> Optional[str]:
+    """DataFrame 내용 서명 (컬럼 + 행 해시의 sha1, 행 순서 포함)"""
+    if df is None:
+        return None
+    digest = hashlib.sha1(json.dumps([str(col) for col in df.columns], ensure_ascii=False).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+# === GeoJSON 단순화 ===
+def _simplify_line(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Ramer-Douglas-Peucker 선 단순화"""
+    if len(points) < 3:
+        return points
+    start, end = points[0], points[-1]
+    segment = end - start
+    length = np.hypot(*segment)
+    if length == 0:
+        distances = np.hypot(*(points - start).T)
+    else:
+        distances = np.abs(np.cross(segment, points - start)) / length
+    index = int(np.argmax(distances))
+    if distances[index] <= tolerance:
+        return np.array([start, end])
+    left = _simplify_line(points[:index + 1], tolerance)
+    right = _simplify_line(points[index:], tolerance)
+    return np.vstack([left[:-1], right])
+
+
+def _simplify_ring(ring: list, tolerance: float) -> list:
+    points = np.asarray(ring, dtype=float)
+    if len(points) <= 4:
+        return ring
+    # 닫힌 고리는 가장 먼 점에서 둘로 나눠 단순화 (시작점=끝점이면 RDP가 전부 지워버림)
+    far = int(np.argmax(np.hypot(*(points - points[0]).T)))
+    simplified = np.vstack([
+        _simplify_line(points[:far + 1], tolerance)[:-1],
+        _simplify_line(points[far:], tolerance)
+    ])
+    if len(simplified) < 4:
+        return ring
+    return np.round(simplified, 6).tolist()
+
+
+def simplify_geojson(geojson: dict, tolerance: float = GEOJSON_TOLERANCE) -> dict:
+    """Polygon / MultiPolygon 좌표 단순화 (지도 렌더링용, 속성은 그대로)"""
+    features = []
+    for feature in geojson.get('features', []):
+        geometry = feature.get('geometry') or {}
+        coords = geometry.get('coordinates')
+        if geometry.get('type') == 'Polygon':
+            coords = [_simplify_ring(ring, tolerance) for ring in coords]
+        elif geometry.get('type') == 'MultiPolygon':
+            coords = [[_simplify_ring(ring, tolerance) for ring in polygon] for polygon in coords]
+        features.append(dict(feature, geometry=dict(geometry, coordinates=coords)))
+    return dict(geojson, features=features)
+
+
+# === 원본 로더 ===
+def _load_local_survival() -> pd.DataFrame:
+    """셰프 서바이벌 결과 (Supabase chef_survival_results 테이블과 같은 CSV)"""
+    return pd.read_csv(get_data_path('셰프서바이벌결과요약.csv'), encoding='utf-8-sig')
+
+
+def _load_local_trend() -> pd.DataFrame:
+    """셰프 트렌드 long-format CSV (Supabase chief_trend_value 테이블과 같은 컬럼)"""
+    path = os.path.join(DATA_DIR, '흑백요리사트렌드추이', 'merged_trends_long.csv')
+    return normalize_trend_data(pd.read_csv(path, encoding='utf-8-sig'))
+
+
+def _load_supabase_survival() -> pd.DataFrame:
+    from supabase_data_loader import load_chef_survival_results_from_supabase
+    return load_chef_survival_results_from_supabase()
+
+
+def _load_supabase_trend() -> pd.DataFrame:
+    from supabase_data_loader import load_trend_data_from_supabase
+    return normalize_trend_data(load_trend_data_from_supabase())
+
+
+def _load_simplified_geojson() -> dict:
+    from population_animated_map import load_seoul_geojson
+    return simplify_geojson(load_seoul_geojson())
+
+
+def build_steps(source: str = 'local') -> List[tuple]:
+    """(번들 키, 계산 함수, 입력 키 목록) - 대시보드 get_artifacts() 그래프와 같은 이름"""
+    # statsmodels/scipy는 빌드할 때만 필요 (대시보드는 번들 읽기만 하므로 import하지 않음)
+    from judge_regression import (
+        JUDGE_COLUMNS,
+        clean_survival_data,
+        clean_genre_survival_data,
+        judge_subset,
+        create_pass_rate_summary,
+        create_summary_df,
+        run_logistic_regression,
+        calculate_vif
+    )
+
+    steps = [
+        ('reviews', load_reviews, []),
+        ('population', load_population, []),
+        ('restaurants', load_restaurants, []),
+        ('chef_survival_raw', _load_supabase_survival if source == 'supabase' else _load_local_survival, []),
+        ('trend', _load_supabase_trend if source == 'supabase' else _load_local_trend, []),
+        ('geojson', _load_simplified_geojson, []),
+        ('review_changes', calculate_review_changes, ['reviews']),
+        ('daily_pop', lambda pop: get_daily_population_by_district(pop.copy()), ['population']),
+        ('survival', clean_survival_data, ['chef_survival_raw']),
+        ('genre_survival', clean_genre_survival_data, ['chef_survival_raw']),
+    ]
+    for judge in JUDGE_COLUMNS:
+        logit = bundle_key('logit', target_col=judge)
+        steps += [
+            (bundle_key('pass_rate_summary', judge_col=judge),
+             lambda df, j=judge: create_pass_rate_summary(judge_subset(df, j), j), ['survival']),
+            (logit, lambda df, j=judge: run_logistic_regression(df, j), ['survival']),
+            (bundle_key('logit_summary', target_col=judge), lambda fit: create_summary_df(fit[0]), [logit]),
+            (bundle_key('vif', target_col=judge),
+             lambda fit: calculate_vif(fit[1]) if fit[1] is not None else None, [logit]),
+        ]
+    return steps
+
+
+# === 번들 빌드 ===
+def _write_artifact(bundle_dir: str, key: str, value: Any) -> dict:
+    """산출물 1개 저장 (GeoJSON은 JSON, 나머지는 pickle)"""
+    if key == 'geojson':
+        file_name = f'{key}.json'
+        with open(os.path.join(bundle_dir, file_name), 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False, separators=(',', ':'))
+    else:
+        file_name = f'{key}.pkl'
+        with open(os.path.join(bundle_dir, file_name), 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    entry = {'file': file_name, 'bytes': os.path.getsize(os.path.join(bundle_dir, file_name))}
+    if isinstance(value, pd.DataFrame):
+        entry['rows'] = len(value)
+    return entry
+
+
+def build_bundle(root: str = ARTIFACTS_DIR, source: str = 'local', keep: int = 3) -> Optional[str]:
+    """
+    산출물 번들 빌드 후 LATEST 갱신
+
+    Args:
+        root: 번들 저장 폴더
+        source: 서바이벌/트렌드 데이터 출처 ('local' CSV 또는 'supabase')
+        keep: 남겨둘 예전 번들 수 (LATEST 포함)
+
+    Returns:
+        새 번들 경로 (산출물이 하나도 없으면 None)
+    """
+    version = datetime.now().strftime('%Y%m%d-%H%M%S')
+    tmp_dir = os.path.join(root, f'.{version}.tmp')
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    values: Dict[str, Any] = {}
+    artifacts: Dict[str, dict] = {}
+    source_signatures: Dict[str, str] = {}
+    for key, func, deps in build_steps(source):
+        missing = [dep for dep in deps if values.get(dep) is None]
+        if missing:
+            print(f"⚠️ {key} 건너뜀 (입력 없음: {', '.join(missing)})")
+            continue
+        try:
+            value = func(*[values[dep] for dep in deps])
+        except Exception as e:
+            print(f"⚠️ {key} 생성 실패: {e}")
+            continue
+        if value is None:
+            continue
+        values[key] = value
+        if key in SOURCE_NODES:
+            source_signatures[key] = frame_signature(value)
+            continue
+        artifacts[key] = _write_artifact(tmp_dir, key, value)
+        print(f"  - {key}: {artifacts[key].get('rows', '-')}행, {artifacts[key]['bytes']:,} bytes")
+
+    if not artifacts:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        print("⚠️ 생성된 산출물이 없어 번들을 만들지 않았습니다")
+        return None
+
+    manifest = {
+        'version': version,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'source': source,
+        'pandas_version': pd.__version__,
+        'data_signature': get_data_signature(),
+        'source_signatures': source_signatures,
+        'artifacts': artifacts
+    }
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    # 완성된 번들만 보이도록 폴더 이름 변경 후 LATEST 교체
+    bundle_dir = os.path.join(root, version)
+    os.replace(tmp_dir, bundle_dir)
+    latest_tmp = os.path.join(root, f'.{LATEST_FILE}.tmp')
+    with open(latest_tmp, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(latest_tmp, os.path.join(root, LATEST_FILE))
+
+    _prune_bundles(root, keep)
+    return bundle_dir
+
+
+def _prune_bundles(root: str, keep: int):
+    """오래된 번들 삭제"""
+    versions = sorted(
+        name for name in os.listdir(root)
+        if not name.startswith('.') and os.path.isfile(os.path.join(root, name, MANIFEST_FILE))
+    )
+    for name in versions[:-keep] if keep > 0 else []:
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+# === 번들 읽기 ===
+class ArtifactBundle:
+    """
+    읽기 전용 산출물 번들
+
+    사용 예:
+        bundle = open_latest_bundle()
+        if bundle is not None and bundle.has('review_changes'):
+            review_changes = bundle.load('review_changes')
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, MANIFEST_FILE), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.version = self.manifest['version']
+        self._loaded: Dict[str, Any] = {}
+
+    def has(self, key: str) -> bool:
+        return key in self.manifest['artifacts']
+
+    def is_current(self) -> bool:
+        """번들 빌드 이후 로컬 데이터 파일 내용이 그대로인지 (rerun마다 확인, 바뀐 파일만 다시 해시)"""
+        return self.manifest.get('data_signature') == get_data_signature()
+
+    def matches_source(self, name: str, df: Optional[pd.DataFrame]) -> bool:
+        """대시보드가 읽은 원본(SOURCE_NODES)이 번들 빌드 때와 같은 내용인지"""
+        expected = self.manifest.get('source_signatures', {}).get(name)
+        return expected is not None and expected == frame_signature(df)
+
+    def has_node(self, name: str) -> bool:
+        """파라미터별 산출물(예: logit__an) 포함해서 해당 노드가 번들에 있는지"""
+        return any(key == name or key.startswith(f'{name}__') for key in self.manifest['artifacts'])
+
+    def load(self, key: str) -> Any:
+        """산출물 읽기 (한 번 읽은 값은 재사용, 호출한 쪽에서 수정하면 안 됨)"""
+        if key not in self._loaded:
+            file_path = os.path.join(self.path, self.manifest['artifacts'][key]['file'])
+            if file_path.endswith('.json'):
+                with open(file_path, encoding='utf-8') as f:
+                    self._loaded[key] = json.load(f)
+            else:
+                with open(file_path, 'rb') as f:
+                    self._loaded[key] = pickle.load(f)
+        return self._loaded[key]
+
+
+def latest_bundle_version(root: str = ARTIFACTS_DIR) -> Optional[str]:
+    """LATEST 파일이 가리키는 번들 버전 (새 번들이 빌드되면 값이 바뀜)"""
+    try:
+        with open(os.path.join(root, LATEST_FILE), encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def open_latest_bundle(root: str = ARTIFACTS_DIR) -> Optional[ArtifactBundle]:
+    """
+    최신 번들 열기
+
+    번들이 없거나, 로컬 데이터 파일이 번들 빌드 이후 바뀌었거나,
+    pandas 버전이 달라 pickle 호환이 보장되지 않으면 None (대시보드가 직접 계산)
+    """
+    if not ARTIFACTS_ENABLED:
+        return None
+    latest_path = os.path.join(root, LATEST_FILE)
+    if not os.path.exists(latest_path):
+        return None
+
+    try:
+        with open(latest_path, encoding='utf-8') as f:
+            bundle = ArtifactBundle(os.path.join(root, f.read().strip()))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ 산출물 번들 열기 실패: {e}")
+        return None
+
+    if not bundle.is_current():
+        print(f"⚠️ 산출물 번들({bundle.version}) 이후 데이터 파일이 바뀌어 사용하지 않습니다")
+        return None
+    if bundle.manifest.get('pandas_version', '').split('.')[:2] != pd.__version__.split('.')[:2]:
+        print(f"⚠️ 산출물 번들({bundle.version})의 pandas 버전이 달라 사용하지 않습니다")
+        return None
+    return bundle
+
+
+def add_bundled(
+    graph,
+    bundle: Optional[ArtifactBundle],
+    name: str,
+    func: Callable,
+    deps: Iterable[str] = (),
+    params: Iterable[str] = (),
+    version: Optional[Callable[[], Any]] = None,
+    bundle_params: Optional[Iterable[str]] = None,
+    source: Optional[str] = None
+):
+    """
+    ArtifactGraph 노드 등록 - 번들에 있으면 입력 노드 없이 파일에서 읽는 노드로 등록
+
+    Args:
+        bundle_params: 번들 키를 고르는 파라미터 (기본은 params,
+                       예: 'vif'는 계산에는 파라미터가 없지만 번들에는 target_col별로 저장됨)
+        source: 산출물의 원본 노드 (SOURCE_NODES 중 하나) - 대시보드가 읽은 원본이 번들 빌드 때와
+                같을 때만 번들에서 읽고, 다르면 '<name>@live' 노드로 직접 계산
+    """
+    if bundle is None or not bundle.has_node(name):
+        graph.add(name, func, deps=deps, params=params, version=version)
+        return
+
+    # 번들 버전 + 노드 자체 데이터 버전 (번들이 오래되면 그래프 자체를 직접 계산으로 다시 구성)
+    key_params = tuple(params if bundle_params is None else bundle_params)
+    node_version = lambda: (bundle.version, version() if version is not None else None)
+    if source is None:
+        graph.add(name, lambda **p: bundle.load(bundle_key(name, **p)), params=key_params, version=node_version)
+        return
+
+    live = f'{name}@live'
+    graph.add(live, func, deps=deps, params=params, version=version)
+    graph.add(
+        name,
+        lambda src, **p: (bundle.load(bundle_key(name, **p)) if bundle.matches_source(source, src)
+                          else graph.get(live, **p)),
+        deps=[source],
+        params=key_params,
+        version=node_version
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='대시보드 산출물 번들 빌드')
+    parser.add_argument('--root', default=ARTIFACTS_DIR, help='번들 저장 폴더')
+    parser.add_argument('--source', choices=['local', 'supabase'], default='local',
+                        help='서바이벌/트렌드 데이터 출처')
+    parser.add_argument('--keep', type=int, default=3, help='남겨둘 번들 수')
+    args = parser.parse_args()
+
+    print(f"산출물 번들 빌드 중... ({args.source})")
+    bundle_dir = build_bundle(args.root, args.source, args.keep)
+    if bundle_dir is None:
+        sys.exit(1)
+    print(f"✅ 번들 저장: {bundle_dir}")
+
+
+if __name__ == '__main__':
+    main()
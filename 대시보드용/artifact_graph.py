@@ -0,0 +1,139 @@
+"""
+흑백요리사2 대시보드 - 산출물(artifact) 의존성 그래프 모듈
+
+원본 데이터 → 정제 데이터 → 집계 → 모델 적합 → 그래프 순서로 이어지는
+이름 붙은 산출물을 등록해 두고, 각 메뉴는 필요한 산출물만 꺼내 씁니다.
+각 노드는 (이름, 파라미터, 입력 노드 지문, 데이터 버전)으로 만든 지문으로 메모이즈되어
+입력이 바뀐 노드만 다시 계산됩니다.
+메모 조회는 잠금 없이 하고, 계산은 (이름, 파라미터, 지문)별 잠금으로 같은 산출물만 한 번씩 계산합니다.
+"""
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import sys
+import os
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from profiling import count_rows, profile_section, record_cache_event
+
+
+class ArtifactGraph:
+    """
+    메모이즈되는 산출물 의존성 그래프
+
+    사용 예:
+        graph = ArtifactGraph()
+        graph.add('reviews', load_reviews, version=get_data_version)
+        graph.add('review_changes', calculate_review_changes, deps=['reviews'])
+        graph.add('logit', run_logistic_regression, deps=['survival'], params=['target_col'])
+        changes = graph.get('review_changes')
+        model, X, y = graph.get('logit', target_col='an')
+
+    반환값은 여러 번의 rerun(과 세션)이 공유하므로 호출한 쪽에서 수정하면 안 됩니다.
+    """
+
+    def __init__(self):
+        # 이름 -> (계산 함수, 입력 노드 이름들, 파라미터 이름들, 버전 함수)
+        self._nodes: Dict[str, Tuple[Callable, Tuple[str, ...], Tuple[str, ...], Optional[Callable]]] = {}
+        # (이름, 파라미터) -> (지문, 값)
+        self._memo: Dict[Tuple[str, Tuple], Tuple[str, Any]] = {}
+        # (이름, 파라미터, 지문) -> 계산 중 잠금 (다른 산출물은 동시에 계산 가능)
+        self._compute_locks: Dict[Tuple[str, Tuple, str], threading.Lock] = {}
+        # _compute_locks 딕셔너리 보호용 (계산 중에는 잡지 않음)
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        name: str,
+        func: Callable,
+        deps: Iterable[str] = (),
+        params: Iterable[str] = (),
+        version: Optional[Callable[[], Any]] = None
+    ):
+        """
+        산출물 노드 등록
+
+        Args:
+            name: 산출물 이름
+            func: 계산 함수, func(*입력 노드 값, **파라미터)
+            deps: 입력 노드 이름 목록 (순서대로 func에 전달)
+            params: 받는 파라미터 이름 목록 (get()에 넘긴 파라미터 중 이 이름만 전달,
+                    입력 노드에도 해당 노드가 받는 파라미터만 전달)
+            version: 원본 데이터 버전 함수 (파일 수정 시각 등, 값이 바뀌면 다시 계산)
+        """
+        for dep in deps:
+            if dep not in self._nodes:
+                raise KeyError(f"'{name}'의 입력 노드 '{dep}'가 등록되지 않았습니다")
+        self._nodes[name] = (func, tuple(deps), tuple(params), version)
+
+    def _node_params(self, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """노드가 받는 파라미터만 추리기"""
+        accepted = self._nodes[name][2]
+        return {k: v for k, v in params.items() if k in accepted}
+
+    def _scope_params(self, name: str, params: Dict[str, Any]) -> Tuple:
+        """노드와 입력 노드들이 받는 파라미터 (메모 키, 예: 'vif'는 'logit'의 target_col별로 따로 저장)"""
+        accepted = set()
+        stack = [name]
+        while stack:
+            node = stack.pop()
+            accepted.update(self._nodes[node][2])
+            stack.extend(self._nodes[node][1])
+        return tuple(sorted((k, v) for k, v in params.items() if k in accepted))
+
+    def fingerprint(self, name: str, **params) -> str:
+        """노드 지문 계산 (입력 노드 지문 + 파라미터 + 데이터 버전)"""
+        func, deps, _, version = self._nodes[name]
+        own_params = self._node_params(name, params)
+        parts = [name, repr(sorted(own_params.items()))]
+        parts += [self.fingerprint(dep, **params) for dep in deps]
+        if version is not None:
+            parts.append(repr(version()))
+        return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def _lookup(self, key: Tuple[str, Tuple], fp: str) -> Optional[Tuple[str, Any]]:
+        """지문이 같은 메모 (없으면 None)"""
+        cached = self._memo.get(key)
+        return cached if cached is not None and cached[0] == fp else None
+
+    def get(self, name: str, **params) -> Any:
+        """산출물 조회 (지문이 같으면 메모된 값, 바뀌었으면 입력부터 다시 계산)"""
+        with profile_section(f"artifact: {name}") as record:
+            func, deps, _, _ = self._nodes[name]
+            own_params = self._node_params(name, params)
+            key = (name, self._scope_params(name, params))
+            fp = self.fingerprint(name, **params)
+
+            cached = self._lookup(key, fp)
+            if cached is None:
+                lock_key = key + (fp,)
+                with self._lock:
+                    compute_lock = self._compute_locks.setdefault(lock_key, threading.Lock())
+                try:
+                    with compute_lock:
+                        # 기다리는 동안 다른 스레드가 계산했으면 그 값 사용
+                        cached = self._lookup(key, fp)
+                        if cached is None:
+                            record_cache_event(False)
+                            inputs = [self.get(dep, **params) for dep in deps]
+                            value = func(*inputs, **own_params)
+                            self._memo[key] = (fp, value)
+                finally:
+                    with self._lock:
+                        if self._compute_locks.get(lock_key) is compute_lock:
+                            del self._compute_locks[lock_key]
+            if cached is not None:
+                record_cache_event(True)
+                value = cached[1]
+
+            record['rows'] = count_rows(value)
+            return value
+
+    def invalidate(self, name: Optional[str] = None):
+        """메모 삭제 (name이 없으면 전체)"""
+        if name is None:
+            self._memo.clear()
+        else:
+            for key in [k for k in list(self._memo) if k[0] == name]:
+                self._memo.pop(key, None)
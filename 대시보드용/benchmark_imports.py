@@ -0,0 +1,103 @@
+"""
+흑백요리사2 대시보드 - import 시간 벤치마크
+
+`python -X importtime`으로 메뉴별로 필요한 모듈을 새 프로세스에서 import해
+총 import 시간과 가장 오래 걸린 모듈을 요약합니다.
+홈 화면(대시보드 모듈 import)은 예산(기본 1초)을 넘거나 무거운 라이브러리를 import하면 실패로 표시합니다.
+
+사용법:
+    python 대시보드용/benchmark_imports.py
+    python 대시보드용/benchmark_imports.py --repeat 5 --top 15 --budget-ms 800
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 메뉴 -> 처음 열 때 import되는 모듈
+MENU_MODULES = {
+    '🏠 홈': ['integrated_dashboard'],
+    '📊 방송효과분석': ['review_heatmap', 'population_animated_map', 'dong_vector_tiles'],
+    '📈 트렌드 / 📊 생존율': ['chart_render_cache', 'seaborn'],
+    '🏁 심사위원 합격 예측': ['judge_regression', 'chart_render_cache', 'seaborn'],
+}
+# 홈 화면에서 import되면 안 되는 무거운 라이브러리
+HEAVY_MODULES = ['seaborn', 'statsmodels', 'scipy', 'matplotlib', 'plotly']
+
+
+def run_importtime(modules: List[str]) -> Tuple[float, List[Tuple[str, float]], List[str]]:
+    """
+    새 프로세스에서 모듈 import 후 -X importtime 출력 파싱
+
+    Returns:
+        (총 import 시간 ms, [(최상위 모듈, 누적 ms)], import된 모듈 이름 목록)
+    """
+    code = 'import ' + ', '.join(modules)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=SCRIPT_DIR, capture_output=True, text=True, encoding='utf-8', errors='replace'
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else code)
+
+    total_us = 0
+    top_level: List[Tuple[str, float]] = []
+    imported: List[str] = []
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        imported.append(name.strip())
+        if not name[1:].startswith(' '):  # 들여쓰기 없음 = 최상위 import
+            top_level.append((name.strip(), int(cumulative_us) / 1000))
+    return total_us / 1000, top_level, imported
+
+
+def profile_menu(modules: List[str], repeat: int) -> Dict:
+    """repeat번 실행해 가장 빠른 결과 사용 (디스크 캐시 영향 줄이기)"""
+    runs = [run_importtime(modules) for _ in range(repeat)]
+    total_ms, top_level, imported = min(runs, key=lambda run: run[0])
+    heavy = sorted({name.split('.')[0] for name in imported} & set(HEAVY_MODULES))
+    return {'total_ms': total_ms, 'top_level': top_level, 'heavy': heavy}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='대시보드 메뉴별 import 시간 측정')
+    parser.add_argument('--repeat', type=int, default=3, help='메뉴별 반복 횟수 (최솟값 사용)')
+    parser.add_argument('--top', type=int, default=10, help='표시할 최상위 모듈 수')
+    parser.add_argument('--budget-ms', type=float, default=1000, help='홈 화면 import 시간 예산')
+    args = parser.parse_args()
+
+    failed = False
+    for menu, modules in MENU_MODULES.items():
+        print(f"\n=== {menu} ({', '.join(modules)}) ===")
+        try:
+            report = profile_menu(modules, args.repeat)
+        except RuntimeError as e:
+            print(f"⚠️ import 실패: {e}")
+            failed = True
+            continue
+
+        print(f"총 import 시간: {report['total_ms']:,.0f} ms")
+        print(f"무거운 라이브러리: {', '.join(report['heavy']) or '없음'}")
+        for name, cumulative_ms in sorted(report['top_level'], key=lambda item: -item[1])[:args.top]:
+            print(f"  {cumulative_ms:8,.1f} ms  {name}")
+
+        if menu == '🏠 홈':
+            if report['total_ms'] > args.budget_ms:
+                print(f"❌ 홈 화면 import가 예산({args.budget_ms:,.0f} ms)을 넘었습니다")
+                failed = True
+            if report['heavy']:
+                print(f"❌ 홈 화면에서 무거운 라이브러리를 import합니다: {', '.join(report['heavy'])}")
+                failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
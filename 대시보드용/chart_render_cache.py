@@ -0,0 +1,76 @@
+"""
+흑백요리사2 대시보드 - matplotlib/seaborn 차트 렌더링 캐시 모듈
+
+matplotlib 차트는 그릴 때마다 수백 ms ~ 수 초가 걸리므로,
+렌더링한 PNG/SVG 바이트를 (데이터 지문, 차트 종류, 필터 선택) 키로 LRU 캐시에 보관하고
+st.image로 바로 표시합니다.
+"""
+import hashlib
+import io
+from typing import Callable, Union
+import sys
+import os
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from figure_cache import LRUCache, data_fingerprint
+from profiling import count_rows, profile_section, record_cache_event
+
+# 메모리에 보관할 렌더링 결과 수
+RENDER_CACHE_SIZE = 64
+# PNG 해상도
+RENDER_DPI = 100
+
+# 캐시 키 -> 이미지 바이트 (최근 사용 순, 세션 스레드 간 잠금은 LRUCache가 처리)
+_render_cache: LRUCache[bytes] = LRUCache(RENDER_CACHE_SIZE)
+
+
+def render_figure(fig, fmt: str = 'png', dpi: int = RENDER_DPI) -> bytes:
+    """matplotlib Figure를 이미지 바이트로 변환 후 닫기"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def render_key(chart_type: str, data, fmt: str = 'png', **selection) -> str:
+    """(데이터 지문, 차트 종류, 필터 선택)으로 캐시 키 생성"""
+    frames = data if isinstance(data, (list, tuple)) else [data]
+    parts = [chart_type, fmt] + [data_fingerprint(df) for df in frames]
+    parts += [f"{name}={value!r}" for name, value in sorted(selection.items())]
+    return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def cached_render(
+    chart_type: str,
+    data: Union[pd.DataFrame, list, tuple, None],
+    draw: Callable[[], object],
+    fmt: str = 'png',
+    **selection
+) -> bytes:
+    """
+    차트를 그려서 이미지 바이트로 반환 (같은 데이터/선택이면 캐시된 이미지)
+
+    Args:
+        chart_type: 차트 종류 이름 (캐시 키)
+        data: 차트에 쓰이는 DataFrame (여러 개면 리스트)
+        draw: matplotlib Figure (또는 seaborn FacetGrid)를 반환하는 함수
+        fmt: 'png' 또는 'svg'
+        **selection: 필터 선택값 (캐시 키)
+    """
+    with profile_section(f"chart: {chart_type}", rows=count_rows(data)):
+        key = render_key(chart_type, data, fmt, **selection)
+        image = _render_cache.get(key)
+        record_cache_event(image is not None)
+        if image is not None:
+            return image
+
+        fig = draw()
+        fig = getattr(fig, 'figure', fig)  # seaborn FacetGrid -> Figure
+        image = render_figure(fig, fmt)
+
+        _render_cache.put(key, image)
+        return image
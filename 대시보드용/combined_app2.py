@@ -9,8 +9,20 @@ from matplotlib import font_manager, rc
 import os
 import glob
 import platform
+import sys
 from statsmodels.stats.outliers_influence import variance_inflation_factor
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from profiling import (
+    profiled,
+    profile_section,
+    mark_cache_miss,
+    profiling_default,
+    start_profiling,
+    render_profiling_panel
+)
+from trend_store import list_trend_chefs, load_trend_store, trend_source_fingerprint
+
 # --- 1. Page Config (Must be first) ---
 st.set_page_config(
     page_title="흑백요리사 통합 분석 대시보드 (Ver.2)",
@@ -64,7 +76,9 @@ def show_survival_analysis():
     """)
 
     # --- Data Loading ---
+    @profiled('서바이벌 데이터 로드', cached=True)
     @st.cache_data
+    @mark_cache_miss
     def load_survival_data():
         # Changed to new file
         file_path = '../셰프서바이벌결과요약.csv'
@@ -81,6 +95,7 @@ def show_survival_analysis():
         return
 
     # --- Helper Functions ---
+    @profiled('합격률 차트')
     def plot_pass_rate(df, judge_col, judge_name):
         features = ['how_cook', 'food_category', 'ingrediant', 'temperature']
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
@@ -96,6 +111,7 @@ def show_survival_analysis():
         plt.tight_layout()
         return fig
 
+    @profiled('로지스틱 회귀')
     def run_logistic_regression(df, target_col):
         if target_col == 'an':
             sub_df = df[df['is_an'] == 1].copy()
@@ -112,6 +128,7 @@ def show_survival_analysis():
         except:
             return None, None, None
 
+    @profiled('VIF 계산')
     def calculate_vif(X):
         vif_data = pd.DataFrame()
         vif_data["Feature"] = X.columns
@@ -230,20 +247,6 @@ def show_survival_analysis():
         st.table(pd.DataFrame(comparison_data).set_index("항목"))
 
 
-# --- 쉐프 이름 매핑 (프리픽스 -> 한글 이름) ---
-CHEF_MAPPING = {
-    'akrl': '아기맹수',
-    'choi': '최강록',
-    'hoo': '후덕죽',
-    'im': '임성근',
-    'jeong': '정호영',
-    'sam': '샘킴',
-    'seon': '선재스님',
-    'son': '손종원',
-    'yo': '요리괴물',
-    'yoon': '윤준모'
-}
-
 # --- 4. Page 2 Logic: Trend Analysis Report (3 Sources: Naver, Google, YouTube) ---
 def show_trend_analysis():
     st.header("📈 쉐프 검색 트렌드 분석 (Naver vs Google vs YouTube)")
@@ -252,71 +255,24 @@ def show_trend_analysis():
     """)
     
     # --- Data Loading ---
-    @st.cache_data
-    def load_trend_data():
-        base_path = r"c:\Users\USER\Documents\웅진씽크빅kdt\흑백요리사\흑백요리사트렌드추이"
-        if not os.path.exists(base_path):
-            st.error(f"데이터 경로를 찾을 수 없습니다: {base_path}")
-            return pd.DataFrame()
-
-        all_data = []
-
-        for prefix, chef_name in CHEF_MAPPING.items():
-            # 네이버 데이터랩
-            f_naver = os.path.join(base_path, f"{prefix}_datalab.csv")
-            if os.path.exists(f_naver):
-                try:
-                    try: df_naver = pd.read_csv(f_naver, encoding='utf-8')
-                    except: df_naver = pd.read_csv(f_naver, encoding='cp949')
-                    if df_naver.shape[1] >= 2:
-                        df_naver = df_naver.rename(columns={df_naver.columns[0]: 'Date', df_naver.columns[1]: 'Value'})
-                        df_naver['Source'] = 'Naver'
-                        df_naver['Chef'] = chef_name
-                        df_naver = df_naver.dropna(subset=['Value'])
-                        df_naver['Value'] = pd.to_numeric(df_naver['Value'], errors='coerce')
-                        all_data.append(df_naver)
-                except Exception as e:
-                    print(f"Naver Error ({prefix}): {e}")
-            
-            # 구글 트렌드
-            f_google = os.path.join(base_path, f"{prefix}_google.csv")
-            if os.path.exists(f_google):
-                try:
-                    try: df_google = pd.read_csv(f_google, encoding='utf-8')
-                    except: df_google = pd.read_csv(f_google, encoding='cp949')
-                    if df_google.shape[1] >= 2:
-                        df_google = df_google.rename(columns={df_google.columns[0]: 'Date', df_google.columns[1]: 'Value'})
-                        df_google['Source'] = 'Google'
-                        df_google['Chef'] = chef_name
-                        df_google = df_google.dropna(subset=['Value'])
-                        df_google['Value'] = pd.to_numeric(df_google['Value'], errors='coerce')
-                        all_data.append(df_google)
-                except Exception as e:
-                    print(f"Google Error ({prefix}): {e}")
-            
-            # 유튜브 (변환된 파일)
-            f_youtube = os.path.join(base_path, f"{prefix}_youtube.csv")
-            if os.path.exists(f_youtube):
-                try:
-                    df_youtube = pd.read_csv(f_youtube, encoding='utf-8-sig')
-                    if df_youtube.shape[1] >= 2:
-                        df_youtube = df_youtube.rename(columns={df_youtube.columns[0]: 'Date', df_youtube.columns[1]: 'Value'})
-                        df_youtube['Source'] = 'YouTube'
-                        df_youtube['Chef'] = chef_name
-                        df_youtube = df_youtube.dropna(subset=['Value'])
-                        df_youtube['Value'] = pd.to_numeric(df_youtube['Value'], errors='coerce')
-                        all_data.append(df_youtube)
-                except Exception as e:
-                    print(f"YouTube Error ({prefix}): {e}")
-
-        if not all_data: return pd.DataFrame()
-        final_df = pd.concat(all_data, ignore_index=True)
-        final_df['Date'] = pd.to_datetime(final_df['Date'])
-        return final_df
-
-    df = load_trend_data()
-
-    if df.empty:
+    # source_version: 원본 트렌드 파일 (파일명, 크기, 수정 시각) - 파일이 추가/수정되면 캐시 키가 바뀌어 다시 반영
+    @profiled('트렌드 셰프 목록 로드', cached=True)
+    @st.cache_data(max_entries=4)
+    @mark_cache_miss
+    def load_trend_chefs(source_version):
+        return list_trend_chefs()
+
+    @profiled('트렌드 데이터 로드', cached=True)
+    @st.cache_data(max_entries=32)
+    @mark_cache_miss
+    def load_trend_data(chefs, sources, source_version):
+        # 트렌드 저장소(Parquet)에서 선택한 셰프/소스만 읽음
+        return load_trend_store(chefs, sources)
+
+    source_version = tuple(trend_source_fingerprint())
+    all_chefs = load_trend_chefs(source_version)
+
+    if not all_chefs:
         st.warning("데이터가 없거나 불러오지 못했습니다.")
         return
 
@@ -325,19 +281,14 @@ def show_trend_analysis():
     col1, col2 = st.columns(2)
     
     with col1:
-        all_chefs = sorted(df['Chef'].unique())
         selected_chefs = st.multiselect("쉐프 선택 (전체 보기는 비워두세요)", options=all_chefs, default=[])
     
     with col2:
         all_sources = ['Naver', 'Google', 'YouTube']
         selected_sources = st.multiselect("데이터 소스 선택", options=all_sources, default=all_sources)
     
-    # Filter data
-    plot_df = df.copy()
-    if selected_chefs:
-        plot_df = plot_df[plot_df['Chef'].isin(selected_chefs)]
-    if selected_sources:
-        plot_df = plot_df[plot_df['Source'].isin(selected_sources)]
+    # Filter data (저장소에서 선택한 셰프/소스만 읽음)
+    plot_df = load_trend_data(tuple(selected_chefs), tuple(selected_sources), source_version)
         
     # --- Visualization ---
     if not plot_df.empty:
@@ -347,17 +298,18 @@ def show_trend_analysis():
         color_palette = {'Google': 'blue', 'Naver': 'green', 'YouTube': 'red'}
         
         col_wrap = 4
-        g = sns.relplot(
-            data=plot_df, x="Date", y="Value", hue="Source", col="Chef",
-            kind="line", palette=color_palette,
-            col_wrap=col_wrap, height=4, aspect=1.5,
-            facet_kws={'sharey': False, 'sharex': True}
-        )
-        g.fig.subplots_adjust(top=0.9)
-        g.fig.suptitle("흑백요리사 쉐프별 트렌드 추이\n(Naver: 초록, Google: 파랑, YouTube: 빨강)", fontsize=14, fontweight='bold')
-        for axes in g.axes.flat:
-            _ = axes.tick_params(axis='x', rotation=45)
-        st.pyplot(g.fig)
+        with profile_section('트렌드 차트', rows=len(plot_df)):
+            g = sns.relplot(
+                data=plot_df, x="Date", y="Value", hue="Source", col="Chef",
+                kind="line", palette=color_palette,
+                col_wrap=col_wrap, height=4, aspect=1.5,
+                facet_kws={'sharey': False, 'sharex': True}
+            )
+            g.fig.subplots_adjust(top=0.9)
+            g.fig.suptitle("흑백요리사 쉐프별 트렌드 추이\n(Naver: 초록, Google: 파랑, YouTube: 빨강)", fontsize=14, fontweight='bold')
+            for axes in g.axes.flat:
+                _ = axes.tick_params(axis='x', rotation=45)
+            st.pyplot(g.fig)
         
         # 소스별 색상 범례 설명
         st.markdown("""
@@ -387,7 +339,9 @@ def show_genre_survival_report():
     """)
     
     # --- Data Loading ---
+    @profiled('장르별 생존 데이터 로드', cached=True)
     @st.cache_data
+    @mark_cache_miss
     def load_genre_survival_data():
         file_path = '../3번문제완성본.csv'
         if not os.path.exists(file_path):
@@ -598,6 +552,7 @@ def main():
     
     st.sidebar.markdown("---")
     st.sidebar.info("흑백요리사 데이터 분석 대시보드입니다.")
+    start_profiling('combined_app2', st.sidebar.checkbox("⏱️ 프로파일링", value=profiling_default()))
 
     # Routing
     if menu == "1. 쉐프 검색 트렌드":
@@ -609,4 +564,5 @@ def main():
 
 if __name__ == "__main__":
     main()
+    render_profiling_panel()
 
@@ -307,6 +307,12 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import os
 import glob
+import hashlib
+import sys
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from shared_cache import shared_cached
 
 # 방영일 정의 (2025-2026 시즌2)
 BROADCAST_DATES = [
@@ -367,6 +373,7 @@ POPULATION_PATH = get_data_path('seoul_floating_pop_raw3.csv')
 RESTAURANT_PATH = get_data_path('캐치테이블_가게정보.csv')
 
 
+@shared_cached('reviews', version=lambda: get_data_version())
 def load_reviews() -> pd.DataFrame:
     """리뷰 데이터 로드 및 전처리 (모든 reviews_collected_*.csv 병합)"""
     # 모든 리뷰 파일 찾기
@@ -418,6 +425,7 @@ def load_reviews() -> pd.DataFrame:
     return df
 
 
+@shared_cached('population', version=lambda: get_data_version())
 def load_population() -> pd.DataFrame:
     """유동인구 데이터 로드 및 전처리"""
     df = pd.read_csv(POPULATION_PATH, encoding='utf-8-sig')
@@ -429,6 +437,7 @@ def load_population() -> pd.DataFrame:
     return df
 
 
+@shared_cached('restaurants', version=lambda: get_data_version())
 def load_restaurants(update_review_count: bool = True) -> pd.DataFrame:
     """가게 정보 로드 및 전처리"""
     df = pd.read_csv(RESTAURANT_PATH, encoding='utf-8-sig')
@@ -572,6 +581,88 @@ def get_daily_population_by_district(df_pop: pd.DataFrame) -> pd.DataFrame:
     return daily_pop
 
 
+
+def get_data_files() -> List[str]:
+    """대시보드가 읽는 로컬 데이터 파일 목록 (존재하는 파일만)"""
+    search_paths = [
+        os.path.join(DATA_DIR, 'reviews_collected_*.csv'),
+        os.path.join(PARENT_DIR, '데이터수집code', 'reviews_collected_*.csv'),
+        os.path.join(SCRIPT_DIR, 'reviews_collected_*.csv'),
+    ]
+    files = []
+    for pattern in search_paths:
+        files.extend(glob.glob(pattern))
+    files += [POPULATION_PATH, RESTAURANT_PATH, get_data_path('review_count_history.csv')]
+    return [path for path in sorted(set(files)) if os.path.exists(path)]
+
+
+def get_data_version() -> tuple:
+    """로컬 데이터 파일 버전 (경로, 수정 시각, 크기) - 파일이 바뀌면 값이 달라짐"""
+    version = []
+    for path in get_data_files():
+        stat = os.stat(path)
+        version.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+# (경로, 크기, 수정 시각) -> 파일 내용 sha1 (파일이 그대로면 rerun마다 다시 읽지 않음)
+_FILE_SHA1: Dict[Tuple[str, int, int], str] = {}
+
+
+def _file_sha1(path: str) -> str:
+    """파일 내용 sha1 (크기/수정 시각이 같으면 이전 값 재사용)"""
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in _FILE_SHA1:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        _FILE_SHA1[key] = digest.hexdigest()
+    return _FILE_SHA1[key]
+
+
+def get_data_signature() -> List[List]:
+    """
+    로컬 데이터 파일 서명 (파일명, 크기, 내용 sha1) - 산출물 번들 최신 여부 확인용
+
+    get_data_version()과 달리 경로와 수정 시각을 쓰지 않아, git clone/checkout으로
+    수정 시각만 바뀐 배포 환경에서도 내용이 같으면 값이 같습니다.
+    """
+    signature = []
+    for path in get_data_files():
+        signature.append([os.path.basename(path), os.path.getsize(path), _file_sha1(path)])
+    return sorted(signature)
+
+
+def normalize_trend_data(df: pd.DataFrame) -> pd.DataFrame:
+    """트렌드 long-format 데이터 (출연자/날짜/값/소스) -> 대시보드 컬럼 (Chef/Date/Value/Source)"""
+    if df.empty:
+        return pd.DataFrame()
+
+    # 한글 -> 영문 컬럼 매핑
+    column_mapping = {
+        '출연자': 'Chef',
+        '날짜': 'Date',
+        '값': 'Value',
+        '소스': 'Source'
+    }
+
+    # 필요한 컬럼 확인
+    if not all(col in df.columns for col in column_mapping.keys()):
+        return df
+
+    final_df = df.rename(columns=column_mapping)
+
+    # 데이터 타입 변환
+    final_df['Date'] = pd.to_datetime(final_df['Date'])
+    final_df['Value'] = pd.to_numeric(final_df['Value'], errors='coerce')
+
+    # 이름 통합 (술 빚는 윤주모 -> 윤주모)
+    final_df['Chef'] = final_df['Chef'].replace('술 빚는 윤주모', '윤주모')
+
+    return final_df
+
 if __name__ == '__main__':
     # 테스트
     print("리뷰 데이터 로드 중...")
@@ -0,0 +1,352 @@
+"""
+흑백요리사2 대시보드 - 행정동 벡터 타일 모듈
+
+행정동 경계를 Mapbox Vector Tile(MVT)로 한 번만 구워 static 디렉토리에 저장하고,
+대시보드는 타일과 일별 유동인구 값 배열만 받아 브라우저에서 색을 입힙니다.
+(GeoJSON + 날짜별 값을 Plotly 프레임마다 반복 전송하지 않음)
+
+타일 생성 (최초 1회):
+    python dong_vector_tiles.py --geojson seoul_dong.geojson
+
+필요 패키지 (타일 생성 시에만): shapely, mapbox-vector-tile
+"""
+import argparse
+import json
+import math
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Streamlit static 서빙 경로 (.streamlit/config.toml 의 enableStaticServing 필요)
+TILES_DIR = os.path.join(SCRIPT_DIR, 'static', 'tiles', 'dong')
+TILES_URL = '/app/static/tiles/dong/{z}/{x}/{y}.pbf'
+METADATA_FILE = 'metadata.json'
+LAYER_NAME = 'dong'
+
+MVT_EXTENT = 4096
+# 타일 경계에서 폴리곤이 끊겨 보이지 않도록 주는 여유 (타일 크기 대비 비율)
+TILE_BUFFER = 64 / MVT_EXTENT
+# 웹 메르카토르 전체 폭의 절반 (미터)
+MERCATOR_HALF = 20037508.342789244
+
+
+def lonlat_to_mercator(lon: float, lat: float) -> tuple:
+    """위경도 -> 웹 메르카토르(EPSG:3857) 미터 좌표"""
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    x = lon * MERCATOR_HALF / 180.0
+    y = math.log(math.tan(math.pi / 4 + math.radians(lat) / 2)) * MERCATOR_HALF / math.pi
+    return x, y
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple:
+    """타일 (z, x, y)의 메르카토르 경계 (minx, miny, maxx, maxy)"""
+    size = 2 * MERCATOR_HALF / (2 ** z)
+    minx = -MERCATOR_HALF + x * size
+    maxy = MERCATOR_HALF - y * size
+    return minx, maxy - size, minx + size, maxy
+
+
+def tile_range(bounds: tuple, z: int) -> tuple:
+    """메르카토르 경계를 덮는 타일 인덱스 범위 (x0, y0, x1, y1)"""
+    size = 2 * MERCATOR_HALF / (2 ** z)
+    minx, miny, maxx, maxy = bounds
+    x0 = int((minx + MERCATOR_HALF) // size)
+    x1 = int((maxx + MERCATOR_HALF) // size)
+    y0 = int((MERCATOR_HALF - maxy) // size)
+    y1 = int((MERCATOR_HALF - miny) // size)
+    return x0, y0, x1, y1
+
+
+def dong_key(name: str) -> str:
+    """행정동 이름을 '자치구 행정동' 형태의 조인 키로 정규화
+
+    '서울특별시 강남구 신사동' -> '강남구 신사동'
+    (신사동처럼 같은 이름의 동이 여러 구에 있으므로 구 이름까지 포함)
+    """
+    parts = str(name).split()
+    return ' '.join(parts[-2:])
+
+
+def build_dong_tiles(
+    geojson: dict,
+    out_dir: str = TILES_DIR,
+    min_zoom: int = 9,
+    max_zoom: int = 14,
+    name_property: str = 'adm_nm'
+) -> dict:
+    """
+    행정동 GeoJSON을 MVT 타일 디렉토리({z}/{x}/{y}.pbf)로 변환
+
+    Args:
+        geojson: 행정동 경계 GeoJSON (FeatureCollection)
+        out_dir: 타일 저장 디렉토리
+        min_zoom, max_zoom: 생성할 줌 레벨 범위
+        name_property: 행정동 이름이 담긴 feature 속성명
+
+    Returns:
+        메타데이터 딕셔너리 (metadata.json 으로도 저장)
+    """
+    try:
+        import mapbox_vector_tile
+        from shapely.geometry import box, shape
+        from shapely.ops import transform
+        from shapely.strtree import STRtree
+    except ImportError as e:
+        raise ImportError("타일 생성에는 shapely, mapbox-vector-tile 패키지가 필요합니다.") from e
+
+    def project(x, y, z=None):
+        xs, ys = zip(*(lonlat_to_mercator(lon, lat) for lon, lat in zip(x, y)))
+        return xs, ys
+
+    # feature 순서 = 클라이언트 값 배열 순서 (feature id로 사용)
+    geometries = []
+    keys = []
+    for feature in geojson['features']:
+        geom = transform(project, shape(feature['geometry']))
+        if not geom.is_valid:
+            geom = geom.buffer(0)
+        geometries.append(geom)
+        keys.append(dong_key(feature['properties'].get(name_property, '')))
+
+    tree = STRtree(geometries)
+    minx = min(g.bounds[0] for g in geometries)
+    miny = min(g.bounds[1] for g in geometries)
+    maxx = max(g.bounds[2] for g in geometries)
+    maxy = max(g.bounds[3] for g in geometries)
+
+    tile_count = 0
+    for z in range(min_zoom, max_zoom + 1):
+        x0, y0, x1, y1 = tile_range((minx, miny, maxx, maxy), z)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                bounds = tile_bounds(z, x, y)
+                pad = (bounds[2] - bounds[0]) * TILE_BUFFER
+                clip_box = box(bounds[0] - pad, bounds[1] - pad, bounds[2] + pad, bounds[3] + pad)
+
+                features = []
+                for idx in tree.query(clip_box):
+                    clipped = geometries[idx].intersection(clip_box)
+                    if clipped.is_empty:
+                        continue
+                    features.append({
+                        'geometry': clipped.wkt,
+                        'properties': {'key': keys[idx]},
+                        'id': int(idx)
+                    })
+
+                if not features:
+                    continue
+
+                tile = mapbox_vector_tile.encode(
+                    [{'name': LAYER_NAME, 'features': features}],
+                    default_options={'quantize_bounds': bounds, 'extents': MVT_EXTENT}
+                )
+                tile_dir = os.path.join(out_dir, str(z), str(x))
+                os.makedirs(tile_dir, exist_ok=True)
+                with open(os.path.join(tile_dir, f'{y}.pbf'), 'wb') as f:
+                    f.write(tile)
+                tile_count += 1
+
+        print(f"[타일 생성] z={z} 완료 (누적 {tile_count}개)")
+
+    sw = _mercator_to_lonlat(minx, miny)
+    ne = _mercator_to_lonlat(maxx, maxy)
+    metadata = {
+        'layer': LAYER_NAME,
+        'min_zoom': min_zoom,
+        'max_zoom': max_zoom,
+        'bounds': [sw[0], sw[1], ne[0], ne[1]],
+        'dongs': keys
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, METADATA_FILE), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False)
+
+    return metadata
+
+
+def _mercator_to_lonlat(x: float, y: float) -> tuple:
+    lon = x * 180.0 / MERCATOR_HALF
+    lat = math.degrees(2 * math.atan(math.exp(y * math.pi / MERCATOR_HALF)) - math.pi / 2)
+    return lon, lat
+
+
+def load_tile_metadata(out_dir: str = TILES_DIR) -> Optional[dict]:
+    """타일 메타데이터 로드 (타일이 아직 없으면 None)"""
+    path = os.path.join(out_dir, METADATA_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_daily_value_array(df_pop: pd.DataFrame, dongs: List[str]) -> Dict:
+    """
+    일별 행정동 유동인구를 타일 feature 순서에 맞춘 compact 배열로 변환
+
+    Args:
+        df_pop: load_population() 결과 (AUTONOMOUS_DISTRICT, ADMINISTRATIVE_DISTRICT 포함)
+        dongs: 타일 메타데이터의 행정동 키 목록 (feature id 순서)
+
+    Returns:
+        {'dates': [...], 'values': [[날짜별 행정동 값, ...], ...], 'min': 최소, 'max': 최대}
+    """
+    df = df_pop.copy()
+    df['key'] = df['AUTONOMOUS_DISTRICT'].astype(str) + ' ' + df['ADMINISTRATIVE_DISTRICT'].astype(str)
+    df['date'] = pd.to_datetime(df['SENSING_TIME']).dt.strftime('%Y-%m-%d')
+
+    cube = df.pivot_table(index='date', columns='key', values='VISITOR_COUNT', aggfunc='sum')
+    cube = cube.reindex(columns=dongs).sort_index()
+
+    # NaN(데이터 없는 동)은 null로 보내 투명하게 표시
+    values = cube.round().astype('Int64').astype(object).where(cube.notna(), None).values.tolist()
+
+    return {
+        'dates': cube.index.tolist(),
+        'values': values,
+        'min': float(cube.min().min()) if cube.notna().any().any() else 0.0,
+        'max': float(cube.max().max()) if cube.notna().any().any() else 0.0
+    }
+
+
+def render_dong_tile_map(
+    value_payload: Dict,
+    metadata: Dict,
+    tile_url: str = TILES_URL,
+    height: int = 700
+) -> str:
+    """
+    벡터 타일 + 일별 값 배열을 사용하는 MapLibre 지도 HTML 생성
+    (st.components.v1.html 로 표시)
+    """
+    config = {
+        'tileUrl': tile_url,
+        'layer': metadata['layer'],
+        'minZoom': metadata['min_zoom'],
+        'maxZoom': metadata['max_zoom'],
+        'dongs': metadata['dongs'],
+        'dates': value_payload['dates'],
+        'values': value_payload['values'],
+        'vmin': value_payload['min'],
+        'vmax': value_payload['max'],
+    }
+
+    return f"""
+<link href="https://unpkg.com/maplibre-gl@4.7.1/dist/maplibre-gl.css" rel="stylesheet" />
+<script src="https://unpkg.com/maplibre-gl@4.7.1/dist/maplibre-gl.js"></script>
+<div style="font-family: sans-serif; font-size: 14px; margin-bottom: 6px;">
+  <input id="day" type="range" min="0" max="{max(len(value_payload['dates']) - 1, 0)}" value="0" style="width: 60%;" />
+  <span id="day-label"></span>
+</div>
+<div id="map" style="width: 100%; height: {height - 40}px;"></div>
+<script>
+const CFG = {json.dumps(config, ensure_ascii=False)};
+// srcdoc iframe에서도 대시보드 서버 기준으로 타일 경로 해석
+const tileUrl = CFG.tileUrl.startsWith('/') ? new URL(document.baseURI).origin + CFG.tileUrl : CFG.tileUrl;
+const mid = (CFG.vmin + CFG.vmax) / 2;
+
+const map = new maplibregl.Map({{
+  container: 'map',
+  style: {{
+    version: 8,
+    sources: {{
+      base: {{
+        type: 'raster', tileSize: 256,
+        tiles: ['https://basemaps.cartocdn.com/light_all/{{z}}/{{x}}/{{y}}.png'],
+        attribution: '© OpenStreetMap © CARTO'
+      }}
+    }},
+    layers: [{{ id: 'base', type: 'raster', source: 'base' }}]
+  }},
+  center: [126.9780, 37.5665],
+  zoom: 10
+}});
+
+function applyDay(d) {{
+  const row = CFG.values[d] || [];
+  for (let i = 0; i < CFG.dongs.length; i++) {{
+    map.setFeatureState({{ source: 'dong', sourceLayer: CFG.layer, id: i }}, {{ v: row[i] }});
+  }}
+  document.getElementById('day-label').textContent = CFG.dates[d] || '';
+}}
+
+map.on('load', () => {{
+  map.addSource('dong', {{ type: 'vector', tiles: [tileUrl], minzoom: CFG.minZoom, maxzoom: CFG.maxZoom }});
+  map.addLayer({{
+    id: 'dong-fill', type: 'fill', source: 'dong', 'source-layer': CFG.layer,
+    paint: {{
+      'fill-color': ['case', ['==', ['feature-state', 'v'], null], 'rgba(0,0,0,0)',
+        ['interpolate', ['linear'], ['feature-state', 'v'], CFG.vmin, '#0000FF', mid, '#FFFFFF', CFG.vmax, '#FF0000']],
+      'fill-opacity': 0.8
+    }}
+  }});
+  map.addLayer({{
+    id: 'dong-line', type: 'line', source: 'dong', 'source-layer': CFG.layer,
+    paint: {{ 'line-color': '#888888', 'line-width': 0.5 }}
+  }});
+
+  const popup = new maplibregl.Popup({{ closeButton: false }});
+  map.on('mousemove', 'dong-fill', (e) => {{
+    const f = e.features[0];
+    const v = CFG.values[document.getElementById('day').value][f.id];
+    popup.setLngLat(e.lngLat)
+      .setHTML(`<b>${{CFG.dongs[f.id]}}</b><br>유동인구: ${{v === null || v === undefined ? '-' : v.toLocaleString()}}`)
+      .addTo(map);
+  }});
+  map.on('mouseleave', 'dong-fill', () => popup.remove());
+
+  applyDay(0);
+  document.getElementById('day').addEventListener('input', (e) => applyDay(Number(e.target.value)));
+}});
+</script>
+"""
+
+
+def serve_tiles(directory: str = TILES_DIR, port: int = 8765) -> ThreadingHTTPServer:
+    """Streamlit static 서빙을 쓸 수 없을 때 사용하는 로컬 타일 서버 (백그라운드 스레드)
+
+    이 경우 tile_url 은 'http://localhost:{port}/{z}/{x}/{y}.pbf' 로 지정합니다.
+    """
+    class TileHandler(SimpleHTTPRequestHandler):
+        extensions_map = {**SimpleHTTPRequestHandler.extensions_map, '.pbf': 'application/x-protobuf'}
+
+        def end_headers(self):
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Cache-Control', 'public, max-age=86400')
+            super().end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), partial(TileHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[타일 서버] http://127.0.0.1:{port}/ -> {directory}")
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='행정동 경계 GeoJSON -> MVT 타일 디렉토리 생성')
+    parser.add_argument('--geojson', required=True, help='행정동 경계 GeoJSON 파일 경로')
+    parser.add_argument('--out', default=TILES_DIR, help='타일 저장 디렉토리')
+    parser.add_argument('--min-zoom', type=int, default=9)
+    parser.add_argument('--max-zoom', type=int, default=14)
+    parser.add_argument('--name-property', default='adm_nm', help='행정동 이름 속성명')
+    args = parser.parse_args()
+
+    with open(args.geojson, 'r', encoding='utf-8') as f:
+        dong_geojson = json.load(f)
+
+    meta = build_dong_tiles(
+        dong_geojson,
+        out_dir=args.out,
+        min_zoom=args.min_zoom,
+        max_zoom=args.max_zoom,
+        name_property=args.name_property
+    )
+    print(f"✅ 행정동 {len(meta['dongs'])}개 타일 생성 완료: {args.out}")
@@ -0,0 +1,195 @@
+"""
+흑백요리사2 대시보드 - Plotly Figure 캐시 모듈
+
+같은 데이터와 같은 옵션으로 만든 지도/히트맵은 다시 계산하지 않고
+메모리(LRU) 또는 디스크에 저장된 figure JSON을 불러옵니다.
+캐시 키 = (함수 모듈 코드 버전, 데이터 지문, 함수 이름, 호출 파라미터)
+디스크 캐시는 배포 후에도 남으므로, figure 생성 코드가 바뀌면 코드 버전이 달라져 예전 figure를 쓰지 않습니다.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from profiling import count_rows, profile_section, record_cache_event
+
+# 디스크 캐시 폴더
+FIGURE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.figure_cache')
+# 메모리에 보관할 figure 수
+MEMORY_CACHE_SIZE = 32
+# 디스크에 보관할 figure 수 (초과 시 오래 안 쓴 파일부터 삭제)
+DISK_CACHE_SIZE = 200
+
+V = TypeVar('V')
+
+
+class LRUCache(Generic[V]):
+    """
+    세션 스레드가 함께 쓰는 메모리 LRU 캐시 (조회/추가/삭제를 잠금 안에서 실행)
+
+    OrderedDict를 잠금 없이 쓰면 다른 스레드가 항목을 내보낸 직후 move_to_end가 KeyError를 냅니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[str, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[V]:
+        """값 조회 (있으면 최근 사용으로 이동, 없으면 None)"""
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: V):
+        """값 저장 후 오래 안 쓴 항목부터 max_size개까지만 남김"""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# 캐시 키 -> figure JSON (최근 사용 순)
+_memory_cache: LRUCache[str] = LRUCache(MEMORY_CACHE_SIZE)
+# GeoJSON 같은 dict 지문 (id -> (원본 참조, 지문)), 같은 객체면 다시 직렬화하지 않음
+_dict_fingerprints: Dict[int, Tuple[Any, str]] = {}
+
+
+def data_fingerprint(value: Any) -> str:
+    """캐시 키에 들어갈 값의 지문 (DataFrame은 내용 해시, 나머지는 repr)"""
+    if isinstance(value, pd.DataFrame):
+        row_hash = pd.util.hash_pandas_object(value, index=True).values
+        digest = hashlib.sha1(row_hash.tobytes())
+        digest.update(repr(list(value.columns)).encode('utf-8'))
+        return f"df:{digest.hexdigest()}"
+
+    if isinstance(value, dict):
+        cached = _dict_fingerprints.get(id(value))
+        if cached is None or cached[0] is not value:
+            text = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+            cached = (value, hashlib.sha1(text.encode('utf-8')).hexdigest())
+            if len(_dict_fingerprints) >= 16:
+                _dict_fingerprints.clear()
+            _dict_fingerprints[id(value)] = cached
+        return f"dict:{cached[1]}"
+
+    return repr(value)
+
+
+def code_version(func: Callable) -> str:
+    """함수가 정의된 모듈 파일 내용 해시 (같은 모듈의 보조 함수가 바뀌어도 달라짐, 파일이 없으면 함수 소스)"""
+    try:
+        with open(inspect.getsourcefile(func), 'rb') as f:
+            source = f.read()
+    except (OSError, TypeError):
+        try:
+            source = inspect.getsource(func).encode('utf-8')
+        except (OSError, TypeError):
+            return ''
+    return hashlib.sha1(source).hexdigest()[:12]
+
+
+def make_figure_key(func_name: str, params: Dict[str, Any], version: str = '') -> str:
+    """코드 버전 + 함수 이름 + 파라미터(데이터 지문 포함)로 캐시 키 생성"""
+    parts = [version, func_name] + [f"{name}={data_fingerprint(value)}" for name, value in sorted(params.items())]
+    return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _disk_path(key: str) -> str:
+    return os.path.join(FIGURE_CACHE_DIR, f"{key}.json")
+
+
+def _read_disk(key: str):
+    path = _disk_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            fig_json = f.read()
+        os.utime(path)  # 최근 사용 시각 갱신 (LRU)
+        return fig_json
+    except OSError:
+        return None
+
+
+def _write_disk(key: str, fig_json: str):
+    try:
+        os.makedirs(FIGURE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{_disk_path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(fig_json)
+        os.replace(tmp_path, _disk_path(key))
+
+        files = [os.path.join(FIGURE_CACHE_DIR, name)
+                 for name in os.listdir(FIGURE_CACHE_DIR) if name.endswith('.json')]
+        if len(files) > DISK_CACHE_SIZE:
+            files.sort(key=os.path.getmtime)
+            for path in files[:len(files) - DISK_CACHE_SIZE]:
+                os.remove(path)
+    except OSError as e:
+        print(f"⚠️ figure 캐시 저장 실패: {e}")
+
+
+def cached_figure(func: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """
+    figure 생성 함수에 메모리/디스크 캐시를 적용하는 데코레이터
+
+    기본값을 포함한 모든 인자를 키에 넣으므로 위치/키워드 호출 방식과 무관하게
+    같은 호출이면 같은 figure를 돌려줍니다. 반환값은 매번 새 Figure 객체라
+    호출한 쪽에서 update_layout 등을 해도 캐시에는 영향이 없습니다.
+    """
+    signature = inspect.signature(func)
+    version = code_version(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with profile_section(f"figure: {func.__name__}", rows=count_rows(args[0]) if args else None):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = make_figure_key(func.__qualname__, bound.arguments, version)
+
+            fig_json = _memory_cache.get(key)
+            if fig_json is not None:
+                record_cache_event(True)
+            else:
+                fig_json = _read_disk(key)
+                record_cache_event(fig_json is not None)
+                if fig_json is None:
+                    fig_json = pio.to_json(func(*args, **kwargs))
+                    _write_disk(key, fig_json)
+                _memory_cache.put(key, fig_json)
+
+            return pio.from_json(fig_json)
+
+    return wrapper
+
+
+def clear_figure_cache(disk: bool = True):
+    """figure 캐시 비우기 (데이터 새로고침 시 호출)"""
+    _memory_cache.clear()
+    _dict_fingerprints.clear()
+    if disk and os.path.isdir(FIGURE_CACHE_DIR):
+        for name in os.listdir(FIGURE_CACHE_DIR):
+            if name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(FIGURE_CACHE_DIR, name))
+                except OSError:
+                    pass
@@ -9,14 +9,11 @@ import numpy as np
 import sys
 import os
 import platform
-import matplotlib.pyplot as plt
-import seaborn as sns
-import statsmodels.api as sm
-
-from statsmodels.stats.outliers_influence import variance_inflation_factor
 
 # 모듈 경로 추가
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# 히트맵 한 페이지에 표시할 가게 수
+HEATMAP_PAGE_SIZE = 50
 sys.path.append(SCRIPT_DIR)
 
 # 데이터 경로 헬퍼 함수 (Streamlit Cloud 호환)
@@ -42,21 +39,51 @@ from data_processor import (
     load_restaurants,
     calculate_review_changes,
     get_daily_population_by_district,
+    get_data_version,
+    normalize_trend_data,
     BROADCAST_DATES
 )
-from review_heatmap import (
-    create_review_heatmap,
-    create_review_bar_chart,
-    get_top_restaurants_by_change
+from review_leaderboard import ReviewLeaderboard
+from artifact_graph import ArtifactGraph
+from artifact_bundle import open_latest_bundle, latest_bundle_version, add_bundled
+from lazy_import import LazyModule, lazy_function
+from profiling import (
+    profiled,
+    mark_cache_miss,
+    profiling_default,
+    start_profiling,
+    profile_fragment,
+    render_profiling_panel
 )
-from population_animated_map import (
-    load_seoul_geojson,
-    create_animated_population_map,
-    create_broadcast_comparison_map,
-    create_static_choropleth
+from dong_vector_tiles import (
+    load_tile_metadata,
+    build_daily_value_array,
+    render_dong_tile_map
 )
 from supabase_data_loader import load_chef_survival_results_from_supabase, load_trend_data_from_supabase
 
+# === 무거운 의존성 (메뉴에서 처음 쓸 때 import) ===
+# 홈 화면은 seaborn/statsmodels/scipy/matplotlib/plotly 없이 바로 렌더링
+# 리뷰 히트맵 (plotly, scipy)
+create_review_heatmap = lazy_function('review_heatmap', 'create_review_heatmap')
+create_review_bar_chart = lazy_function('review_heatmap', 'create_review_bar_chart')
+rank_heatmap_restaurants = lazy_function('review_heatmap', 'rank_heatmap_restaurants')
+# 유동인구 지도 (plotly)
+load_seoul_geojson = lazy_function('population_animated_map', 'load_seoul_geojson')
+create_animated_population_map = lazy_function('population_animated_map', 'create_animated_population_map')
+create_broadcast_comparison_map = lazy_function('population_animated_map', 'create_broadcast_comparison_map')
+create_static_choropleth = lazy_function('population_animated_map', 'create_static_choropleth')
+# 심사위원 분석 / 생존율 (statsmodels, scipy)
+clean_survival_data = lazy_function('judge_regression', 'clean_survival_data')
+clean_genre_survival_data = lazy_function('judge_regression', 'clean_genre_survival_data')
+judge_subset = lazy_function('judge_regression', 'judge_subset')
+create_pass_rate_summary = lazy_function('judge_regression', 'create_pass_rate_summary')
+create_summary_df = lazy_function('judge_regression', 'create_summary_df')
+run_logistic_regression = lazy_function('judge_regression', 'run_logistic_regression')
+calculate_vif = lazy_function('judge_regression', 'calculate_vif')
+# matplotlib/seaborn 차트 (처음 그릴 때 한글 폰트 설정)
+cached_render = lazy_function('chart_render_cache', 'cached_render')
+
 # === 한글 폰트 설정 ===
 def set_korean_font():
     """한글 폰트 설정 (Windows/Mac/Linux 호환)"""
@@ -81,27 +108,21 @@ def set_korean_font():
             font_name = 'AppleGothic'
     else:
         # Linux (Streamlit Cloud) - 나눔고딕
-        # matplotlib 캐시 완전 삭제
-        try:
-            cache_dir = mpl.get_cachedir()
-            if cache_dir and os.path.exists(cache_dir):
-                import shutil
-                for file in os.listdir(cache_dir):
-                    if file.startswith('fontlist'):
-                        try:
-                            os.remove(os.path.join(cache_dir, file))
-                        except:
-                            pass
-        except:
-            pass
-
         font_path = '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'
-        if os.path.exists(font_path):
-            # 폰트 매니저에 명시적으로 추가
+        font_name = 'NanumGothic'
+
+        # 빠른 경로: 캐시된 폰트 목록에 이미 있으면 그대로 사용
+        registered = any(f.name == font_name for f in fm.fontManager.ttflist)
+        if not registered and os.path.exists(font_path):
+            # 폰트 설치 전에 만들어진 캐시라면 한 번만 등록하고,
+            # 갱신된 폰트 목록을 캐시 파일에 저장해 다음 프로세스부터는 재등록하지 않음
             fm.fontManager.addfont(font_path)
             font_name = fm.FontProperties(fname=font_path, size=10).get_name()
-        else:
-            font_name = 'NanumGothic'
+            try:
+                cache_path = os.path.join(mpl.get_cachedir(), f"fontlist-v{fm.FontManager.__version__}.json")
+                fm.json_dump(fm.fontManager, cache_path)
+            except OSError as e:
+                print(f"⚠️ 폰트 캐시 저장 실패: {e}")
 
     # matplotlib 폰트 설정
     plt.rc('font', family=font_name)
@@ -122,7 +143,8 @@ def set_korean_font():
     sns.set_palette("bright")
     sns.set(font=font_name, rc={'axes.unicode_minus': False})
 
-set_korean_font()
+plt = LazyModule('matplotlib.pyplot', on_load=set_korean_font)
+sns = LazyModule('seaborn', on_load=lambda: plt._load())  # 폰트 설정은 plt 쪽에서 한 번만
 
 # === 페이지 설정 ===
 st.set_page_config(
@@ -166,37 +188,9 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # === 데이터 캐싱 ===
+@profiled('쉐프 생존여부 로드', cached=True)
 @st.cache_data
-def load_all_data():
-    """모든 데이터 로드"""
-    reviews = load_reviews()
-    population = load_population()
-    restaurants = load_restaurants()
-    return reviews, population, restaurants
-
-@st.cache_data
-def load_survival_data():
-    """서바이벌 데이터 로드"""
-    df = load_chef_survival_results_from_supabase()
-    if df is None or df.empty:
-        return None
-    df_clean = df[df['food'] != '-'].copy()
-    return df_clean
-
-@st.cache_data
-def load_genre_survival_data():
-    """요리 장르별 생존율 데이터"""
-    df = load_chef_survival_results_from_supabase()
-    if df is None or df.empty:
-        return None
-    df['is_survived'] = df['is_alive'].apply(lambda x: 1 if x in ['생존'] else 0)
-    cols = ['round', 'name', 'match_type', 'food_category', 'is_survived', 'is_alive']
-    df_analysis = df[cols].copy()
-    df_clean = df_analysis.dropna(subset=['food_category'])
-    df_clean = df_clean[df_clean['food_category'] != '-']
-    return df_clean
-
-@st.cache_data
+@mark_cache_miss
 def load_chef_survival_data():
     """쉐프 생존여부 데이터 로드"""
     file_path = get_data_path('쉐프생존여부.csv')
@@ -205,11 +199,28 @@ def load_chef_survival_data():
     df = pd.read_csv(file_path, encoding='utf-8')
     return df
 
+@st.cache_resource(max_entries=2)
+def open_bundle(latest_version):
+    """산출물 번들 열기 (latest_version: 캐시 키, 새 번들이 빌드되면 다시 엶)"""
+    return open_latest_bundle()
+
+def get_bundle():
+    """미리 빌드한 산출물 번들 (없거나 데이터 파일이 빌드 이후 바뀌었으면 None → 직접 계산)"""
+    bundle = open_bundle(latest_bundle_version())
+    # 데이터 파일 서명은 rerun마다 다시 확인 (실행 중 CSV를 수정해도 바로 직접 계산으로 전환)
+    if bundle is None or not bundle.is_current():
+        return None
+    return bundle
+
 @st.cache_resource
 def get_geojson():
-    """GeoJSON 로드"""
+    """GeoJSON 로드 (번들에 단순화된 GeoJSON이 있으면 사용)"""
+    bundle = get_bundle()
+    if bundle is not None and bundle.has('geojson'):
+        return bundle.load('geojson')
     return load_seoul_geojson()
 
+
 # === 쉐프 매핑 ===
 CHEF_MAPPING = {
     'akrl': '아기맹수', 'choi': '최강록', 'hoo': '후덕죽', 'im': '임성근',
@@ -234,98 +245,333 @@ def plot_pass_rate(df, judge_col, judge_name):
     plt.tight_layout()
     return fig
 
-def create_pass_rate_summary(df, judge_col):
-    """심사위원 합격률 통계표 생성"""
-    features = ['how_cook', 'food_category', 'ingrediant', 'temperature']
-    feature_names = {
-        'how_cook': '조리법',
-        'food_category': '음식 카테고리',
-        'ingrediant': '주재료',
-        'temperature': '온도'
-    }
-
-    summary_data = []
-    for col in features:
-        if col in df.columns:
-            stats = df.groupby(col).agg({
-                judge_col: ['count', 'sum', 'mean']
-            }).reset_index()
-            stats.columns = [col, '총 시도 횟수', '합격 횟수', '합격률']
-            stats['합격률'] = (stats['합격률'] * 100).round(1)
-            stats = stats.sort_values('합격률', ascending=False)
-            stats.insert(0, '구분', feature_names[col])
-            stats.rename(columns={col: '값'}, inplace=True)
-            summary_data.append(stats)
-
-    if summary_data:
-        return pd.concat(summary_data, ignore_index=True)
-    return pd.DataFrame()
-
-def run_logistic_regression(df, target_col):
-    """로지스틱 회귀분석"""
-    if target_col == 'an':
-        sub_df = df[df['is_an'] == 1].copy()
-    else:
-        sub_df = df[df['is_back'] == 1].copy()
-        
-    features = ['how_cook', 'food_category', 'ingrediant', 'temperature']
-    X = pd.get_dummies(sub_df[features], drop_first=True, dtype=int)
-    X = sm.add_constant(X)
-    y = sub_df[target_col]
-    try:
-        model = sm.Logit(y, X).fit(disp=0)
-        return model, X, y
-    except:
-        return None, None, None
-
-def calculate_vif(X):
-    """다중공선성 계산"""
-    vif_data = pd.DataFrame()
-    vif_data["Feature"] = X.columns
-    vif_data["VIF"] = [variance_inflation_factor(X.values, i) for i in range(X.shape[1])]
-    return vif_data.sort_values(by="VIF", ascending=False)
-
-def create_summary_df(model):
-    """회귀분석 결과 요약"""
-    if model is None: 
-        return pd.DataFrame()
-    summary_df = pd.DataFrame({
-        "Coef": model.params,
-        "P-value": model.pvalues,
-        "Odds Ratio": np.exp(model.params)
-    })
-    return summary_df.sort_values(by="P-value")
-
+@profiled('트렌드 데이터 로드')
 def load_trend_data():
     """트렌드 데이터 로드 (Only Supabase)"""
     # 모든 소스(datalab, Google, YouTube)가 DB에 저장되어 있다고 가정
-    df = load_trend_data_from_supabase()
-    
-    if df.empty:
-        return pd.DataFrame()
-        
-    # Supabase 컬럼 -> 대시보드 컬럼 매핑 (한글 -> 영문)
-    column_mapping = {
-        '출연자': 'Chef',
-        '날짜': 'Date',
-        '값': 'Value',
-        '소스': 'Source'
+    return normalize_trend_data(load_trend_data_from_supabase())
+
+@st.cache_resource
+def get_review_leaderboard():
+    """프로세스 공용 리뷰 증가율 리더보드 (리뷰 파일이 바뀌면 새 리뷰 행만 반영)"""
+    return ReviewLeaderboard()
+
+def sync_review_leaderboard(reviews, review_changes):
+    """리뷰를 다시 읽었을 때 공용 리더보드에 새 행만 반영 (행이 지워졌으면 다시 구성)"""
+    leaderboard = get_review_leaderboard()
+    leaderboard.sync_reviews(reviews, review_changes)
+    return leaderboard
+
+# === 산출물 그래프 ===
+def get_artifacts():
+    """
+    원본 → 정제 → 집계 → 모델 산출물 그래프 (rerun/세션 공유)
+    각 메뉴는 graph.get(이름)으로 필요한 산출물만 가져가며, 입력이 바뀐 노드만 다시 계산됩니다.
+    사용할 번들이 바뀌거나 오래되면(데이터 파일 수정) 번들 없는 그래프로 다시 구성됩니다.
+    """
+    bundle = get_bundle()
+    return build_artifacts(bundle.version if bundle is not None else None, bundle)
+
+@st.cache_resource(max_entries=2)
+def build_artifacts(bundle_version, _bundle):
+    """산출물 그래프 구성 (bundle_version: 캐시 키, _bundle: 해시하지 않는 번들 객체)"""
+    graph = ArtifactGraph()
+    # 번들에 있는 산출물은 입력 노드 없이 파일에서 읽음 (artifact_bundle.py로 빌드)
+    bundle = _bundle
+
+    # 원본 (로컬 파일은 수정 시각이 바뀌면 다시 로드)
+    add_bundled(graph, bundle, 'reviews', load_reviews, version=get_data_version)
+    add_bundled(graph, bundle, 'population', load_population, version=get_data_version)
+    add_bundled(graph, bundle, 'restaurants', load_restaurants, version=get_data_version)
+    # Supabase 원본은 번들에 없음 (서바이벌 산출물은 읽은 데이터가 번들 빌드 때와 같을 때만 번들 사용)
+    graph.add('chef_survival_raw', load_chef_survival_results_from_supabase)
+    graph.add('trend', load_trend_data)
+
+    # 정제
+    add_bundled(graph, bundle, 'survival', clean_survival_data, deps=['chef_survival_raw'],
+                source='chef_survival_raw')
+    add_bundled(graph, bundle, 'genre_survival', clean_genre_survival_data, deps=['chef_survival_raw'],
+                source='chef_survival_raw')
+
+    # 집계
+    add_bundled(graph, bundle, 'review_changes', calculate_review_changes, deps=['reviews'])
+    add_bundled(graph, bundle, 'daily_pop',
+                lambda pop: get_daily_population_by_district(pop.copy()), deps=['population'])
+    graph.add('review_leaderboard', sync_review_leaderboard, deps=['reviews', 'review_changes'])
+    graph.add('dong_values', lambda pop, dongs: build_daily_value_array(pop, list(dongs)),
+              deps=['population'], params=['dongs'])
+    add_bundled(graph, bundle, 'pass_rate_summary',
+                lambda df, judge_col: create_pass_rate_summary(judge_subset(df, judge_col), judge_col),
+                deps=['survival'], params=['judge_col'], source='chef_survival_raw')
+
+    # 모델 적합
+    add_bundled(graph, bundle, 'logit', run_logistic_regression, deps=['survival'], params=['target_col'],
+                source='chef_survival_raw')
+    add_bundled(graph, bundle, 'logit_summary', lambda fit: create_summary_df(fit[0]), deps=['logit'],
+                bundle_params=['target_col'], source='chef_survival_raw')
+    add_bundled(graph, bundle, 'vif', lambda fit: calculate_vif(fit[1]) if fit[1] is not None else None,
+                deps=['logit'], bundle_params=['target_col'], source='chef_survival_raw')
+
+    return graph
+
+# === 부분 rerun 구간 ===
+# 위젯을 바꾸면 전체 스크립트(데이터 로드, 다른 그래프) 대신 해당 fragment만 다시 실행
+# (st.fragment가 없는 구버전 Streamlit에서는 평소처럼 전체 rerun)
+# (profile_fragment: 부분 rerun도 프로파일링 기록)
+fragment = profile_fragment(
+    getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+)
+
+@fragment
+def render_trend_section(df_trend, df_survival, elimination_info):
+    """쉐프/소스 필터 + 트렌드 그래프 (필터를 바꾸면 이 부분만 다시 실행)"""
+    st.subheader("⚙️ 필터 설정")
+    col1, col2 = st.columns(2)
+    with col1:
+        all_chefs = sorted(df_trend['Chef'].unique())
+        selected_chefs = st.multiselect("쉐프 선택", options=all_chefs, default=all_chefs[:3])
+    with col2:
+        all_sources = ['datalab', 'google', 'youtube']
+        selected_sources = st.multiselect("소스 선택", options=all_sources, default=all_sources)
+
+    plot_df = df_trend.copy()
+    if selected_chefs:
+        plot_df = plot_df[plot_df['Chef'].isin(selected_chefs)]
+    if selected_sources:
+        plot_df = plot_df[plot_df['Source'].isin(selected_sources)]
+
+
+    # 소스명 변경 (datalab -> Naver)
+    plot_df['Source'] = plot_df['Source'].replace('datalab', 'Naver')
+
+    if not plot_df.empty:
+        color_palette = {'google': 'blue', 'Naver': 'green', 'youtube': 'red'}
+
+        def draw_trend():
+            fig = sns.relplot(
+                data=plot_df, x="Date", y="Value", hue="Source", col="Chef",
+                kind="line", palette=color_palette,
+                col_wrap=3, height=4, aspect=1.5,
+                facet_kws={'sharey': False, 'sharex': True},
+                errorbar=None  # 오차범위(그림자) 제거 (ci=None deprecated in new seaborn)
+            )
+
+            # 각 쉐프별로 탈락 시점 및 기간 표시
+            for ax in fig.axes.flat:
+                chef_title = ax.get_title().replace('Chef = ', '')
+                ax.set_title(f'Chef = {chef_title}')
+
+                if chef_title in elimination_info:
+                    elim_date = elimination_info[chef_title]
+                    # 탈락 시점이 표시 범위 내에 있을 때만 표시
+                    if pd.Timestamp('2025-12-09') <= elim_date <= pd.Timestamp('2026-01-20'):
+                        ax.axvline(x=elim_date, color='red', linestyle='--', linewidth=2, alpha=0.7)
+                        y_max = ax.get_ylim()[1]
+                        ax.text(elim_date, y_max * 0.95, '탈락', rotation=0,
+                               horizontalalignment='right', verticalalignment='top', color='red', fontsize=9, fontweight='bold')
+                ax.tick_params(axis='x', rotation=45)
+            return fig
+
+        st.image(cached_render('trend_facet', plot_df, draw_trend, elimination=sorted(elimination_info.items())))
+
+        st.markdown("""
+        **🎨 색상 가이드:**
+        - 🟢 **Naver**: 네이버 데이터랩 검색량
+        - 🔵 **google**: 구글 트렌드
+        - 🔴 **youtube**: 유튜브 검색량
+        - 🔴 **빨간 점선**: 해당 쉐프 탈락 시점
+        """)
+
+        # 쉐프 생존여부 테이블 추가
+        st.divider()
+        st.subheader("📋 쉐프별 탈락 정보")
+
+        if df_survival is not None:
+            # 탈락자가 있는 행만 필터링
+            elimination_rows = df_survival[df_survival['탈락자 (Eliminated)'].notna() &
+                                          (df_survival['탈락자 (Eliminated)'].str.strip() != '')]
+
+            if not elimination_rows.empty:
+                display_df = elimination_rows[['라운드', '공개일', '진행 내용 (줄거리)', '탈락자 (Eliminated)']].copy()
+                display_df.columns = ['라운드', '공개일', '진행 내용', '탈락자']
+                st.dataframe(display_df, use_container_width=True, hide_index=True)
+            else:
+                st.info("탈락자 정보가 없습니다.")
+        else:
+            st.warning("쉐프생존여부.csv 파일을 찾을 수 없습니다.")
+
+@fragment
+def render_review_heatmap(review_changes, restaurants):
+    """표시 값/정렬/검색/페이지 선택 + 리뷰 히트맵 (위젯을 바꾸면 히트맵만 다시 그림)"""
+    value_option = st.radio(
+        "표시 값",
+        options=['change_rate', 'change_count'],
+        format_func=lambda x: '증가율 (%)' if x == 'change_rate' else '증가 수',
+        horizontal=True,
+        key="value_option_tab1"
+    )
+
+    # 계산 공식 설명
+    if value_option == 'change_rate':
+        st.caption("📐 **계산 공식**: (방영 후 리뷰 수 - 방영 전 리뷰 수) ÷ 방영 전 리뷰 수 × 100 → 상대적 성장률을 보여줍니다")
+    else:
+        st.caption("📐 **계산 공식**: 방영 후 리뷰 수 - 방영 전 리뷰 수 → 실제로 늘어난 리뷰 개수를 보여줍니다")
+
+    row_order = st.radio(
+        "행 정렬",
+        options=['default', 'cluster'],
+        format_func=lambda x: '활동량/가게명 순' if x == 'default' else '반응 패턴 군집 순',
+        horizontal=True, key="heatmap_row_order"
+    )
+
+    # 가게 검색 + 페이지 선택 (가게가 많으면 활동량 순으로 나눠서 표시)
+    col_search, col_page = st.columns([3, 1])
+    with col_search:
+        heatmap_search = st.text_input("🔍 가게/셰프 검색", key="heatmap_search")
+    n_rows = len(rank_heatmap_restaurants(review_changes, restaurants, min_reviews=0, search=heatmap_search))
+    total_pages = max(1, -(-n_rows // HEATMAP_PAGE_SIZE))
+    with col_page:
+        heatmap_page = st.number_input(
+            f"페이지 (총 {total_pages})", min_value=1, max_value=total_pages, value=1, key="heatmap_page"
+        )
+
+    fig_heatmap = create_review_heatmap(
+        review_changes, restaurants, value_column=value_option, min_reviews=0,
+        page_size=HEATMAP_PAGE_SIZE if n_rows > HEATMAP_PAGE_SIZE else None,
+        page=int(heatmap_page), search=heatmap_search, row_order=row_order
+    )
+    st.plotly_chart(fig_heatmap, use_container_width=True)
+
+@fragment
+def render_review_top10(leaderboard):
+    """방영 회차 선택 + 리뷰 증가율 TOP 10"""
+    st.subheader("🏆 리뷰 증가율 TOP 10")
+    # 필터: 방영 회차 선택
+    episode_labels = {
+        1: "1회 (12/16)", 2: "2회 (12/23)", 3: "3회 (12/30)",
+        4: "4회 (1/6)", 5: "5회 (1/13)"
     }
-    
-    # 필요한 컬럼 확인
-    if not all(col in df.columns for col in column_mapping.keys()):
-        return df
+    selected_episode_tab1 = st.selectbox(
+        "방영 회차 선택 (TOP 10용)",
+        options=list(episode_labels.keys()),
+        format_func=lambda x: episode_labels[x],
+        index=0,
+        key="episode_tab1"
+    )
 
-    final_df = df.rename(columns=column_mapping)
-    
-    # 데이터 타입 변환
-    final_df['Date'] = pd.to_datetime(final_df['Date'])
-    final_df['Value'] = pd.to_numeric(final_df['Value'], errors='coerce')
-    
-    # 이름 통합 (술 빚는 윤주모 -> 윤주모)
-    final_df['Chef'] = final_df['Chef'].replace('술 빚는 윤주모', '윤주모')
-    
-    return final_df
+    top10 = leaderboard.top(10, episode=selected_episode_tab1)
+    st.dataframe(
+        top10[['restaurant', 'change_rate', 'before_count', 'after_count']].rename(columns={
+            'restaurant': '가게명', 'change_rate': '증가율 (%)',
+            'before_count': '방영 전', 'after_count': '방영 후'
+        }),
+        hide_index=True
+    )
+
+@fragment
+def render_population_map(artifacts, population, restaurants, daily_pop, geojson):
+    """지도 유형/회차/날짜 선택 + 유동인구 지도 (선택을 바꾸면 지도만 다시 그림)"""
+    # 행정동 타일이 생성되어 있으면 행정동 지도 옵션 추가
+    dong_metadata = load_tile_metadata()
+    map_options = ['animation', 'comparison', 'static']
+    if dong_metadata is not None and 'ADMINISTRATIVE_DISTRICT' in population.columns:
+        map_options.append('dong')
+
+    map_type = st.radio(
+        "지도 유형",
+        options=map_options,
+        format_func=lambda x: {
+            'animation': '🎬 애니메이션 지도',
+            'comparison': '📊 변화율 지도',
+            'static': '📍 특정 날짜',
+            'dong': '🏘️ 행정동 지도'
+        }[x],
+        horizontal=True,
+        key="map_type_tab2"
+    )
+
+    if map_type == 'animation':
+        st.info("▶ 재생 버튼을 눌러 일별 유동인구 변화를 확인하세요.")
+
+        # 애니메이션용 날짜 범위 필터
+        all_dates = sorted(daily_pop['date'].unique())
+        date_range_tab2 = st.date_input(
+            "분석 기간",
+            value=(all_dates[0], all_dates[-1]),
+            min_value=all_dates[0],
+            max_value=all_dates[-1],
+            key="date_range_tab2"
+        )
+
+        with st.spinner("애니메이션 지도 생성 중..."):
+            start_str = date_range_tab2[0].strftime('%Y-%m-%d') if isinstance(date_range_tab2, tuple) else str(date_range_tab2[0])
+            end_str = date_range_tab2[1].strftime('%Y-%m-%d') if isinstance(date_range_tab2, tuple) and len(date_range_tab2) > 1 else str(date_range_tab2[-1])
+            fig_map = create_animated_population_map(daily_pop, restaurants, geojson, start_date=start_str, end_date=end_str)
+            st.plotly_chart(fig_map, use_container_width=True)
+
+    elif map_type == 'comparison':
+        # 방영 회차 선택
+        episode_labels_tab2 = {
+            1: "1회 (12/16)", 2: "2회 (12/23)", 3: "3회 (12/30)",
+            4: "4회 (1/6)", 5: "5회 (1/13)"
+        }
+        selected_episode_tab2 = st.selectbox(
+            "방영 회차 선택",
+            options=list(episode_labels_tab2.keys()),
+            format_func=lambda x: episode_labels_tab2[x],
+            index=0,
+            key="episode_tab2"
+        )
+
+        broadcast_date = BROADCAST_DATES[selected_episode_tab2 - 1]
+        st.info(f"📊 방영일 {broadcast_date} 기준 7일 전후 변화율")
+        fig_comp = create_broadcast_comparison_map(population, restaurants, broadcast_date, geojson)
+        st.plotly_chart(fig_comp, use_container_width=True)
+
+    elif map_type == 'dong':
+        st.info("슬라이더로 날짜를 바꾸면 행정동별 유동인구가 브라우저에서 바로 갱신됩니다.")
+        import streamlit.components.v1 as components
+        value_payload = artifacts.get('dong_values', dongs=tuple(dong_metadata['dongs']))
+        components.html(render_dong_tile_map(value_payload, dong_metadata), height=700)
+
+    else:
+        # 특정 날짜 선택
+        selected_date_tab2 = st.date_input(
+            "날짜 선택",
+            value=pd.to_datetime(BROADCAST_DATES[0]),
+            key="date_tab2"
+        )
+        fig_static = create_static_choropleth(population, restaurants, str(selected_date_tab2), geojson)
+        st.plotly_chart(fig_static, use_container_width=True)
+
+@fragment
+def render_restaurant_detail(review_changes, restaurants):
+    """가게 선택 + 회차별 리뷰 변화"""
+    all_restaurants = sorted(review_changes['restaurant'].unique())
+    selected_restaurant = st.selectbox("가게 선택", options=all_restaurants, key="restaurant_tab3")
+
+    if selected_restaurant:
+        rest_info = restaurants[restaurants['restaurant'] == selected_restaurant]
+        if len(rest_info) > 0:
+            info = rest_info.iloc[0]
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("셰프", info.get('chief_info', 'N/A'))
+            with col2:
+                st.metric("카테고리", info.get('category', 'N/A'))
+            with col3:
+                st.metric("위치", info.get('location', 'N/A'))
+            with col4:
+                st.metric("총 리뷰", info.get('review_count', 'N/A'))
+
+        fig_bar = create_review_bar_chart(review_changes, selected_restaurant)
+        st.plotly_chart(fig_bar, use_container_width=True)
+
+        st.subheader("📋 회차별 상세 데이터")
+        rest_changes = review_changes[review_changes['restaurant'] == selected_restaurant]
+        display_df = rest_changes[['episode', 'broadcast_date', 'before_count', 'after_count', 'change_count', 'change_rate']]
+        display_df.columns = ['회차', '방영일', '방영 전', '방영 후', '증가 수', '증가율 (%)']
+        st.dataframe(display_df, hide_index=True)
 
 # === 메인 화면 ===
 def main():
@@ -346,6 +592,7 @@ def main():
     
     st.sidebar.markdown("---")
     st.sidebar.info("흑백요리사 데이터 통합 분석 대시보드")
+    start_profiling('integrated_dashboard', st.sidebar.checkbox("⏱️ 프로파일링", value=profiling_default()))
 
     # === 홈 ===
     if menu == "🏠 홈":
@@ -388,7 +635,7 @@ def main():
         **빨간 점선**은 해당 쉐프의 탈락 시점을 나타냅니다.
         """)
 
-        df_trend = load_trend_data()
+        df_trend = get_artifacts().get('trend')
         df_survival = load_chef_survival_data()
 
         if df_trend.empty:
@@ -429,78 +676,7 @@ def main():
         # 요리괴물(준우승) 수동 추가
         elimination_info['요리괴물'] = pd.to_datetime('2026-01-13')
 
-        st.subheader("⚙️ 필터 설정")
-        col1, col2 = st.columns(2)
-        with col1:
-            all_chefs = sorted(df_trend['Chef'].unique())
-            selected_chefs = st.multiselect("쉐프 선택", options=all_chefs, default=all_chefs[:3])
-        with col2:
-            all_sources = ['datalab', 'google', 'youtube']
-            selected_sources = st.multiselect("소스 선택", options=all_sources, default=all_sources)
-
-        plot_df = df_trend.copy()
-        if selected_chefs:
-            plot_df = plot_df[plot_df['Chef'].isin(selected_chefs)]
-        if selected_sources:
-            plot_df = plot_df[plot_df['Source'].isin(selected_sources)]
-
-
-        # 소스명 변경 (datalab -> Naver)
-        plot_df['Source'] = plot_df['Source'].replace('datalab', 'Naver')
-
-        if not plot_df.empty:
-            color_palette = {'google': 'blue', 'Naver': 'green', 'youtube': 'red'}
-
-            fig = sns.relplot(
-                data=plot_df, x="Date", y="Value", hue="Source", col="Chef",
-                kind="line", palette=color_palette,
-                col_wrap=3, height=4, aspect=1.5,
-                facet_kws={'sharey': False, 'sharex': True},
-                errorbar=None  # 오차범위(그림자) 제거 (ci=None deprecated in new seaborn)
-            )
-
-            # 각 쉐프별로 탈락 시점 및 기간 표시
-            for ax in fig.axes.flat:
-                chef_title = ax.get_title().replace('Chef = ', '')
-                ax.set_title(f'Chef = {chef_title}')
-
-                if chef_title in elimination_info:
-                    elim_date = elimination_info[chef_title]
-                    # 탈락 시점이 표시 범위 내에 있을 때만 표시
-                    if pd.Timestamp('2025-12-09') <= elim_date <= pd.Timestamp('2026-01-20'):
-                        ax.axvline(x=elim_date, color='red', linestyle='--', linewidth=2, alpha=0.7)
-                        y_max = ax.get_ylim()[1]
-                        ax.text(elim_date, y_max * 0.95, '탈락', rotation=0,
-                               horizontalalignment='right', verticalalignment='top', color='red', fontsize=9, fontweight='bold')
-                ax.tick_params(axis='x', rotation=45)
-
-            st.pyplot(fig.fig)
-
-            st.markdown("""
-            **🎨 색상 가이드:**
-            - 🟢 **Naver**: 네이버 데이터랩 검색량
-            - 🔵 **google**: 구글 트렌드
-            - 🔴 **youtube**: 유튜브 검색량
-            - 🔴 **빨간 점선**: 해당 쉐프 탈락 시점
-            """)
-
-            # 쉐프 생존여부 테이블 추가
-            st.divider()
-            st.subheader("📋 쉐프별 탈락 정보")
-
-            if df_survival is not None:
-                # 탈락자가 있는 행만 필터링
-                elimination_rows = df_survival[df_survival['탈락자 (Eliminated)'].notna() &
-                                              (df_survival['탈락자 (Eliminated)'].str.strip() != '')]
-
-                if not elimination_rows.empty:
-                    display_df = elimination_rows[['라운드', '공개일', '진행 내용 (줄거리)', '탈락자 (Eliminated)']].copy()
-                    display_df.columns = ['라운드', '공개일', '진행 내용', '탈락자']
-                    st.dataframe(display_df, use_container_width=True, hide_index=True)
-                else:
-                    st.info("탈락자 정보가 없습니다.")
-            else:
-                st.warning("쉐프생존여부.csv 파일을 찾을 수 없습니다.")
+        render_trend_section(df_trend, df_survival, elimination_info)
 
     # === 장르별 생존율 (3번 메뉴) ===
     elif menu == "📊 라운드 × 장르별 생존율 분석":
@@ -511,7 +687,7 @@ def main():
         라운드별, 경기 유형별로 어떤 장르가 유리한지 확인할 수 있습니다.
         """)
 
-        df_clean = load_genre_survival_data()
+        df_clean = get_artifacts().get('genre_survival')
         if df_clean is None:
             st.error("데이터를 찾을 수 없습니다.")
             return
@@ -532,12 +708,15 @@ def main():
 
             pivot_survival = survival_rates.pivot_table(index='round', columns='food_category', values='survival_rate_pct')
 
-            fig, ax = plt.subplots(figsize=(12, 8))
-            sns.heatmap(pivot_survival, annot=True, fmt='.1f', cmap='RdYlGn', vmin=0, vmax=100, ax=ax)
-            ax.set_title('라운드별 요리 장르 생존율 (%)', fontsize=14)
-            ax.set_ylabel('라운드')
-            ax.set_xlabel('요리 장르')
-            st.pyplot(fig)
+            def draw_survival_heatmap():
+                fig, ax = plt.subplots(figsize=(12, 8))
+                sns.heatmap(pivot_survival, annot=True, fmt='.1f', cmap='RdYlGn', vmin=0, vmax=100, ax=ax)
+                ax.set_title('라운드별 요리 장르 생존율 (%)', fontsize=14)
+                ax.set_ylabel('라운드')
+                ax.set_xlabel('요리 장르')
+                return fig
+
+            st.image(cached_render('survival_heatmap', pivot_survival, draw_survival_heatmap))
             st.caption("🔎 **그래프 보는 법**: 초록색이 짙을수록 생존율이 높습니다. 빨간색에 가까울수록 생존율이 낮습니다.")
 
         with tab2:
@@ -575,20 +754,22 @@ def main():
             match_type_stats = df_clean.groupby(['match_type', 'food_category'])['is_survived'].agg(['count', 'mean']).reset_index()
             match_type_stats['survival_rate_pct'] = match_type_stats['mean'] * 100
 
-            fig, ax = plt.subplots(figsize=(12, 6))
-            sns.barplot(data=match_type_stats, x='food_category', y='survival_rate_pct', hue='match_type', ax=ax)
-            ax.set_title('경기 유형별 요리 장르 생존율', fontsize=14)
-            ax.set_ylabel('생존율 (%)')
-            ax.set_xlabel('요리 장르')
-            ax.legend(title='경기 유형')
-            ax.set_ylim(0, 110)
-
-            for p in ax.patches:
-                height = p.get_height()
-                if height > 0:
-                    ax.text(p.get_x() + p.get_width()/2., height + 1, f'{int(height)}%', ha='center')
-
-            st.pyplot(fig)
+            def draw_match_type_bar():
+                fig, ax = plt.subplots(figsize=(12, 6))
+                sns.barplot(data=match_type_stats, x='food_category', y='survival_rate_pct', hue='match_type', ax=ax)
+                ax.set_title('경기 유형별 요리 장르 생존율', fontsize=14)
+                ax.set_ylabel('생존율 (%)')
+                ax.set_xlabel('요리 장르')
+                ax.legend(title='경기 유형')
+                ax.set_ylim(0, 110)
+
+                for p in ax.patches:
+                    height = p.get_height()
+                    if height > 0:
+                        ax.text(p.get_x() + p.get_width()/2., height + 1, f'{int(height)}%', ha='center')
+                return fig
+
+            st.image(cached_render('match_type_bar', match_type_stats, draw_match_type_bar))
             st.caption("🔎 **그래프 보는 법**: 막대 높이가 높을수록 해당 장르의 생존율이 높습니다.")
 
         with tab4:
@@ -613,7 +794,8 @@ def main():
         어떤 조리법과 재료가 합격 확률을 높이는지 데이터로 확인할 수 있습니다.
         """)
 
-        df = load_survival_data()
+        artifacts = get_artifacts()
+        df = artifacts.get('survival')
         if df is None:
             st.error("데이터를 찾을 수 없습니다.")
             return
@@ -624,13 +806,14 @@ def main():
             col1, col2 = st.columns(2)
             with col1:
                 st.subheader("안성재 심사위원")
-                fig_an = plot_pass_rate(df[df['is_an'] == 1], 'an', '안성재')
-                st.pyplot(fig_an)
+                st.image(cached_render(
+                    'pass_rate', df, lambda: plot_pass_rate(judge_subset(df, 'an'), 'an', '안성재'), judge='an'
+                ))
                 st.caption("📝 **해석**: 각 막대의 높이는 합격률을 의미합니다. 안성재 심사위원은 특정 조리법(조림 등)에서 확연히 높은 합격률을 보이는 경향이 있습니다.")
 
                 # 안성재 통계표
                 with st.expander("📊 상세 통계표 (시도 횟수 포함)"):
-                    summary_an = create_pass_rate_summary(df[df['is_an'] == 1], 'an')
+                    summary_an = artifacts.get('pass_rate_summary', judge_col='an')
                     if not summary_an.empty:
                         st.dataframe(summary_an, hide_index=True, use_container_width=True)
                     else:
@@ -638,13 +821,14 @@ def main():
 
             with col2:
                 st.subheader("백종원 심사위원")
-                fig_back = plot_pass_rate(df[df['is_back'] == 1], 'back', '백종원')
-                st.pyplot(fig_back)
+                st.image(cached_render(
+                    'pass_rate', df, lambda: plot_pass_rate(judge_subset(df, 'back'), 'back', '백종원'), judge='back'
+                ))
                 st.caption("📝 **해석**: 백종원 심사위원은 퓨전 및 다양한 조리법에서 상대적으로 고른 합격률을 보이지만, 특정 '맛'의 포인트(예: 중식 튀김)를 선호함을 알 수 있습니다.")
 
                 # 백종원 통계표
                 with st.expander("📊 상세 통계표 (시도 횟수 포함)"):
-                    summary_back = create_pass_rate_summary(df[df['is_back'] == 1], 'back')
+                    summary_back = artifacts.get('pass_rate_summary', judge_col='back')
                     if not summary_back.empty:
                         st.dataframe(summary_back, hide_index=True, use_container_width=True)
                     else:
@@ -665,8 +849,8 @@ def main():
             st.warning("⚠️ **주의사항**: 표본이 적어 회귀 진단이 맞지않기에 정확한 모델링이 아니며 재미로 보길 바랍니다.")
             col_l, col_r = st.columns(2)
 
-            model_an, X_an, y_an = run_logistic_regression(df, 'an')
-            summary_an = create_summary_df(model_an)
+            model_an, X_an, y_an = artifacts.get('logit', target_col='an')
+            summary_an = artifacts.get('logit_summary', target_col='an')
             with col_l:
                 st.subheader("🔹 안성재 심사위원 모델")
                 st.markdown("##### 📋 통계 분석 결과표")
@@ -677,24 +861,27 @@ def main():
 
                 if X_an is not None:
                     with st.expander("다중공선성(VIF) 진단"):
-                        vif_an = calculate_vif(X_an)
+                        vif_an = artifacts.get('vif', target_col='an')
                         st.dataframe(vif_an.style.map(lambda x: 'color: red' if x > 10 else '', subset=['VIF']))
                         st.caption("🔎 **VIF란?**: 변수들 간의 상관관계입니다. 10 이상(빨간색)이면 신뢰도가 떨어질 수 있습니다.")
 
                 if model_an:
                     st.markdown("##### 📉 잔차(오차) 분석")
-                    fig_res, ax = plt.subplots(figsize=(8, 4))
-                    # Use numpy arrays to prevent index alignment issues with seaborn regplot lowess
-                    sns.regplot(x=np.array(model_an.predict()), y=np.array(model_an.resid_pearson), lowess=True,
-                                line_kws={'color': 'red'}, scatter_kws={'alpha': 0.5}, ax=ax)
-                    ax.set_title("Residuals vs Fitted (안성재)")
-                    ax.axhline(0, color='blue', linestyle='--')
-                    ax.set_ylim(-4, 4)  # 극단적 이상치 시각화 방지
-                    st.pyplot(fig_res)
+                    def draw_residuals_an():
+                        fig_res, ax = plt.subplots(figsize=(8, 4))
+                        # Use numpy arrays to prevent index alignment issues with seaborn regplot lowess
+                        sns.regplot(x=np.array(model_an.predict()), y=np.array(model_an.resid_pearson), lowess=True,
+                                    line_kws={'color': 'red'}, scatter_kws={'alpha': 0.5}, ax=ax)
+                        ax.set_title("Residuals vs Fitted (안성재)")
+                        ax.axhline(0, color='blue', linestyle='--')
+                        ax.set_ylim(-4, 4)  # 극단적 이상치 시각화 방지
+                        return fig_res
+
+                    st.image(cached_render('residuals', [X_an, y_an.to_frame()], draw_residuals_an, judge='an'))
                     st.caption("🔎 **그래프 보는 법**: 빨간 실선(데이터 추세)이 파란 점선(0)에 가깝고 평평할수록, 모델이 데이터를 편향 없이 잘 설명하고 있다는 뜻입니다.")
 
-            model_back, X_back, y_back = run_logistic_regression(df, 'back')
-            summary_back = create_summary_df(model_back)
+            model_back, X_back, y_back = artifacts.get('logit', target_col='back')
+            summary_back = artifacts.get('logit_summary', target_col='back')
             with col_r:
                 st.subheader("🔸 백종원 심사위원 모델")
                 st.markdown("##### 📋 통계 분석 결과표")
@@ -705,20 +892,23 @@ def main():
 
                 if X_back is not None:
                     with st.expander("다중공선성(VIF) 진단"):
-                        vif_back = calculate_vif(X_back)
+                        vif_back = artifacts.get('vif', target_col='back')
                         st.dataframe(vif_back.style.map(lambda x: 'color: red' if x > 10 else '', subset=['VIF']))
                         st.caption("🔎 **VIF란?**: 10 이하가 이상적입니다. 너무 높으면 '같은 의미의 변수'가 여러 개 들어갔다는 뜻입니다.")
 
                 if model_back:
                     st.markdown("##### 📉 잔차(오차) 분석")
-                    fig_res_b, ax_b = plt.subplots(figsize=(8, 4))
-                    # Use numpy arrays to prevent index alignment issues
-                    sns.regplot(x=np.array(model_back.predict()), y=np.array(model_back.resid_pearson), lowess=True,
-                                line_kws={'color': 'red'}, scatter_kws={'alpha': 0.5}, ax=ax_b)
-                    ax_b.set_title("Residuals vs Fitted (백종원)")
-                    ax_b.axhline(0, color='blue', linestyle='--')
-                    ax_b.set_ylim(-4, 4)  # 극단적 이상치 시각화 방지
-                    st.pyplot(fig_res_b)
+                    def draw_residuals_back():
+                        fig_res_b, ax_b = plt.subplots(figsize=(8, 4))
+                        # Use numpy arrays to prevent index alignment issues
+                        sns.regplot(x=np.array(model_back.predict()), y=np.array(model_back.resid_pearson), lowess=True,
+                                    line_kws={'color': 'red'}, scatter_kws={'alpha': 0.5}, ax=ax_b)
+                        ax_b.set_title("Residuals vs Fitted (백종원)")
+                        ax_b.axhline(0, color='blue', linestyle='--')
+                        ax_b.set_ylim(-4, 4)  # 극단적 이상치 시각화 방지
+                        return fig_res_b
+
+                    st.image(cached_render('residuals', [X_back, y_back.to_frame()], draw_residuals_back, judge='back'))
                     st.caption("🔎 **그래프 보는 법**: 데이터들(점들)이 위아래로 고르게 퍼져 있어야 좋은 모델입니다. 특정 패턴이 보이면 모델 개선이 필요할 수 있습니다.")
 
         with tab3:
@@ -740,9 +930,11 @@ def main():
         st.markdown('<p class="sub-header">방영일 기준 7일 전후 리뷰 및 유동인구 변화</p>', unsafe_allow_html=True)
 
         with st.spinner("데이터 로드 중..."):
-            reviews, population, restaurants = load_all_data()
-            review_changes = calculate_review_changes(reviews)
-            daily_pop = get_daily_population_by_district(population)
+            artifacts = get_artifacts()
+            population = artifacts.get('population')
+            restaurants = artifacts.get('restaurants')
+            review_changes = artifacts.get('review_changes')
+            daily_pop = artifacts.get('daily_pop')
             geojson = get_geojson()
 
         # 탭 선택 (selectbox 방식으로 변경 - Streamlit Cloud 호환성 개선)
@@ -763,19 +955,6 @@ def main():
             리뷰 증가율과 증가 수를 시각화했습니다. 색이 진할수록 리뷰 증가가 많았던 가게입니다.
             """)
 
-            # 필터: 방영 회차 선택
-            episode_labels = {
-                1: "1회 (12/16)", 2: "2회 (12/23)", 3: "3회 (12/30)",
-                4: "4회 (1/6)", 5: "5회 (1/13)"
-            }
-            selected_episode_tab1 = st.selectbox(
-                "방영 회차 선택 (TOP 10용)",
-                options=list(episode_labels.keys()),
-                format_func=lambda x: episode_labels[x],
-                index=0,
-                key="episode_tab1"
-            )
-
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.metric("분석 가게", len(review_changes['restaurant'].unique()))
@@ -786,32 +965,8 @@ def main():
 
             st.divider()
 
-            value_option = st.radio(
-                "표시 값",
-                options=['change_rate', 'change_count'],
-                format_func=lambda x: '증가율 (%)' if x == 'change_rate' else '증가 수',
-                horizontal=True,
-                key="value_option_tab1"
-            )
-
-            # 계산 공식 설명
-            if value_option == 'change_rate':
-                st.caption("📐 **계산 공식**: (방영 후 리뷰 수 - 방영 전 리뷰 수) ÷ 방영 전 리뷰 수 × 100 → 상대적 성장률을 보여줍니다")
-            else:
-                st.caption("📐 **계산 공식**: 방영 후 리뷰 수 - 방영 전 리뷰 수 → 실제로 늘어난 리뷰 개수를 보여줍니다")
-
-            fig_heatmap = create_review_heatmap(review_changes, restaurants, value_column=value_option, min_reviews=0)
-            st.plotly_chart(fig_heatmap, use_container_width=True)
-
-            st.subheader("🏆 리뷰 증가율 TOP 10")
-            top10 = get_top_restaurants_by_change(review_changes, episode=selected_episode_tab1, top_n=10)
-            st.dataframe(
-                top10[['restaurant', 'change_rate', 'before_count', 'after_count']].rename(columns={
-                    'restaurant': '가게명', 'change_rate': '증가율 (%)',
-                    'before_count': '방영 전', 'after_count': '방영 후'
-                }),
-                hide_index=True
-            )
+            render_review_heatmap(review_changes, restaurants)
+            render_review_top10(artifacts.get('review_leaderboard'))
 
         elif broadcast_tab_selection == "🗺️ 유동인구 지도":
             st.header("🗺️ 서울시 유동인구 변화 지도")
@@ -823,66 +978,8 @@ def main():
             - ★ **회색 마커**: 흑백요리사 출연 가게 위치
             """)
 
-            map_type = st.radio(
-                "지도 유형",
-                options=['animation', 'comparison', 'static'],
-                format_func=lambda x: {
-                    'animation': '🎬 애니메이션 지도',
-                    'comparison': '📊 변화율 지도',
-                    'static': '📍 특정 날짜'
-                }[x],
-                horizontal=True,
-                key="map_type_tab2"
-            )
-
-            if map_type == 'animation':
-                st.info("▶ 재생 버튼을 눌러 일별 유동인구 변화를 확인하세요.")
-
-                # 애니메이션용 날짜 범위 필터
-                all_dates = sorted(daily_pop['date'].unique())
-                date_range_tab2 = st.date_input(
-                    "분석 기간",
-                    value=(all_dates[0], all_dates[-1]),
-                    min_value=all_dates[0],
-                    max_value=all_dates[-1],
-                    key="date_range_tab2"
-                )
-
-                with st.spinner("애니메이션 지도 생성 중..."):
-                    start_str = date_range_tab2[0].strftime('%Y-%m-%d') if isinstance(date_range_tab2, tuple) else str(date_range_tab2[0])
-                    end_str = date_range_tab2[1].strftime('%Y-%m-%d') if isinstance(date_range_tab2, tuple) and len(date_range_tab2) > 1 else str(date_range_tab2[-1])
-                    fig_map = create_animated_population_map(daily_pop, restaurants, geojson, start_date=start_str, end_date=end_str)
-                    st.plotly_chart(fig_map, use_container_width=True)
-
-            elif map_type == 'comparison':
-                # 방영 회차 선택
-                episode_labels_tab2 = {
-                    1: "1회 (12/16)", 2: "2회 (12/23)", 3: "3회 (12/30)",
-                    4: "4회 (1/6)", 5: "5회 (1/13)"
-                }
-                selected_episode_tab2 = st.selectbox(
-                    "방영 회차 선택",
-                    options=list(episode_labels_tab2.keys()),
-                    format_func=lambda x: episode_labels_tab2[x],
-                    index=0,
-                    key="episode_tab2"
-                )
-
-                broadcast_date = BROADCAST_DATES[selected_episode_tab2 - 1]
-                st.info(f"📊 방영일 {broadcast_date} 기준 7일 전후 변화율")
-                fig_comp = create_broadcast_comparison_map(population, restaurants, broadcast_date, geojson)
-                st.plotly_chart(fig_comp, use_container_width=True)
+            render_population_map(artifacts, population, restaurants, daily_pop, geojson)
 
-            else:
-                # 특정 날짜 선택
-                selected_date_tab2 = st.date_input(
-                    "날짜 선택",
-                    value=pd.to_datetime(BROADCAST_DATES[0]),
-                    key="date_tab2"
-                )
-                fig_static = create_static_choropleth(population, restaurants, str(selected_date_tab2), geojson)
-                st.plotly_chart(fig_static, use_container_width=True)
-            
             st.subheader("★ 흑백요리사 출연 가게")
             rest_display = restaurants[['restaurant', 'chief_info', 'category', 'location', 'review_count']].copy()
             rest_display.columns = ['가게명', '셰프', '카테고리', '위치', '리뷰수']
@@ -896,32 +993,7 @@ def main():
             각 방영일마다 리뷰가 얼마나 증가했는지 막대그래프와 표로 확인할 수 있습니다.
             """)
 
-            all_restaurants = sorted(review_changes['restaurant'].unique())
-            selected_restaurant = st.selectbox("가게 선택", options=all_restaurants, key="restaurant_tab3")
-            
-            if selected_restaurant:
-                rest_info = restaurants[restaurants['restaurant'] == selected_restaurant]
-                if len(rest_info) > 0:
-                    info = rest_info.iloc[0]
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("셰프", info.get('chief_info', 'N/A'))
-                    with col2:
-                        st.metric("카테고리", info.get('category', 'N/A'))
-                    with col3:
-                        st.metric("위치", info.get('location', 'N/A'))
-                    with col4:
-                        st.metric("총 리뷰", info.get('review_count', 'N/A'))
-                
-                fig_bar = create_review_bar_chart(review_changes, selected_restaurant)
-                st.plotly_chart(fig_bar, use_container_width=True)
-                
-                st.subheader("📋 회차별 상세 데이터")
-                rest_changes = review_changes[review_changes['restaurant'] == selected_restaurant]
-                display_df = rest_changes[['episode', 'broadcast_date', 'before_count', 'after_count', 'change_count', 'change_rate']]
-                display_df.columns = ['회차', '방영일', '방영 전', '방영 후', '증가 수', '증가율 (%)']
-                st.dataframe(display_df, hide_index=True)
-
+            render_restaurant_detail(review_changes, restaurants)
 
     st.divider()
     st.markdown("""
@@ -934,3 +1006,4 @@ def main():
 
 if __name__ == '__main__':
     main()
+    render_profiling_panel()
@@ -0,0 +1,231 @@
+"""
+흑백요리사2 대시보드 - 심사위원 합격 예측 회귀분석 모듈
+
+- 설계 행렬/로지스틱 회귀 결과를 데이터 지문 기준으로 캐시
+- 완전 분리(perfect separation)로 최대우도 추정이 발산하면 Firth 보정 로지스틱 회귀로 대체
+- VIF는 보조 회귀 없이 역상관행렬 대각 성분으로 한 번에 계산
+- 서바이벌 데이터 정제 / 합격률 통계표 (대시보드와 artifact_bundle 빌드에서 공용)
+"""
+import warnings
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+from scipy import stats
+from typing import Dict, Tuple
+from statsmodels.stats.outliers_influence import variance_inflation_factor
+from statsmodels.tools.sm_exceptions import ConvergenceWarning, PerfectSeparationError, PerfectSeparationWarning
+
+# 회귀분석에 사용하는 범주형 변수
+FEATURES = ['how_cook', 'food_category', 'ingrediant', 'temperature']
+# 심사위원 -> 심사 여부 컬럼
+JUDGE_COLUMNS = {'an': 'is_an', 'back': 'is_back'}
+# 최대우도 표준오차가 이보다 크면 준분리(quasi-separation)로 발산한 것으로 보고 Firth 회귀 사용
+MAX_LOGIT_BSE = 1e3
+
+# (데이터 지문, 심사위원) -> (모델, X, y)
+_fit_cache: Dict[Tuple[int, str], tuple] = {}
+
+
+def clean_survival_data(df):
+    """서바이벌 데이터 정제 (심사위원 분석용)"""
+    if df is None or df.empty:
+        return None
+    df_clean = df[df['food'] != '-'].copy()
+    return df_clean
+
+
+def clean_genre_survival_data(df):
+    """요리 장르별 생존율 데이터"""
+    if df is None or df.empty:
+        return None
+    df = df.copy()
+    df['is_survived'] = df['is_alive'].apply(lambda x: 1 if x in ['생존'] else 0)
+    cols = ['round', 'name', 'match_type', 'food_category', 'is_survived', 'is_alive']
+    df_analysis = df[cols].copy()
+    df_clean = df_analysis.dropna(subset=['food_category'])
+    df_clean = df_clean[df_clean['food_category'] != '-']
+    return df_clean
+
+
+def judge_subset(df, judge_col):
+    """해당 심사위원이 심사한 행만 추출"""
+    return df[df[JUDGE_COLUMNS[judge_col]] == 1]
+
+
+def create_pass_rate_summary(df, judge_col):
+    """심사위원 합격률 통계표 생성"""
+    feature_names = {
+        'how_cook': '조리법',
+        'food_category': '음식 카테고리',
+        'ingrediant': '주재료',
+        'temperature': '온도'
+    }
+
+    summary_data = []
+    for col in FEATURES:
+        if col in df.columns:
+            pass_stats = df.groupby(col).agg({
+                judge_col: ['count', 'sum', 'mean']
+            }).reset_index()
+            pass_stats.columns = [col, '총 시도 횟수', '합격 횟수', '합격률']
+            pass_stats['합격률'] = (pass_stats['합격률'] * 100).round(1)
+            pass_stats = pass_stats.sort_values('합격률', ascending=False)
+            pass_stats.insert(0, '구분', feature_names[col])
+            pass_stats.rename(columns={col: '값'}, inplace=True)
+            summary_data.append(pass_stats)
+
+    if summary_data:
+        return pd.concat(summary_data, ignore_index=True)
+    return pd.DataFrame()
+
+
+def create_summary_df(model):
+    """회귀분석 결과 요약"""
+    if model is None:
+        return pd.DataFrame()
+    summary_df = pd.DataFrame({
+        "Coef": model.params,
+        "P-value": model.pvalues,
+        "Odds Ratio": np.exp(model.params)
+    })
+    return summary_df.sort_values(by="P-value")
+
+
+def data_fingerprint(df: pd.DataFrame, target_col: str) -> int:
+    """회귀에 쓰이는 컬럼만으로 데이터 지문 계산"""
+    cols = [c for c in FEATURES + [JUDGE_COLUMNS[target_col], target_col] if c in df.columns]
+    return int(pd.util.hash_pandas_object(df[cols], index=False).sum())
+
+
+def build_design_matrix(df: pd.DataFrame, target_col: str) -> Tuple[pd.DataFrame, pd.Series]:
+    """심사위원별 설계 행렬(더미 + 상수항)과 합격 여부 생성"""
+    sub_df = df[df[JUDGE_COLUMNS[target_col]] == 1]
+    X = pd.get_dummies(sub_df[FEATURES], drop_first=True, dtype=int)
+    X = sm.add_constant(X)
+    y = sub_df[target_col]
+    return X, y
+
+
+class FirthLogitResult:
+    """Firth 보정 로지스틱 회귀 결과 (create_summary_df / 잔차 그래프에 필요한 속성만 제공)"""
+
+    def __init__(self, X: pd.DataFrame, y: pd.Series, beta: np.ndarray, cov: np.ndarray):
+        self.model_name = 'Firth Logit'
+        self.exog = X.values.astype(float)
+        self.endog = y.values.astype(float)
+        self.params = pd.Series(beta, index=X.columns)
+        self.bse = pd.Series(np.sqrt(np.diag(cov)), index=X.columns)
+        self.tvalues = self.params / self.bse
+        self.pvalues = pd.Series(2 * stats.norm.sf(np.abs(self.tvalues)), index=X.columns)
+
+    def predict(self, exog=None) -> np.ndarray:
+        exog = self.exog if exog is None else np.asarray(exog, dtype=float)
+        return 1 / (1 + np.exp(-exog @ self.params.values))
+
+    @property
+    def resid_pearson(self) -> np.ndarray:
+        p = self.predict()
+        return (self.endog - p) / np.sqrt(p * (1 - p))
+
+
+def fit_firth_logit(X: pd.DataFrame, y: pd.Series, max_iter: int = 100, tol: float = 1e-8) -> FirthLogitResult:
+    """
+    Firth 보정 로지스틱 회귀 (Jeffreys prior 벌점)
+
+    완전 분리 상황에서도 계수가 유한하게 수렴합니다.
+    뉴턴 반복: β ← β + (X'WX)^-1 X'(y - p + h(0.5 - p)), h는 hat 행렬 대각 성분
+    """
+    Xv = X.values.astype(float)
+    yv = y.values.astype(float)
+    beta = np.zeros(Xv.shape[1])
+
+    def penalized_loglik(b):
+        p = np.clip(1 / (1 + np.exp(-Xv @ b)), 1e-12, 1 - 1e-12)
+        info = Xv.T @ (Xv * (p * (1 - p))[:, None])
+        sign, logdet = np.linalg.slogdet(info)
+        return np.sum(yv * np.log(p) + (1 - yv) * np.log(1 - p)) + 0.5 * logdet
+
+    for _ in range(max_iter):
+        p = 1 / (1 + np.exp(-Xv @ beta))
+        w = p * (1 - p)
+        info_inv = np.linalg.pinv(Xv.T @ (Xv * w[:, None]))
+        h = np.einsum('ij,jk,ik->i', Xv, info_inv, Xv) * w
+        score = Xv.T @ (yv - p + h * (0.5 - p))
+        step = info_inv @ score
+
+        # 벌점 우도가 줄어들면 스텝 절반으로
+        current = penalized_loglik(beta)
+        while penalized_loglik(beta + step) < current and np.max(np.abs(step)) > tol:
+            step /= 2
+        beta = beta + step
+        if np.max(np.abs(step)) < tol:
+            break
+
+    p = 1 / (1 + np.exp(-Xv @ beta))
+    cov = np.linalg.pinv(Xv.T @ (Xv * (p * (1 - p))[:, None]))
+    return FirthLogitResult(X, y, beta, cov)
+
+
+def fit_logit(X: pd.DataFrame, y: pd.Series):
+    """최대우도 로지스틱 회귀, 완전/준분리·미수렴·특이 행렬이면 Firth 회귀로 대체"""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', PerfectSeparationWarning)
+            warnings.simplefilter('error', ConvergenceWarning)
+            model = sm.Logit(y, X).fit(disp=0)
+        bse = np.asarray(model.bse)
+        if model.mle_retvals.get('converged', False) \
+                and np.all(np.isfinite(bse)) and np.all(bse < MAX_LOGIT_BSE):
+            return model
+    except (PerfectSeparationError, PerfectSeparationWarning, ConvergenceWarning, np.linalg.LinAlgError):
+        pass
+    return fit_firth_logit(X, y)
+
+
+def run_logistic_regression(df: pd.DataFrame, target_col: str):
+    """
+    심사위원별 로지스틱 회귀 (데이터 지문이 같으면 캐시된 결과 재사용)
+
+    Returns:
+        (모델, X, y) - 데이터가 없거나 적합에 실패하면 (None, None, None)
+    """
+    key = (data_fingerprint(df, target_col), target_col)
+    if key in _fit_cache:
+        return _fit_cache[key]
+
+    try:
+        X, y = build_design_matrix(df, target_col)
+        result = (fit_logit(X, y), X, y)
+    except Exception as e:
+        print(f"⚠️ 로지스틱 회귀 실패 ({target_col}): {e}")
+        result = (None, None, None)
+
+    if len(_fit_cache) >= 8:
+        _fit_cache.clear()
+    _fit_cache[key] = result
+    return result
+
+
+def calculate_vif(X: pd.DataFrame) -> pd.DataFrame:
+    """
+    다중공선성(VIF) 일괄 계산
+
+    variance_inflation_factor()는 변수마다 보조 회귀를 한 번씩 돌리지만(p번),
+    상수항이 있는 모형에서 VIF_i = [R^-1]_ii (R: 설명변수 상관행렬)이므로
+    역행렬 한 번으로 모든 VIF를 구할 수 있습니다.
+    상수항은 중심화된 변수들과 직교하므로 VIF = 1 (statsmodels 표준화 방식과 동일)
+    """
+    values = X.values.astype(float)
+    is_const = np.ptp(values, axis=0) == 0
+    vif = np.ones(values.shape[1])
+
+    try:
+        if (~is_const).sum() > 1:
+            corr = np.corrcoef(values[:, ~is_const], rowvar=False)
+            vif[~is_const] = np.diag(np.linalg.inv(corr))
+    except np.linalg.LinAlgError:
+        # 완전 공선성(특이 행렬)이면 기존 방식으로 계산
+        vif = [variance_inflation_factor(values, i) for i in range(values.shape[1])]
+
+    vif_data = pd.DataFrame({"Feature": X.columns, "VIF": vif})
+    return vif_data.sort_values(by="VIF", ascending=False)
@@ -0,0 +1,49 @@
+"""
+흑백요리사2 대시보드 - 지연 import 모듈
+
+seaborn / statsmodels / scipy / matplotlib / plotly는 import만 해도 수 초가 걸리므로,
+대시보드 상단에서 바로 import하지 않고 해당 메뉴에서 처음 사용할 때 import합니다.
+"""
+import importlib
+from typing import Callable, Optional
+
+
+class LazyModule:
+    """
+    첫 속성 접근 때 import되는 모듈 대리 객체
+
+    사용 예:
+        plt = LazyModule('matplotlib.pyplot', on_load=set_korean_font)
+        fig, ax = plt.subplots()  # 여기서 matplotlib import + 폰트 설정
+    """
+
+    def __init__(self, name: str, on_load: Optional[Callable[[], None]] = None):
+        self._name = name
+        self._on_load = on_load
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+            # on_load 안에서 다시 이 객체를 써도 재귀하지 않도록 모듈을 먼저 저장
+            if self._on_load is not None:
+                self._on_load()
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule '{self._name}' ({state})>"
+
+
+def lazy_function(module_name: str, func_name: str) -> Callable:
+    """첫 호출 때 모듈을 import해서 실행하는 함수 (호출하는 쪽 코드는 그대로)"""
+    def wrapper(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), func_name)(*args, **kwargs)
+
+    wrapper.__name__ = wrapper.__qualname__ = func_name
+    wrapper.__module__ = module_name
+    wrapper.__doc__ = f"{module_name}.{func_name} (첫 호출 때 import)"
+    return wrapper
@@ -0,0 +1,123 @@
+"""
+흑백요리사2 대시보드 - 백그라운드 워터마크 새로고침 모듈
+
+서버 프로세스마다 백그라운드 스레드 하나가 데이터셋별 워터마크(가장 최근 id 등 가벼운 조회)를
+주기적으로 확인합니다. 로더는 워터마크를 캐시 키 인자로 받으므로,
+워터마크가 바뀐 데이터셋만 새로 로드되고 나머지는 캐시를 그대로 씁니다.
+"""
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# 워터마크 확인 주기 (초, 화면 쪽 확인 주기와 합쳐 1분 안에 반영)
+REFRESH_INTERVAL = 50
+
+
+class WatermarkRefresher:
+    """
+    데이터셋별 워터마크 폴링
+
+    사용 예:
+        refresher = WatermarkRefresher()
+        refresher.register('reviews', lambda: fetch_watermark('catchtable_reviews'))
+        refresher.start()
+        reviews = load_review_data(refresher.watermark('reviews'))  # st.cache_data 키
+    """
+
+    def __init__(self, interval: float = REFRESH_INTERVAL):
+        self.interval = interval
+        # 이름 -> 워터마크 조회 함수
+        self._sources: Dict[str, Callable[[], Any]] = {}
+        # 이름 -> 마지막 워터마크 (repr 문자열, 캐시 키로 사용)
+        self._watermarks: Dict[str, str] = {}
+        # 수동 새로고침 횟수 (워터마크가 그대로여도 새로 로드하도록 키에 포함)
+        self._forced: Dict[str, int] = {}
+        self._on_change: List[Callable[[List[str]], None]] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_checked: Optional[datetime] = None
+        self.last_changed: Optional[datetime] = None
+
+    def register(self, name: str, watermark_fn: Callable[[], Any]):
+        """데이터셋 등록 (등록 시 한 번 조회해 초기 워터마크 설정)"""
+        self._sources[name] = watermark_fn
+        self._forced.setdefault(name, 0)
+        value = self._read(name)
+        with self._lock:
+            self._watermarks[name] = value if value is not None else ''
+
+    def on_change(self, callback: Callable[[List[str]], None]):
+        """워터마크가 바뀌었을 때 호출할 함수 등록 (바뀐 데이터셋 이름 목록을 받음)"""
+        self._on_change.append(callback)
+
+    def watermark(self, name: str) -> str:
+        """로더 캐시 키 (워터마크 + 수동 새로고침 횟수)"""
+        with self._lock:
+            return f"{self._watermarks.get(name, '')}#{self._forced.get(name, 0)}"
+
+    def snapshot(self) -> Dict[str, str]:
+        """전체 데이터셋 캐시 키 (화면에서 새 데이터가 있는지 비교용)"""
+        return {name: self.watermark(name) for name in self._sources}
+
+    def _read(self, name: str) -> Optional[str]:
+        try:
+            return repr(self._sources[name]())
+        except Exception as e:
+            print(f"⚠️ 워터마크 조회 실패 ({name}): {e}")
+            return None
+
+    def _run_callbacks(self, names: List[str]):
+        for callback in self._on_change:
+            try:
+                callback(names)
+            except Exception as e:
+                print(f"⚠️ 새로고침 콜백 실패: {e}")
+
+    def check_now(self) -> List[str]:
+        """
+        모든 워터마크를 지금 확인하고 바뀐 데이터셋 이름 반환
+
+        콜백(공유 캐시 삭제 등)을 먼저 실행한 뒤 새 워터마크를 공개합니다.
+        순서가 반대면 그 사이에 rerun한 세션이 예전 데이터를 새 워터마크 키로 캐시할 수 있습니다.
+        """
+        updates = {}
+        for name in list(self._sources):
+            value = self._read(name)
+            if value is None:
+                continue  # 조회 실패 시 기존 데이터 유지
+            with self._lock:
+                if value != self._watermarks.get(name):
+                    updates[name] = value
+
+        self.last_checked = datetime.now()
+        changed = list(updates)
+        if changed:
+            self._run_callbacks(changed)
+            with self._lock:
+                self._watermarks.update(updates)
+            self.last_changed = self.last_checked
+        return changed
+
+    def force_refresh(self, names: Optional[List[str]] = None) -> List[str]:
+        """수동 새로고침 - 워터마크와 관계없이 지정한 데이터셋(없으면 전체)을 새로 로드하게 함"""
+        names = list(self._sources) if names is None else names
+        self._run_callbacks(names)
+        with self._lock:
+            for name in names:
+                self._forced[name] = self._forced.get(name, 0) + 1
+        return names
+
+    def start(self):
+        """백그라운드 폴링 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name='watermark-refresher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._wake.wait(self.interval):
+            self.check_now()
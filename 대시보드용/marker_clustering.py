@@ -0,0 +1,155 @@
+"""
+흑백요리사2 대시보드 - 가게 마커 클러스터링 모듈
+
+가게 수가 많아지면 지도에 모든 가게를 개별 마커로 그리는 대신,
+줌 레벨별로 미리 계산한 격자 클러스터(가게 수 + 집계 통계)를 표시합니다.
+"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from typing import Dict, Iterable, Optional
+
+# 웹 메르카토르 타일 크기 (픽셀)
+TILE_SIZE = 256
+# 클러스터 격자 한 칸의 화면 크기 (픽셀)
+CLUSTER_CELL_PX = 60
+# 대시보드 지도의 줌 레벨 (population_animated_map의 choropleth_mapbox zoom)
+MAP_ZOOM = 10
+# 미리 계산할 줌 레벨 (지도에 줌 조절이 없으므로 실제로 쓰는 지도 줌만 계산)
+CLUSTER_ZOOM_LEVELS = (MAP_ZOOM,)
+# 이 개수 이하면 클러스터링 없이 개별 마커 표시
+CLUSTER_MIN_POINTS = 500
+
+# 마지막으로 계산한 클러스터 (같은 가게 데이터면 재사용)
+_cluster_cache: Dict[int, Dict[int, pd.DataFrame]] = {}
+
+
+def project_to_world(lat, lon) -> tuple:
+    """위경도를 0~1 범위의 웹 메르카토르 좌표로 변환"""
+    lat = np.clip(np.asarray(lat, dtype=float), -85.05112878, 85.05112878)
+    lon = np.asarray(lon, dtype=float)
+
+    x = (lon + 180.0) / 360.0
+    sin_lat = np.sin(np.radians(lat))
+    y = 0.5 - np.log((1 + sin_lat) / (1 - sin_lat)) / (4 * np.pi)
+    return x, y
+
+
+def build_marker_clusters(
+    df_restaurants: pd.DataFrame,
+    zoom_levels: Iterable[int] = CLUSTER_ZOOM_LEVELS,
+    cell_px: int = CLUSTER_CELL_PX
+) -> Dict[int, pd.DataFrame]:
+    """
+    줌 레벨별 격자 클러스터 사전 계산
+
+    Args:
+        df_restaurants: load_restaurants() 결과 (lat, lon 포함)
+        zoom_levels: 계산할 줌 레벨 목록
+        cell_px: 격자 한 칸의 화면 크기 (픽셀)
+
+    Returns:
+        {줌 레벨: 클러스터 DataFrame} 딕셔너리
+        (lat, lon, count, review_sum, review_mean, top_restaurant, top_chef, top_category)
+    """
+    df = df_restaurants.dropna(subset=['lat', 'lon']).copy()
+    if len(df) == 0:
+        return {}
+
+    if 'review_count' in df.columns:
+        df['review_count'] = pd.to_numeric(df['review_count'], errors='coerce').fillna(0)
+    else:
+        df['review_count'] = 0
+    for col in ['chief_info', 'category']:
+        if col not in df.columns:
+            df[col] = 'N/A'
+
+    # 투영은 한 번만 계산하고 줌 레벨마다 격자 크기만 바꿔서 재사용
+    world_x, world_y = project_to_world(df['lat'].values, df['lon'].values)
+
+    # 리뷰 수 많은 가게가 대표 가게가 되도록 미리 정렬
+    order = np.argsort(-df['review_count'].values, kind='stable')
+    df = df.iloc[order].reset_index(drop=True)
+    world_x, world_y = world_x[order], world_y[order]
+
+    clusters = {}
+    for zoom in zoom_levels:
+        cells_per_axis = TILE_SIZE * (2 ** zoom) / cell_px
+        df['cell_x'] = np.floor(world_x * cells_per_axis).astype(np.int64)
+        df['cell_y'] = np.floor(world_y * cells_per_axis).astype(np.int64)
+
+        grouped = df.groupby(['cell_x', 'cell_y'], sort=False).agg(
+            lat=('lat', 'mean'),
+            lon=('lon', 'mean'),
+            count=('restaurant', 'size'),
+            review_sum=('review_count', 'sum'),
+            review_mean=('review_count', 'mean'),
+            top_restaurant=('restaurant', 'first'),
+            top_chef=('chief_info', 'first'),
+            top_category=('category', 'first')
+        ).reset_index(drop=True)
+
+        clusters[zoom] = grouped
+
+    return clusters
+
+
+def get_marker_clusters(df_restaurants: pd.DataFrame) -> Dict[int, pd.DataFrame]:
+    """가게 데이터가 같으면 이전에 계산한 클러스터 재사용"""
+    cols = [c for c in ['restaurant', 'lat', 'lon', 'review_count'] if c in df_restaurants.columns]
+    key = int(pd.util.hash_pandas_object(df_restaurants[cols], index=False).sum())
+
+    if key not in _cluster_cache:
+        _cluster_cache.clear()
+        _cluster_cache[key] = build_marker_clusters(df_restaurants)
+    return _cluster_cache[key]
+
+
+def create_cluster_trace(
+    clusters: pd.DataFrame,
+    name: str = '★ 흑백요리사 출연 가게',
+    showlegend: Optional[bool] = None
+) -> go.Scattermapbox:
+    """클러스터 DataFrame을 지도 마커 레이어로 변환"""
+    counts = clusters['count'].values
+    is_single = counts == 1
+
+    # 호버 텍스트 (단일 가게는 기존 마커와 같은 형식, 클러스터는 집계 통계)
+    single_text = (
+        "<b>★ " + clusters['top_restaurant'].astype(str) + "</b><br>"
+        + "👨‍🍳 셰프: " + clusters['top_chef'].astype(str) + "<br>"
+        + "🍽️ 카테고리: " + clusters['top_category'].astype(str) + "<br>"
+        + "📝 리뷰수: " + clusters['review_sum'].astype(int).astype(str)
+    )
+    cluster_text = (
+        "<b>★ 가게 " + clusters['count'].astype(str) + "곳</b><br>"
+        + "📝 총 리뷰수: " + clusters['review_sum'].astype(int).map('{:,}'.format) + "<br>"
+        + "📊 평균 리뷰수: " + clusters['review_mean'].round(1).astype(str) + "<br>"
+        + "🏆 대표 가게: " + clusters['top_restaurant'].astype(str)
+    )
+    hover_text = np.where(is_single, single_text, cluster_text)
+    label = np.where(is_single, '★', clusters['count'].astype(str))
+
+    # 가게 수에 따라 마커 크기 증가 (로그 스케일)
+    sizes = 10 + 6 * np.log2(counts)
+
+    return go.Scattermapbox(
+        lat=clusters['lat'],
+        lon=clusters['lon'],
+        mode='markers+text',
+        marker=dict(size=sizes, color='#999999', opacity=0.85),
+        text=label,
+        textfont=dict(size=11, color='white'),
+        textposition='middle center',
+        hovertext=hover_text,
+        hoverinfo='text',
+        name=name,
+        showlegend=showlegend
+    )
+
+
+def pick_cluster_level(clusters: Dict[int, pd.DataFrame], zoom: float) -> pd.DataFrame:
+    """지도 줌에 가장 가까운 (작거나 같은) 사전 계산 레벨 선택"""
+    levels = sorted(clusters)
+    candidates = [z for z in levels if z <= zoom]
+    return clusters[candidates[-1] if candidates else levels[0]]
@@ -415,6 +415,15 @@ from data_processor import (
     get_daily_population_by_district,
     BROADCAST_DATES
 )
+from marker_clustering import (
+    CLUSTER_MIN_POINTS,
+    MAP_ZOOM,
+    get_marker_clusters,
+    pick_cluster_level,
+    create_cluster_trace
+)
+from figure_cache import cached_figure
+from shared_cache import shared_cached
 
 # 서울시 자치구 GeoJSON URL
 SEOUL_GU_GEOJSON_URL = "https://raw.githubusercontent.com/southkorea/seoul-maps/master/kostat/2013/json/seoul_municipalities_geo_simple.json"
@@ -431,6 +440,7 @@ GU_NAME_MAPPING = {
 }
 
 
+@shared_cached('geojson')
 def load_seoul_geojson() -> dict:
     """서울시 자치구 GeoJSON 로드"""
     try:
@@ -448,6 +458,62 @@ def load_seoul_geojson() -> dict:
         raise
 
 
+def add_restaurant_markers(
+    fig: go.Figure,
+    df_restaurants: pd.DataFrame,
+    zoom: float = MAP_ZOOM,
+    showlegend: Optional[bool] = None
+) -> go.Figure:
+    """
+    지도에 ★ 가게 마커 레이어 추가
+
+    가게 수가 CLUSTER_MIN_POINTS 이하면 개별 마커를, 그보다 많으면
+    줌 레벨별로 미리 계산한 격자 클러스터 마커를 표시합니다.
+    """
+    if df_restaurants is None or len(df_restaurants) == 0:
+        return fig
+
+    df_rest = df_restaurants.dropna(subset=['lat', 'lon']).copy()
+
+    if len(df_rest) > CLUSTER_MIN_POINTS:
+        clusters = pick_cluster_level(get_marker_clusters(df_rest), zoom)
+        fig.add_trace(create_cluster_trace(clusters, showlegend=showlegend))
+        return fig
+
+    # 가게 호버 텍스트 생성
+    df_rest['hover_text'] = df_rest.apply(
+        lambda row: (
+            f"<b>★ {row['restaurant']}</b><br>"
+            f"👨‍🍳 셰프: {row.get('chief_info', 'N/A')}<br>"
+            f"🍽️ 카테고리: {row.get('category', 'N/A')}<br>"
+            f"📝 리뷰수: {row.get('review_count', 'N/A')}"
+        ),
+        axis=1
+    )
+
+    # 마커 레이어 추가 - 연한 회색 원형 마커
+    fig.add_trace(go.Scattermapbox(
+        lat=df_rest['lat'],
+        lon=df_rest['lon'],
+        mode='markers+text',
+        marker=dict(
+            size=10,
+            color='#cccccc',  # 연한 회색
+            opacity=0.9
+        ),
+        text=['★'] * len(df_rest),
+        textfont=dict(size=12, color='white'),
+        textposition='middle center',
+        hovertext=df_rest['hover_text'],
+        hoverinfo='text',
+        name='★ 흑백요리사 출연 가게',
+        showlegend=showlegend
+    ))
+
+    return fig
+
+
+@cached_figure
 def create_animated_population_map(
     df_daily_pop: pd.DataFrame,
     df_restaurants: pd.DataFrame,
@@ -493,7 +559,7 @@ def create_animated_population_map(
         animation_frame='date_str',
         mapbox_style='carto-positron',
         center={'lat': 37.5665, 'lon': 126.9780},
-        zoom=10,
+        zoom=MAP_ZOOM,
         opacity=0.8,
         color_continuous_scale=[[0, '#0000FF'], [0.5, '#FFFFFF'], [1, '#FF0000']],  # 파랑-흰색-빨강
         labels={'population': '유동인구', 'district': '자치구'},
@@ -501,37 +567,7 @@ def create_animated_population_map(
     )
     
     # ★ 가게 마커 추가
-    if df_restaurants is not None and len(df_restaurants) > 0:
-        # 가게 호버 텍스트 생성
-        df_rest = df_restaurants.dropna(subset=['lat', 'lon']).copy()
-        df_rest['hover_text'] = df_rest.apply(
-            lambda row: (
-                f"<b>★ {row['restaurant']}</b><br>"
-                f"👨‍🍳 셰프: {row.get('chief_info', 'N/A')}<br>"
-                f"🍽️ 카테고리: {row.get('category', 'N/A')}<br>"
-                f"📝 리뷰수: {row.get('review_count', 'N/A')}"
-            ),
-            axis=1
-        )
-        
-        # 마커 레이어 추가 - 연한 회색 원형 마커
-        fig.add_trace(go.Scattermapbox(
-            lat=df_rest['lat'],
-            lon=df_rest['lon'],
-            mode='markers+text',
-            marker=dict(
-                size=10,
-                color='#cccccc',  # 연한 회색
-                opacity=0.9
-            ),
-            text=['★'] * len(df_rest),
-            textfont=dict(size=12, color='white'),
-            textposition='middle center',
-            hovertext=df_rest['hover_text'],
-            hoverinfo='text',
-            name='★ 흑백요리사 출연 가게',
-            showlegend=True
-        ))
+    add_restaurant_markers(fig, df_restaurants, showlegend=True)
     
     # 레이아웃 업데이트
     fig.update_layout(
@@ -572,6 +608,7 @@ def create_animated_population_map(
     return fig
 
 
+@cached_figure
 def create_static_choropleth(
     df_pop: pd.DataFrame,
     df_restaurants: pd.DataFrame,
@@ -610,7 +647,7 @@ def create_static_choropleth(
         color='population',
         mapbox_style='carto-positron',
         center={'lat': 37.5665, 'lon': 126.9780},
-        zoom=10,
+        zoom=MAP_ZOOM,
         opacity=0.8,
         color_continuous_scale=[[0, '#0000FF'], [0.5, '#FFFFFF'], [1, '#FF0000']],
         labels={'population': '유동인구', 'district': '자치구'},
@@ -618,36 +655,14 @@ def create_static_choropleth(
     )
     
     # 가게 마커 추가
-    if df_restaurants is not None and len(df_restaurants) > 0:
-        df_rest = df_restaurants.dropna(subset=['lat', 'lon']).copy()
-        df_rest['hover_text'] = df_rest.apply(
-            lambda row: (
-                f"<b>★ {row['restaurant']}</b><br>"
-                f"👨‍🍳 셰프: {row.get('chief_info', 'N/A')}<br>"
-                f"🍽️ 카테고리: {row.get('category', 'N/A')}<br>"
-                f"📝 리뷰수: {row.get('review_count', 'N/A')}"
-            ),
-            axis=1
-        )
-        
-        fig.add_trace(go.Scattermapbox(
-            lat=df_rest['lat'],
-            lon=df_rest['lon'],
-            mode='markers+text',
-            marker=dict(size=10, color='#cccccc', opacity=0.9),
-            text=['★'] * len(df_rest),
-            textfont=dict(size=12, color='white'),
-            textposition='middle center',
-            hovertext=df_rest['hover_text'],
-            hoverinfo='text',
-            name='★ 흑백요리사 출연 가게'
-        ))
+    add_restaurant_markers(fig, df_restaurants)
     
     fig.update_layout(height=700, margin=dict(l=0, r=0, t=50, b=0))
     
     return fig
 
 
+@cached_figure
 def create_broadcast_comparison_map(
     df_pop: pd.DataFrame,
     df_restaurants: pd.DataFrame,
@@ -704,7 +719,7 @@ def create_broadcast_comparison_map(
         color='change_rate',
         mapbox_style='carto-positron',
         center={'lat': 37.5665, 'lon': 126.9780},
-        zoom=10,
+        zoom=MAP_ZOOM,
         opacity=0.85,
         color_continuous_scale=[[0, '#0000FF'], [0.5, '#FFFFFF'], [1, '#FF0000']],
         range_color=[-50, 50],  # -50% ~ +50% 범위 고정
@@ -713,30 +728,7 @@ def create_broadcast_comparison_map(
     )
     
     # 가게 마커 추가
-    if df_restaurants is not None and len(df_restaurants) > 0:
-        df_rest = df_restaurants.dropna(subset=['lat', 'lon']).copy()
-        df_rest['hover_text'] = df_rest.apply(
-            lambda row: (
-                f"<b>★ {row['restaurant']}</b><br>"
-                f"👨‍🍳 셰프: {row.get('chief_info', 'N/A')}<br>"
-                f"🍽️ 카테고리: {row.get('category', 'N/A')}<br>"
-                f"📝 리뷰수: {row.get('review_count', 'N/A')}"
-            ),
-            axis=1
-        )
-        
-        fig.add_trace(go.Scattermapbox(
-            lat=df_rest['lat'],
-            lon=df_rest['lon'],
-            mode='markers+text',
-            marker=dict(size=10, color='#cccccc', opacity=0.9),
-            text=['★'] * len(df_rest),
-            textfont=dict(size=12, color='white'),
-            textposition='middle center',
-            hovertext=df_rest['hover_text'],
-            hoverinfo='text',
-            name='★ 흑백요리사 출연 가게'
-        ))
+    add_restaurant_markers(fig, df_restaurants)
     
     fig.update_layout(height=700, margin=dict(l=0, r=0, t=50, b=0))
     
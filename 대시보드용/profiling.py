@@ -0,0 +1,224 @@
+"""
+흑백요리사2 대시보드 - 구간별 프로파일링 모듈 (선택 사항)
+
+데이터 로드 / 계산 / 그래프 생성 구간마다 실행 시간, 처리 행 수, 캐시 적중 여부를 기록해
+사이드바 패널에 표시하고 로컬 JSONL 로그에 남깁니다.
+환경변수 DASHBOARD_PROFILE=1 이거나 사이드바에서 켰을 때만 기록합니다.
+st.fragment 구간만 다시 실행될 때는 profile_fragment로 감싼 fragment가 자체 기록을 남깁니다.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Optional
+
+# 프로파일링 로그 파일
+PROFILE_LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'profile.jsonl')
+# 기본값으로 켜기 위한 환경변수
+PROFILE_ENV = 'DASHBOARD_PROFILE'
+
+# Streamlit 세션(스크립트 실행 스레드)별 기록
+# (캐시 적중/미스 횟수도 스레드별로 세어 다른 세션의 캐시 이벤트가 섞이지 않도록 함)
+_local = threading.local()
+# fragment만 다시 실행될 때 사용할 프로파일링 설정 (session_state 키)
+PROFILE_STATE_KEY = '_profiling_settings'
+
+
+def profiling_default() -> bool:
+    """환경변수로 프로파일링이 켜져 있는지"""
+    return os.environ.get(PROFILE_ENV, '') not in ('', '0', 'false', 'False')
+
+
+def start_profiling(app_name: str, enabled: bool):
+    """rerun 시작 시 호출 - 이번 실행의 기록 초기화"""
+    _local.app = app_name
+    _local.enabled = enabled
+    _local.records = []
+    _local.run_id = datetime.now().isoformat(timespec='milliseconds')
+    _local.full_run = True
+    state = _session_state()
+    if state is not None:
+        state[PROFILE_STATE_KEY] = (app_name, enabled)
+
+
+def _session_state():
+    """Streamlit session_state (Streamlit 밖에서 실행 중이면 None)"""
+    try:
+        import streamlit as st
+        return st.session_state
+    except Exception:
+        return None
+
+
+def _cache_stats() -> Counter:
+    """현재 스레드의 캐시 적중/미스 누적 횟수"""
+    stats = getattr(_local, 'cache_stats', None)
+    if stats is None:
+        stats = _local.cache_stats = Counter()
+    return stats
+
+
+def is_profiling() -> bool:
+    return getattr(_local, 'enabled', False)
+
+
+def record_cache_event(hit: bool):
+    """캐시 모듈에서 적중/미스 발생 시 호출"""
+    _cache_stats()['hit' if hit else 'miss'] += 1
+
+
+def mark_cache_miss(func: Callable) -> Callable:
+    """
+    st.cache_data 아래에 붙이는 데코레이터 (본문이 실행됨 = 캐시 미스)
+
+    사용 예:
+        @profiled('리뷰 로드', cached=True)
+        @st.cache_data(ttl=300)
+        @mark_cache_miss
+        def load_review_data(): ...
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        record_cache_event(False)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def count_rows(result) -> Optional[int]:
+    """결과의 행 수 (DataFrame이면 len, 튜플이면 DataFrame 행 수 합계)"""
+    if hasattr(result, 'shape') and len(getattr(result, 'shape', ())) >= 1:
+        return int(result.shape[0])
+    if isinstance(result, (tuple, list)):
+        counts = [count_rows(item) for item in result]
+        counts = [c for c in counts if c is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+@contextmanager
+def profile_section(name: str, rows: Optional[int] = None, cached: bool = False):
+    """
+    구간 실행 시간 측정 (프로파일링이 꺼져 있으면 아무것도 하지 않음)
+
+    사용 예:
+        with profile_section('히트맵 생성') as rec:
+            fig = create_review_heatmap(...)
+            rec['rows'] = len(review_changes)
+    """
+    record = {'section': name, 'rows': rows}
+    if not is_profiling():
+        yield record
+        return
+
+    stats = _cache_stats()
+    before = stats.copy()
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record['wall_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        delta = stats - before
+        if delta['miss']:
+            record['cache'] = 'miss'
+        elif delta['hit'] or cached:
+            record['cache'] = 'hit'
+        else:
+            record['cache'] = '-'
+        _local.records.append(record)
+
+
+def profiled(name: Optional[str] = None, cached: bool = False) -> Callable:
+    """함수 전체를 profile_section으로 감싸는 데코레이터 (반환값으로 행 수 자동 계산)"""
+    def decorator(func: Callable) -> Callable:
+        section = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_profiling():
+                return func(*args, **kwargs)
+            with profile_section(section, cached=cached) as record:
+                result = func(*args, **kwargs)
+                if record['rows'] is None:
+                    record['rows'] = count_rows(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def write_profile_log(path: str = PROFILE_LOG_PATH):
+    """이번 실행 기록을 JSONL 로그에 추가"""
+    records = getattr(_local, 'records', [])
+    if not records:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            for record in records:
+                line = dict(record, app=_local.app, run=_local.run_id)
+                f.write(json.dumps(line, ensure_ascii=False) + '\n')
+    except OSError as e:
+        print(f"⚠️ 프로파일링 로그 저장 실패: {e}")
+
+
+def _render_records(container, title: str, expanded: bool):
+    """container(사이드바 또는 fragment 본문)의 expander에 이번 실행 기록 표시"""
+    import pandas as pd
+    import streamlit as st
+
+    records = _local.records
+    with container.expander(title, expanded=expanded):
+        if not records:
+            st.caption("기록된 구간이 없습니다.")
+            return
+        df = pd.DataFrame(records)[['section', 'wall_ms', 'rows', 'cache']]
+        df.columns = ['구간', '시간 (ms)', '행 수', '캐시']
+        st.dataframe(df, hide_index=True, use_container_width=True)
+        st.caption(f"합계 {df['시간 (ms)'].sum():,.0f} ms · 로그: {os.path.relpath(PROFILE_LOG_PATH)}")
+
+
+def render_profiling_panel():
+    """사이드바에 이번 실행의 구간별 기록 표시 + 로그 저장 (main() 마지막에 호출)"""
+    _local.full_run = False
+    if not is_profiling():
+        return
+    import streamlit as st
+
+    _render_records(st.sidebar, "⏱️ 구간별 실행 시간", expanded=True)
+    write_profile_log()
+
+
+def profile_fragment(fragment: Callable) -> Callable:
+    """
+    st.fragment 데코레이터를 감싸 fragment만 다시 실행될 때(위젯 조작)도 기록
+
+    전체 rerun 중에는 main()의 기록에 이어 붙이고, fragment 단독 rerun이면
+    session_state에 저장된 설정으로 기록을 새로 시작해 fragment 안에 표시합니다.
+    (fragment는 사이드바에 쓸 수 없으므로 fragment 본문 아래에 표시)
+
+    사용 예:
+        fragment = profile_fragment(st.fragment)
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            if getattr(_local, 'full_run', False):
+                return func(*args, **kwargs)
+
+            state = _session_state()
+            app_name, enabled = (state.get(PROFILE_STATE_KEY) if state is not None else None) or ('', False)
+            start_profiling(app_name, enabled)
+            _local.full_run = False
+            try:
+                with profile_section(f"fragment: {func.__name__}"):
+                    return func(*args, **kwargs)
+            finally:
+                if is_profiling():
+                    import streamlit as st
+                    _render_records(st, "⏱️ 부분 실행 시간", expanded=False)
+                    write_profile_log()
+        return fragment(body)
+    return decorator
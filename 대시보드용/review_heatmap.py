@@ -1,12 +1,14 @@
 """
 흑백요리사2 대시보드 - 리뷰 히트맵 시각화 모듈
 """
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Optional
+from typing import List, Optional, Tuple
 import sys
 import os
+from collections import OrderedDict
 
 # 모듈 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -16,24 +18,139 @@ from data_processor import (
     calculate_review_changes,
     BROADCAST_DATES
 )
+from figure_cache import cached_figure
 
+# 클러스터링 행 순서 캐시 (데이터 지문 + 옵션 -> 가게명 순서, 최근 사용 순 LRU)
+ROW_ORDER_CACHE_SIZE = 16
+_row_order_cache: "OrderedDict[Tuple, List[str]]" = OrderedDict()
 
+
+def get_restaurant_labels(restaurants: pd.Index, df_restaurants: Optional[pd.DataFrame] = None) -> pd.Index:
+    """가게명을 '셰프 (가게명)' 형태의 히트맵 행 라벨로 변환"""
+    if df_restaurants is None:
+        return restaurants
+    chef_map = df_restaurants.set_index('restaurant')['chief_info'].to_dict()
+    return restaurants.map(
+        lambda x: f"{chef_map.get(x, '')} ({x})" if chef_map.get(x) else x
+    )
+
+
+def rank_heatmap_restaurants(
+    df_changes: pd.DataFrame,
+    df_restaurants: Optional[pd.DataFrame] = None,
+    min_reviews: int = 3,
+    search: Optional[str] = None
+) -> pd.Series:
+    """
+    히트맵 표시 대상 가게를 활동량(방영 전후 리뷰 수 합계) 순으로 정렬
+
+    Args:
+        df_changes: calculate_review_changes() 결과
+        df_restaurants: 가게 정보 (셰프명 검색용)
+        min_reviews: 최소 리뷰 수 필터
+        search: 가게명/셰프명 검색어 (부분 일치)
+
+    Returns:
+        가게명 인덱스, 활동량 값의 Series (활동량 내림차순)
+    """
+    totals = (df_changes['before_count'] + df_changes['after_count']).groupby(df_changes['restaurant']).sum()
+    totals = totals[totals >= min_reviews]
+
+    if search:
+        labels = pd.Series(get_restaurant_labels(totals.index, df_restaurants), index=totals.index)
+        totals = totals[labels.str.contains(search, case=False, regex=False)]
+
+    return totals.sort_values(ascending=False, kind='stable')
+
+
+def compute_cluster_row_order(
+    df_changes: pd.DataFrame,
+    value_column: str = 'change_rate',
+    min_reviews: int = 3,
+    clip_range: tuple = (-100, 150)
+) -> List[str]:
+    """
+    회차별 변화 벡터의 계층적 군집화(ward)로 히트맵 행 순서 계산
+
+    scipy의 ward 연결은 nearest-neighbor chain 알고리즘(O(n²))으로 계산됩니다.
+    같은 데이터/옵션이면 캐시된 순서를 재사용하므로 검색·페이지 이동 시 재계산하지 않습니다.
+
+    Args:
+        df_changes: calculate_review_changes() 결과
+        value_column: 군집화 기준 값 ('change_rate' 또는 'change_count')
+        min_reviews: 최소 리뷰 수 필터
+        clip_range: 증가율 클리핑 범위
+
+    Returns:
+        덴드로그램 잎 순서대로 정렬한 가게명 리스트
+    """
+    from scipy.cluster.hierarchy import linkage, leaves_list
+
+    cols = ['restaurant', 'episode', 'before_count', 'after_count', value_column]
+    fingerprint = int(pd.util.hash_pandas_object(df_changes[cols], index=False).sum())
+    key = (fingerprint, value_column, min_reviews, tuple(clip_range))
+    if key in _row_order_cache:
+        _row_order_cache.move_to_end(key)
+        return _row_order_cache[key]
+
+    ranked = rank_heatmap_restaurants(df_changes, min_reviews=min_reviews)
+    df = df_changes[df_changes['restaurant'].isin(ranked.index)]
+    values = df[value_column]
+    if value_column == 'change_rate':
+        values = values.clip(clip_range[0], clip_range[1])
+
+    vectors = (
+        df.assign(value=values)
+        .pivot(index='restaurant', columns='episode', values='value')
+        .reindex(ranked.index)
+        .fillna(0)
+    )
+
+    if len(vectors) < 3:
+        order = list(vectors.index)
+    else:
+        Z = linkage(vectors.values, method='ward')
+        order = list(vectors.index[leaves_list(Z)])
+
+    _row_order_cache[key] = order
+    while len(_row_order_cache) > ROW_ORDER_CACHE_SIZE:
+        _row_order_cache.popitem(last=False)
+    return order
+
+
+@cached_figure
 def create_review_heatmap(
     df_changes: pd.DataFrame,
     df_restaurants: Optional[pd.DataFrame] = None,
     value_column: str = 'change_rate',
     title: str = '흑백요리사2 방영일별 리뷰 변화 히트맵',
     min_reviews: int = 3,  # 최소 리뷰 수 필터
-    clip_range: tuple = (-100, 150)  # 증가율 클리핑 범위
+    clip_range: tuple = (-100, 150),  # 증가율 클리핑 범위
+    page_size: Optional[int] = None,  # 페이지당 가게 수 (None이면 전체)
+    page: int = 1,
+    search: Optional[str] = None,  # 가게명/셰프명 검색어
+    row_order: str = 'default'  # 'default' 또는 'cluster' (반응 패턴별 군집 순서)
 ) -> go.Figure:
-    """리뷰 변화 히트맵 생성"""
-    # 최소 리뷰 수 필터링
-    df_filtered = df_changes.copy()
-    df_filtered['total_reviews'] = df_filtered['before_count'] + df_filtered['after_count']
-    
-    valid_restaurants = df_filtered.groupby('restaurant')['total_reviews'].sum()
-    valid_restaurants = valid_restaurants[valid_restaurants >= min_reviews].index.tolist()
-    df_filtered = df_filtered[df_filtered['restaurant'].isin(valid_restaurants)]
+    """리뷰 변화 히트맵 생성
+
+    page_size를 지정하면 활동량 상위 순으로 정렬한 뒤 해당 페이지의 가게만 그립니다.
+    (가게가 수천 개여도 figure 크기와 텍스트 라벨 수가 페이지 크기로 제한됨)
+    row_order='cluster'이면 비슷한 회차별 반응을 보인 가게끼리 모아서 정렬합니다.
+    """
+    # 최소 리뷰 수 + 검색어 필터링
+    ranked = rank_heatmap_restaurants(df_changes, df_restaurants, min_reviews, search)
+
+    if row_order == 'cluster':
+        cluster_order = compute_cluster_row_order(df_changes, value_column, min_reviews, clip_range)
+        ranked = ranked.reindex([r for r in cluster_order if r in ranked.index])
+
+    if page_size:
+        start = (max(page, 1) - 1) * page_size
+        visible_restaurants = ranked.index[start:start + page_size]
+    else:
+        visible_restaurants = ranked.index
+
+    df_filtered = df_changes[df_changes['restaurant'].isin(visible_restaurants)].copy()
     
     if len(df_filtered) == 0:
         fig = go.Figure()
@@ -47,13 +164,16 @@ def create_review_heatmap(
         df_filtered['value'] = df_filtered[value_column]
     
     pivot = df_filtered.pivot(index='restaurant', columns='episode', values='value')
+
+    # 페이지/군집 모드에서는 정렬 순서 유지
+    if page_size or row_order == 'cluster':
+        pivot = pivot.reindex(visible_restaurants)
+    if page_size:
+        total_pages = max(1, -(-len(ranked) // page_size))
+        title = f"{title} ({max(page, 1)}/{total_pages} 페이지)"
     
     # 셰프 정보 매핑
-    if df_restaurants is not None:
-        chef_map = df_restaurants.set_index('restaurant')['chief_info'].to_dict()
-        pivot.index = pivot.index.map(
-            lambda x: f"{chef_map.get(x, '')} ({x})" if chef_map.get(x) else x
-        )
+    pivot.index = get_restaurant_labels(pivot.index, df_restaurants)
     
     # 컬럼명 변경
     episode_labels = [f"{i}회 ({bd[5:]})" for i, bd in enumerate(BROADCAST_DATES, 1)]
@@ -62,17 +182,22 @@ def create_review_heatmap(
     
     # 히트맵 생성 - RdBu 색상으로 명확하게
     # 표시 형식 결정 (증가율이면 %, 증가 수면 개수)
+    # 텍스트 라벨은 보이는 행만 벡터 연산으로 생성
+    # 빈 값(NaN/inf) 셀은 라벨 없이 표시 (정수 변환 시 쓰레기 값 방지)
+    values = pivot.values.astype(float)
+    finite = np.isfinite(values)
+    int_labels = np.where(finite, np.where(finite, values, 0).astype(int).astype(str), '')
     if value_column == 'change_rate':
-        text_display = [[f"{int(v)}%" for v in row] for row in pivot.values]
+        text_display = np.where(finite, np.char.add(int_labels, '%'), '')
         hover_template = '<b>%{y}</b><br>%{x}: %{z:.1f}%<extra></extra>'
         colorbar_title = '증가율 (%)'
         colorbar_tickvals = [-100, -50, 0, 50, 100, 150]
         colorbar_ticktext = ['-100%', '-50%', '0%', '+50%', '+100%', '+150%']
     else:
-        text_display = [[f"{int(v)}" for v in row] for row in pivot.values]
+        text_display = int_labels
         hover_template = '<b>%{y}</b><br>%{x}: %{z:.0f}개<extra></extra>'
         colorbar_title = '증가 수 (개)'
-        max_count = int(pivot.values.max())
+        max_count = int(values[finite].max()) if finite.any() else 0
         colorbar_tickvals = [0, max_count//2, max_count]
         colorbar_ticktext = ['0', f'{max_count//2}', f'{max_count}']
 
@@ -112,6 +237,7 @@ def create_review_heatmap(
 
 
 
+@cached_figure
 def create_review_bar_chart(
     df_changes: pd.DataFrame,
     selected_restaurant: str = None
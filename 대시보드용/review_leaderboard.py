@@ -0,0 +1,290 @@
+"""
+흑백요리사2 대시보드 - 리뷰 증가율 리더보드 모듈
+
+회차별/전체 리뷰 증가율 순위를 힙으로 유지합니다.
+스크래퍼에서 새 리뷰가 들어오면 해당 가게의 점수만 갱신하고,
+TOP N 조회는 갱신이 없으면 캐시된 결과를 그대로 돌려줍니다.
+"""
+import heapq
+import threading
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+import os
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from data_processor import BROADCAST_DATES, get_period_range
+
+# 전체(회차 평균) 순위 키
+OVERALL = None
+# 로컬 리뷰 행 키 (load_reviews()의 중복 제거 기준과 같음)
+REVIEW_KEY_COLUMNS = ['restaurant', 'reviewer', 'review_date']
+
+
+def calc_change_rate(before_count: int, after_count: int) -> float:
+    """calculate_review_changes()와 같은 증가율 공식 (0으로 나누기 방지)"""
+    if before_count > 0:
+        return ((after_count - before_count) / before_count) * 100
+    return 100.0 if after_count > 0 else 0.0
+
+
+class ReviewLeaderboard:
+    """
+    회차별 + 전체 리뷰 증가율 TOP N 리더보드
+
+    - 점수가 바뀌면 힙에 새 항목만 추가하고, 예전 항목은 조회할 때 버립니다 (lazy invalidation)
+    - 조회 결과는 해당 순위표가 바뀔 때까지 캐시되어 다시 조회하면 O(K)
+    - 동점은 get_top_restaurants_by_change(nlargest/nsmallest)처럼 원래 행 순서가 앞선 가게 우선
+    - st.cache_resource로 세션 간 공유되므로 힙을 건드리는 조회/갱신은 잠금 안에서 실행
+    - 대시보드는 프로세스당 1개를 두고 reset()으로 처음 구성한 뒤 새 리뷰 행만
+      add_reviews()/sync_reviews()로 반영
+    """
+
+    def __init__(self, broadcast_dates: List[str] = BROADCAST_DATES):
+        self.broadcast_dates = list(broadcast_dates)
+        self.episodes = list(range(1, len(self.broadcast_dates) + 1))
+        self.periods = [get_period_range(bd) for bd in self.broadcast_dates]
+        self._lock = threading.Lock()
+        # reset()에 넘긴 데이터 버전 (워터마크 폴링 등에서 다시 구성할지 판단용)
+        self.source_key: Any = None
+        self._clear()
+
+    def _clear(self):
+        # (가게, 회차) -> [방영 전 리뷰 수, 방영 후 리뷰 수]
+        self.counts: Dict[Tuple[str, int], List[int]] = {}
+        # 순위표(회차 또는 OVERALL) -> {가게: 증가율}
+        self.scores: Dict[Optional[int], Dict[str, float]] = {ep: {} for ep in self.episodes + [OVERALL]}
+        # 순위표 -> {가게: 동점 순서} (회차는 calculate_review_changes 행 순서, 전체는 가게명 순서)
+        self._seq: Dict[Optional[int], Dict[str, Any]] = {board: {} for board in self.scores}
+        self._next_seq = 0
+        # 순위표 -> (최대 힙, 최소 힙), 항목은 (정렬 키, 동점 순서, 가게명)
+        self._heaps = {board: ([], []) for board in self.scores}
+        # (순위표, N, 오름차순 여부) -> 조회 결과
+        self._top_cache: Dict[Tuple, pd.DataFrame] = {}
+        # sync_reviews()로 반영한 로컬 리뷰 행 키
+        self._review_keys: Optional[pd.MultiIndex] = None
+
+    @classmethod
+    def from_changes(cls, df_changes: pd.DataFrame) -> 'ReviewLeaderboard':
+        """calculate_review_changes() 결과로 리더보드 생성"""
+        board = cls()
+        board.reset(df_changes)
+        return board
+
+    def reset(self, df_changes: pd.DataFrame, source_key: Any = None):
+        """calculate_review_changes() 결과로 다시 구성 (처음 로드, 기존 행이 바뀌거나 지워졌을 때)"""
+        with self._lock:
+            self._load_changes(df_changes)
+            self.source_key = source_key
+
+    def _load_changes(self, df_changes: pd.DataFrame):
+        self._clear()
+        if df_changes.empty:
+            return
+        for seq, row in enumerate(df_changes[['restaurant', 'episode', 'before_count', 'after_count']].itertuples(index=False)):
+            self.counts[(row.restaurant, int(row.episode))] = [int(row.before_count), int(row.after_count)]
+            self._seq[int(row.episode)].setdefault(row.restaurant, seq)
+        self._next_seq = len(df_changes)
+
+        # 초기 적재는 점수만 계산한 뒤 heapify로 한 번에 구성
+        for restaurant in df_changes['restaurant'].unique():
+            self._refresh(restaurant, self.episodes, push=False)
+        for key in self.scores:
+            self._rebuild(key)
+
+    def add_review(self, restaurant: str, review_date, count: int = 1) -> List[int]:
+        """
+        새 리뷰 반영 (count: 행 1개가 나타내는 리뷰 수, Supabase review_count)
+
+        Returns:
+            점수가 바뀐 회차 목록
+        """
+        review_date = pd.to_datetime(review_date)
+        with self._lock:
+            return self._add_review(restaurant, review_date, int(count))
+
+    def _add_review(self, restaurant: str, review_date: pd.Timestamp, count: int = 1) -> List[int]:
+        # 처음 보는 가게는 calculate_review_changes()처럼 모든 회차에 0건으로 들어감
+        is_new = restaurant not in self.scores[OVERALL]
+        changed = []
+        for ep, (before_start, before_end, after_start, after_end) in zip(self.episodes, self.periods):
+            counts = self.counts.setdefault((restaurant, ep), [0, 0])
+            if before_start <= review_date <= before_end:
+                counts[0] += count
+                changed.append(ep)
+            elif after_start <= review_date <= after_end:
+                counts[1] += count
+                changed.append(ep)
+
+        if changed or is_new:
+            self._refresh(restaurant, self.episodes if is_new else changed)
+        return changed
+
+    def add_reviews(
+        self,
+        df_reviews: pd.DataFrame,
+        restaurant_col: str = 'restaurant',
+        date_col: str = 'review_date',
+        count_col: Optional[str] = None
+    ) -> int:
+        """
+        새로 들어온 리뷰 행 여러 건 반영 (한 번의 잠금 안에서 처리)
+
+        Args:
+            restaurant_col, date_col: 가게/날짜 컬럼 (Supabase 행은 restaurant_name, collected_at)
+            count_col: 행별 리뷰 수 컬럼 (없으면 행 1개 = 리뷰 1건)
+
+        Returns:
+            점수가 바뀐 행 수
+        """
+        with self._lock:
+            return self._add_rows(df_reviews, restaurant_col, date_col, count_col)
+
+    def _add_rows(self, df_reviews: pd.DataFrame, restaurant_col: str, date_col: str,
+                  count_col: Optional[str]) -> int:
+        if df_reviews.empty:
+            return 0
+        restaurants = df_reviews[restaurant_col].tolist()
+        dates = pd.to_datetime(df_reviews[date_col]).tolist()
+        counts = df_reviews[count_col].fillna(0).astype(int).tolist() if count_col else [1] * len(dates)
+        updated = 0
+        for restaurant, review_date, count in zip(restaurants, dates, counts):
+            if self._add_review(restaurant, review_date, count):
+                updated += 1
+        return updated
+
+    def sync_reviews(self, df_reviews: pd.DataFrame, df_changes: pd.DataFrame,
+                     key_columns: List[str] = REVIEW_KEY_COLUMNS) -> int:
+        """
+        로컬 리뷰 파일을 다시 읽었을 때 호출 - 이전에 반영한 행이 그대로 있으면 새 행만 반영하고,
+        처음이거나 행이 지워졌으면 df_changes로 다시 구성
+
+        Returns:
+            새로 반영한 행 수 (다시 구성했으면 0)
+        """
+        with self._lock:
+            if df_reviews.empty:
+                self._load_changes(df_changes)
+                return 0
+            keys = pd.MultiIndex.from_frame(df_reviews[key_columns])
+            if self._review_keys is None or not self._review_keys.isin(keys).all():
+                self._load_changes(df_changes)
+                self._review_keys = keys
+                return 0
+            new_rows = df_reviews[~keys.isin(self._review_keys)]
+            self._add_rows(new_rows, 'restaurant', 'review_date', None)
+            self._review_keys = keys
+            return len(new_rows)
+
+    def _refresh(self, restaurant: str, episodes: List[int], push: bool = True):
+        """가게의 회차별/전체 점수 재계산 후 힙에 새 항목 추가"""
+        for ep in episodes:
+            before_count, after_count = self.counts.get((restaurant, ep), (0, 0))
+            self._set_score(ep, restaurant, calc_change_rate(before_count, after_count), push)
+
+        # 전체 순위는 회차별 증가율 평균 (get_top_restaurants_by_change와 동일)
+        rates = [self.scores[ep].get(restaurant, 0.0) for ep in self.episodes]
+        self._set_score(OVERALL, restaurant, sum(rates) / len(rates), push)
+
+    def _tie_order(self, board: Optional[int], restaurant: str) -> Any:
+        """동점 순서 (전체 순위는 groupby 결과처럼 가게명 순, 새 가게는 기존 행 뒤)"""
+        if board is OVERALL:
+            return restaurant
+        seq = self._seq[board]
+        if restaurant not in seq:
+            seq[restaurant] = self._next_seq
+            self._next_seq += 1
+        return seq[restaurant]
+
+    def _set_score(self, board: Optional[int], restaurant: str, score: float, push: bool = True):
+        if self.scores[board].get(restaurant) == score:
+            return
+        self.scores[board][restaurant] = score
+        if not push:
+            return
+
+        max_heap, min_heap = self._heaps[board]
+        order = self._tie_order(board, restaurant)
+        heapq.heappush(max_heap, (-score, order, restaurant))
+        heapq.heappush(min_heap, (score, order, restaurant))
+
+        # 버려진 항목이 너무 많아지면 힙 재구성
+        if len(max_heap) > 2 * len(self.scores[board]) + 64:
+            self._rebuild(board)
+
+        self._top_cache = {k: v for k, v in self._top_cache.items() if k[0] != board}
+
+    def _rebuild(self, board: Optional[int]):
+        items = [(name, score, self._tie_order(board, name)) for name, score in self.scores[board].items()]
+        max_heap = [(-score, order, name) for name, score, order in items]
+        min_heap = [(score, order, name) for name, score, order in items]
+        heapq.heapify(max_heap)
+        heapq.heapify(min_heap)
+        self._heaps[board] = (max_heap, min_heap)
+
+    def _pop_top(self, board: Optional[int], top_n: int, ascending: bool) -> List[str]:
+        """유효한 항목만 top_n개 꺼낸 뒤 다시 넣기"""
+        heap = self._heaps[board][1 if ascending else 0]
+        scores = self.scores[board]
+        valid, names, seen = [], [], set()
+
+        while heap and len(names) < top_n:
+            key, order, name = heapq.heappop(heap)
+            score = key if ascending else -key
+            if scores.get(name) != score or name in seen:
+                continue  # 예전 점수 항목은 버림
+            valid.append((key, order, name))
+            names.append(name)
+            seen.add(name)
+
+        for item in valid:
+            heapq.heappush(heap, item)
+        return names
+
+    def top(self, top_n: int = 10, episode: Optional[int] = None, ascending: bool = False) -> pd.DataFrame:
+        """
+        리뷰 증가율 상위/하위 가게 조회 (get_top_restaurants_by_change와 같은 컬럼)
+
+        Args:
+            top_n: 상위/하위 N개
+            episode: 특정 회차 (None이면 전체 평균)
+            ascending: True면 하위, False면 상위
+        """
+        with self._lock:
+            return self._top(top_n, episode, ascending)
+
+    def _top(self, top_n: int, episode: Optional[int], ascending: bool) -> pd.DataFrame:
+        cache_key = (episode, top_n, ascending)
+        if cache_key in self._top_cache:
+            return self._top_cache[cache_key].copy()
+
+        names = self._pop_top(episode, top_n, ascending)
+        if episode:
+            rows = []
+            for name in names:
+                before_count, after_count = self.counts[(name, episode)]
+                rows.append({
+                    'restaurant': name,
+                    'episode': episode,
+                    'broadcast_date': self.broadcast_dates[episode - 1],
+                    'before_count': before_count,
+                    'after_count': after_count,
+                    'change_count': after_count - before_count,
+                    'change_rate': self.scores[episode][name]
+                })
+        else:
+            rows = [{
+                'restaurant': name,
+                'change_rate': self.scores[OVERALL][name],
+                'change_count': sum(
+                    self.counts.get((name, ep), (0, 0))[1] - self.counts.get((name, ep), (0, 0))[0]
+                    for ep in self.episodes
+                )
+            } for name in names]
+
+        columns = (['restaurant', 'episode', 'broadcast_date', 'before_count', 'after_count', 'change_count', 'change_rate']
+                   if episode else ['restaurant', 'change_rate', 'change_count'])
+        result = pd.DataFrame(rows, columns=columns)
+        self._top_cache[cache_key] = result
+        return result.copy()
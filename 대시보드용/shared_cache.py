@@ -0,0 +1,203 @@
+"""
+흑백요리사2 대시보드 - 프로세스 간 공유 캐시 모듈
+
+st.cache_data / st.cache_resource는 프로세스별 캐시라서 Streamlit 워커(레플리카)를 여러 개 띄우면
+워커마다 CSV를 다시 읽고 GeoJSON을 다시 받아오고 집계를 다시 계산합니다.
+같은 호스트의 워커들이 로컬 SQLite 파일 하나를 공유하고, 키별 파일 잠금으로
+한 프로세스만 계산하게 합니다 (나머지 프로세스는 잠금이 풀리면 저장된 결과를 읽음).
+"""
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+import sys
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from profiling import record_cache_event
+
+# 캐시 폴더 (환경변수로 변경 가능, 같은 호스트의 워커들이 같은 경로를 써야 함)
+SHARED_CACHE_DIR = os.environ.get(
+    'DASHBOARD_SHARED_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.shared_cache')
+)
+SHARED_CACHE_DB = os.path.join(SHARED_CACHE_DIR, 'cache.sqlite')
+# DASHBOARD_SHARED_CACHE=0 이면 공유 캐시 사용 안 함
+SHARED_CACHE_ENABLED = os.environ.get('DASHBOARD_SHARED_CACHE', '1') not in ('0', 'false', 'False')
+# 다른 프로세스의 계산을 기다리는 최대 시간 (초), 넘으면 직접 계산
+LOCK_TIMEOUT = 120
+
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(SHARED_CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(SHARED_CACHE_DB, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')  # 읽기와 쓰기가 서로 막지 않도록
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS cache ('
+        'key TEXT PRIMARY KEY, name TEXT, version TEXT, created REAL, value BLOB)'
+    )
+    return conn
+
+
+@contextmanager
+def file_lock(key: str, timeout: float = LOCK_TIMEOUT):
+    """키별 프로세스 간 잠금 (timeout 안에 못 얻으면 잠금 없이 진행, trend_store 반영에도 사용)"""
+    lock_dir = os.path.join(SHARED_CACHE_DIR, 'locks')
+    try:
+        os.makedirs(lock_dir, exist_ok=True)
+        f = open(os.path.join(lock_dir, f'{key}.lock'), 'a+b')
+    except OSError as e:
+        print(f"⚠️ 공유 캐시 잠금 파일 생성 실패: {e}")
+        yield
+        return
+    with f:
+        acquired = False
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                acquired = True
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    print(f"⚠️ 공유 캐시 잠금 대기 시간 초과: {key}")
+                    break
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            if acquired:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read(key: str, ttl: Optional[float]):
+    """저장된 값 조회 (없거나 만료됐으면 (False, None))"""
+    conn = _connect()
+    try:
+        row = conn.execute('SELECT created, value FROM cache WHERE key = ?', (key,)).fetchone()
+    finally:
+        conn.close()
+    if row is None or (ttl is not None and time.time() - row[0] > ttl):
+        return False, None
+    return True, pickle.loads(row[1])
+
+
+def _safe_read(name: str, key: str, ttl: Optional[float]):
+    """_read()와 같지만 캐시 파일 문제는 경고만 출력하고 미스로 처리"""
+    try:
+        return _read(key, ttl)
+    except (sqlite3.Error, OSError, pickle.UnpicklingError, EOFError) as e:
+        print(f"⚠️ 공유 캐시 조회 실패 ({name}): {e}")
+        return False, None
+
+
+def _write(key: str, name: str, version: str, value: Any, ttl: Optional[float]):
+    """값 저장 + 같은 이름의 예전 버전/만료 항목 삭제"""
+    blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    now = time.time()
+    conn = _connect()
+    try:
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO cache (key, name, version, created, value) VALUES (?, ?, ?, ?, ?)',
+                (key, name, version, now, sqlite3.Binary(blob))
+            )
+            conn.execute('DELETE FROM cache WHERE name = ? AND version != ?', (name, version))
+            if ttl is not None:
+                conn.execute('DELETE FROM cache WHERE name = ? AND created < ?', (name, now - ttl))
+    finally:
+        conn.close()
+
+
+def shared_cached(
+    name: str,
+    version: Optional[Callable[[], Any]] = None,
+    ttl: Optional[float] = None,
+    cache_empty: bool = False
+) -> Callable:
+    """
+    호스트 단위 공유 캐시 데코레이터
+
+    사용 예:
+        @shared_cached('reviews', version=get_data_version)
+        def load_reviews(): ...
+
+        @shared_cached('supabase', ttl=300)
+        def fetch_from_supabase(table, ...): ...
+
+    Args:
+        name: 캐시 이름 (같은 이름의 예전 버전 항목은 새 값 저장 시 삭제)
+        version: 데이터 버전 함수 (파일 수정 시각 등, 값이 바뀌면 다시 계산)
+        ttl: 유효 시간 (초, None이면 버전이 바뀔 때까지)
+        cache_empty: 빈 DataFrame도 저장할지 (조회 실패 시 빈 결과가 공유되지 않도록 기본 False)
+
+    반환값은 매번 새로 역직렬화되므로 호출한 쪽에서 수정해도 됩니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not SHARED_CACHE_ENABLED:
+                return func(*args, **kwargs)
+
+            version_key = repr(version()) if version is not None else ''
+            raw_key = '|'.join([name, func.__name__, repr(args), repr(sorted(kwargs.items())), version_key])
+            key = hashlib.sha1(raw_key.encode('utf-8')).hexdigest()
+
+            found, value = _safe_read(name, key, ttl)
+            if found:
+                record_cache_event(True)
+                return value
+
+            with file_lock(key):
+                # 잠금을 기다리는 동안 다른 프로세스가 계산했을 수 있음
+                found, value = _safe_read(name, key, ttl)
+                if found:
+                    record_cache_event(True)
+                    return value
+
+                record_cache_event(False)
+                value = func(*args, **kwargs)
+                if cache_empty or not getattr(value, 'empty', False):
+                    try:
+                        _write(key, name, version_key, value, ttl)
+                    except (sqlite3.Error, OSError, pickle.PickleError, TypeError, AttributeError) as e:
+                        print(f"⚠️ 공유 캐시 저장 실패 ({name}): {e}")
+                return value
+        return wrapper
+    return decorator
+
+
+def clear_shared_cache(name: Optional[str] = None):
+    """공유 캐시 삭제 (name이 없으면 전체) - 모든 워커에 적용됨"""
+    if not os.path.exists(SHARED_CACHE_DB):
+        return
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                if name is None:
+                    conn.execute('DELETE FROM cache')
+                else:
+                    conn.execute('DELETE FROM cache WHERE name = ?', (name,))
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"⚠️ 공유 캐시 삭제 실패: {e}")
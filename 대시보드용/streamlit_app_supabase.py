@@ -16,20 +16,43 @@ from supabase_data_loader import (
     load_restaurants_from_supabase,
     calculate_review_changes_supabase,
     get_daily_population_supabase,
+    fetch_watermark,
+    fetch_rows_after,
+    normalize_reviews,
+    append_reviews,
+    append_population,
     BROADCAST_DATES,
     SUPABASE_URL
 )
 from review_heatmap import (
     create_review_heatmap,
     create_review_bar_chart,
-    get_top_restaurants_by_change
+    rank_heatmap_restaurants
 )
+from review_leaderboard import ReviewLeaderboard
 from population_animated_map import (
     load_seoul_geojson,
     create_animated_population_map,
     create_broadcast_comparison_map,
     create_static_choropleth
 )
+from shared_cache import clear_shared_cache
+from live_refresher import REFRESH_INTERVAL, WatermarkRefresher
+from change_feed import DATABASE_URL, ChangeFeedListener, LiveTable, change_feed_available
+from profiling import (
+    profiled,
+    mark_cache_miss,
+    profiling_default,
+    start_profiling,
+    render_profiling_panel
+)
+
+# 히트맵 한 페이지에 표시할 가게 수
+HEATMAP_PAGE_SIZE = 50
+# 자동 새로고침 시 화면에서 새 데이터 여부를 확인하는 주기 (초, 네트워크 조회 없음)
+UPDATE_CHECK_SECONDS = 10
+# 가게 정보 CSV (load_restaurants_from_supabase와 같은 경로)
+RESTAURANT_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '캐치테이블_가게정보.csv')
 
 # 페이지 설정
 st.set_page_config(
@@ -70,9 +93,16 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data(ttl=300)  # 5분마다 캐시 갱신
-def load_review_data():
-    """리뷰 데이터 로드 (5분 캐시)"""
+@profiled('리뷰 로드 + 변화 계산', cached=True)
+@st.cache_data(ttl=3600, max_entries=2)  # 워터마크가 바뀔 때만 다시 로드
+@mark_cache_miss
+def load_review_data(watermark: str):
+    """리뷰 데이터 로드 (watermark: 캐시 키, 새 리뷰가 들어오면 값이 바뀜)"""
+    return read_review_data()
+
+
+def read_review_data():
+    """리뷰 + 방영일별 변화 (캐시 없음)"""
     reviews = load_reviews_from_supabase()
     if reviews.empty:
         return pd.DataFrame(), pd.DataFrame()
@@ -80,9 +110,16 @@ def load_review_data():
     return reviews, changes
 
 
-@st.cache_data(ttl=300)  # 5분마다 캐시 갱신
-def load_population_data():
-    """유동인구 데이터 로드 (5분 캐시)"""
+@profiled('유동인구 로드 + 일별 집계', cached=True)
+@st.cache_data(ttl=3600, max_entries=2)  # 워터마크가 바뀔 때만 다시 로드
+@mark_cache_miss
+def load_population_data(watermark: str):
+    """유동인구 데이터 로드 (watermark: 캐시 키, 새 데이터가 들어오면 값이 바뀜)"""
+    return read_population_data()
+
+
+def read_population_data():
+    """유동인구 + 일별 집계 (캐시 없음)"""
     population = load_population_from_supabase()
     if population.empty:
         return pd.DataFrame(), pd.DataFrame()
@@ -90,12 +127,92 @@ def load_population_data():
     return population, daily_pop
 
 
-@st.cache_data(ttl=3600)  # 1시간 캐시
-def load_restaurant_data():
-    """가게 정보 로드 (1시간 캐시)"""
+@profiled('가게 정보 로드', cached=True)
+@st.cache_data(ttl=3600, max_entries=2)  # CSV가 바뀔 때만 다시 로드
+@mark_cache_miss
+def load_restaurant_data(watermark: str):
+    """가게 정보 로드 (watermark: 캐시 키, CSV 수정 시각)"""
     return load_restaurants_from_supabase()
 
 
+@st.cache_resource
+def get_review_leaderboard():
+    """
+    프로세스 공용 리뷰 증가율 리더보드
+    변경 알림을 구독 중이면 새 리뷰 행만 반영하고, 워터마크 폴링이면 리뷰가 바뀔 때 다시 구성
+    """
+    return ReviewLeaderboard()
+
+
+def file_watermark(path: str):
+    """로컬 파일 워터마크 (수정 시각, 없으면 None)"""
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+def on_data_changed(changed):
+    """Supabase 데이터가 바뀌면 공유 조회 캐시(5분)를 비워 바로 새 데이터를 받게 함"""
+    if 'reviews' in changed or 'population' in changed:
+        clear_shared_cache('supabase')
+
+
+@st.cache_resource
+def get_change_feed():
+    """
+    Postgres 변경 알림 구독 (SUPABASE_DB_URL + psycopg2가 있을 때만, 없으면 None)
+    INSERT 알림이 오면 새 행만 가져와 프로세스 메모리의 리뷰 변화/일별 유동인구에 이어 붙임
+    """
+    if not change_feed_available():
+        return None
+    feed = ChangeFeedListener(DATABASE_URL)
+    # 전체 다시 로드 전에 공유 조회 캐시(fetch_from_supabase)를 비워 예전 행을 다시 쓰지 않도록 함
+    clear_supabase_cache = lambda: clear_shared_cache('supabase')
+    # 리더보드는 전체 로드 때 다시 구성하고, INSERT 알림으로 들어온 새 행만 이어서 반영
+    leaderboard = get_review_leaderboard()
+    feed.attach(LiveTable('catchtable_reviews', read_review_data, fetch_rows_after, append_reviews,
+                          invalidate=clear_supabase_cache,
+                          on_load=lambda rows, changes: leaderboard.reset(changes),
+                          on_append=lambda new_rows: leaderboard.add_reviews(
+                              normalize_reviews(new_rows), 'restaurant_name', 'collected_at', 'review_count')))
+    feed.attach(LiveTable('seoul_floating_population', read_population_data, fetch_rows_after, append_population,
+                          invalidate=clear_supabase_cache))
+    feed.start()
+    return feed
+
+
+@st.cache_resource
+def get_refresher():
+    """
+    서버 프로세스당 1개의 백그라운드 워터마크 폴링 스레드
+    (리뷰/유동인구는 가장 최근 id만 조회, 가게 정보는 CSV 수정 시각)
+    변경 알림을 구독 중이면 리뷰/유동인구 워터마크는 메모리의 갱신 횟수라 조회 비용이 없음
+    """
+    refresher = WatermarkRefresher()
+    feed = get_change_feed()
+    if feed is not None:
+        refresher.register('reviews', lambda: feed.tables['catchtable_reviews'].version)
+        refresher.register('population', lambda: feed.tables['seoul_floating_population'].version)
+        # 알림을 반영하자마자 워터마크 갱신 (폴링 주기를 기다리지 않음)
+        feed.on_applied(lambda tables: refresher.check_now())
+    else:
+        refresher.register('reviews', lambda: fetch_watermark('catchtable_reviews'))
+        refresher.register('population', lambda: fetch_watermark('seoul_floating_population'))
+    refresher.register('restaurants', lambda: file_watermark(RESTAURANT_CSV))
+    refresher.on_change(on_data_changed)
+    refresher.start()
+    return refresher
+
+
+def watch_for_updates(refresher, seen):
+    """새 데이터가 감지되면 전체 화면 새로고침 (바뀐 데이터셋만 다시 로드됨)"""
+    if refresher.snapshot() != seen:
+        st.rerun()
+
+
+# st.fragment(run_every)가 있으면 확인 함수만 주기적으로 다시 실행
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+auto_watch_for_updates = _fragment(run_every=UPDATE_CHECK_SECONDS)(watch_for_updates) if _fragment else None
+
+
 @st.cache_resource
 def get_geojson():
     """GeoJSON 로드 (영구 캐시)"""
@@ -103,6 +220,8 @@ def get_geojson():
 
 
 def main():
+    start_profiling('streamlit_app_supabase', st.sidebar.checkbox("⏱️ 프로파일링", value=profiling_default()))
+
     # 헤더
     col_title, col_badge = st.columns([4, 1])
     with col_title:
@@ -110,7 +229,7 @@ def main():
     with col_badge:
         st.markdown('<span class="live-badge">🔴 LIVE (Supabase)</span>', unsafe_allow_html=True)
     
-    st.markdown('<p class="sub-header">실시간 Supabase 데이터 연동 | 자동 새로고침 (5분)</p>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">실시간 Supabase 데이터 연동 | 새 데이터 자동 반영 (1분)</p>', unsafe_allow_html=True)
     
     # 연결 상태 확인
     if not SUPABASE_URL:
@@ -122,11 +241,21 @@ SUPABASE_KEY=eyJxxxxx...
         """)
         return
     
-    # 데이터 로드
+    # 데이터 로드 (변경 알림 구독 중이면 증분 반영된 메모리 데이터, 아니면 워터마크가 바뀐 데이터셋만 다시 로드)
+    feed = get_change_feed()
+    refresher = get_refresher()
+    seen = refresher.snapshot()
     with st.spinner("Supabase에서 데이터 로드 중..."):
-        reviews, review_changes = load_review_data()
-        population, daily_pop = load_population_data()
-        restaurants = load_restaurant_data()
+        if feed is not None:
+            reviews, review_changes = feed.tables['catchtable_reviews'].get()
+            population, daily_pop = feed.tables['seoul_floating_population'].get()
+        else:
+            reviews, review_changes = load_review_data(seen['reviews'])
+            leaderboard = get_review_leaderboard()
+            if leaderboard.source_key != seen['reviews']:
+                leaderboard.reset(review_changes, source_key=seen['reviews'])
+            population, daily_pop = load_population_data(seen['population'])
+        restaurants = load_restaurant_data(seen['restaurants'])
         geojson = get_geojson()
     
     # 데이터 상태 표시
@@ -159,15 +288,22 @@ SUPABASE_KEY=eyJxxxxx...
         index=0
     )
     
-    # 새로고침 버튼
+    # 새로고침 버튼 (대시보드 데이터셋만 다시 로드, 다른 캐시는 유지)
     if st.sidebar.button("🔄 데이터 새로고침"):
-        st.cache_data.clear()
+        refresher.force_refresh()  # on_data_changed에서 공유 조회 캐시도 비움
+        if feed is not None:
+            for live_table in feed.tables.values():
+                live_table.reload()
         st.rerun()
     
     # 자동 새로고침 설정
-    auto_refresh = st.sidebar.checkbox("⏰ 자동 새로고침 (5분)", value=False)
+    auto_refresh = st.sidebar.checkbox("⏰ 자동 새로고침 (새 데이터 감지 시)", value=False)
     if auto_refresh:
-        st.sidebar.info("5분마다 자동으로 새로고침됩니다.")
+        st.sidebar.info("새 데이터가 들어오면 1분 안에 자동으로 반영됩니다.")
+    if feed is not None:
+        st.sidebar.caption("🟢 변경 알림 구독 중" if feed.connected else "🟡 변경 알림 재연결 중")
+    if refresher.last_checked is not None:
+        st.sidebar.caption(f"마지막 확인: {refresher.last_checked.strftime('%H:%M:%S')}")
     
     # 탭 구성
     tab1, tab2, tab3 = st.tabs([
@@ -190,16 +326,38 @@ SUPABASE_KEY=eyJxxxxx...
                 horizontal=True
             )
             
+            row_order = st.radio(
+                "행 정렬",
+                options=['default', 'cluster'],
+                format_func=lambda x: '활동량/가게명 순' if x == 'default' else '반응 패턴 군집 순',
+                horizontal=True
+            )
+
+            # 가게 검색 + 페이지 선택 (가게가 많으면 활동량 순으로 나눠서 표시)
+            col_search, col_page = st.columns([3, 1])
+            with col_search:
+                heatmap_search = st.text_input("🔍 가게/셰프 검색")
+            n_rows = len(rank_heatmap_restaurants(review_changes, restaurants, search=heatmap_search))
+            total_pages = max(1, -(-n_rows // HEATMAP_PAGE_SIZE))
+            with col_page:
+                heatmap_page = st.number_input(
+                    f"페이지 (총 {total_pages})", min_value=1, max_value=total_pages, value=1
+                )
+
             fig_heatmap = create_review_heatmap(
                 review_changes, 
                 restaurants,
-                value_column=value_option
+                value_column=value_option,
+                page_size=HEATMAP_PAGE_SIZE if n_rows > HEATMAP_PAGE_SIZE else None,
+                page=int(heatmap_page),
+                search=heatmap_search,
+                row_order=row_order
             )
             st.plotly_chart(fig_heatmap, use_container_width=True)
             
             # TOP 10
             st.subheader("🏆 리뷰 증가율 TOP 10")
-            top10 = get_top_restaurants_by_change(review_changes, episode=selected_episode, top_n=10)
+            top10 = get_review_leaderboard().top(10, episode=selected_episode)
             if not top10.empty:
                 st.dataframe(
                     top10[['restaurant', 'change_rate', 'before_count', 'after_count']].rename(columns={
@@ -304,11 +462,17 @@ SUPABASE_KEY=eyJxxxxx...
     </div>
     """, unsafe_allow_html=True)
     
-    # 자동 새로고침 (5분)
+    render_profiling_panel()
+
+    # 자동 새로고침 (새 데이터 감지 시)
     if auto_refresh:
-        import time
-        time.sleep(300)  # 5분
-        st.rerun()
+        if auto_watch_for_updates is not None:
+            auto_watch_for_updates(refresher, seen)
+        else:
+            # 구버전 Streamlit: 잠시 기다렸다가 새 데이터가 있으면 새로고침
+            import time
+            time.sleep(REFRESH_INTERVAL)
+            watch_for_updates(refresher, seen)
 
 
 if __name__ == '__main__':
@@ -7,8 +7,13 @@ import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import os
+import sys
 from dotenv import load_dotenv
 
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from shared_cache import shared_cached
+
 # .env 파일에서 환경변수 로드
 load_dotenv()
 
@@ -35,6 +40,7 @@ def get_supabase_headers():
     }
 
 
+@shared_cached('supabase', ttl=300)  # 워커 간 공유, 5분마다 갱신
 def fetch_from_supabase(table: str, select: str = "*", filters: dict = None, limit: int = None) -> pd.DataFrame:
     """
     Supabase에서 데이터 조회
@@ -66,20 +72,62 @@ def fetch_from_supabase(table: str, select: str = "*", filters: dict = None, lim
         return pd.DataFrame()
 
 
-def load_reviews_from_supabase() -> pd.DataFrame:
-    """Supabase에서 리뷰 데이터 로드"""
-    df = fetch_from_supabase("catchtable_reviews")
-    
+def fetch_watermark(table: str, column: str = "id"):
+    """
+    테이블 워터마크 조회 (column 기준 가장 최근 값 1개, 캐시 없음)
+
+    PK/인덱스 컬럼 하나만 정렬해서 1행만 가져오므로 전체 조회보다 훨씬 가볍습니다.
+    조회 실패 시 예외를 그대로 올려 호출한 쪽에서 기존 데이터를 유지하게 합니다.
+    """
+    url = f"{SUPABASE_URL}/rest/v1/{table}"
+    params = {"select": column, "order": f"{column}.desc", "limit": 1}
+    response = requests.get(url, headers=get_supabase_headers(), params=params, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+    return data[0][column] if data else None
+
+
+def fetch_rows_after(table: str, after_id, column: str = "id", page_size: int = 1000) -> pd.DataFrame:
+    """
+    column 값이 after_id보다 큰 행만 조회 (증분 반영용, 캐시 없음)
+
+    column 오름차순으로 page_size씩 끝까지 가져옵니다.
+    조회 실패 시 예외를 그대로 올려 호출한 쪽에서 기존 데이터를 유지하게 합니다.
+    """
+    url = f"{SUPABASE_URL}/rest/v1/{table}"
+    frames = []
+    while True:
+        params = {"select": "*", "order": f"{column}.asc", "limit": page_size}
+        if after_id is not None:
+            params[column] = f"gt.{after_id}"
+        response = requests.get(url, headers=get_supabase_headers(), params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        if not data:
+            break
+        frames.append(pd.DataFrame(data))
+        after_id = data[-1][column]
+        if len(data) < page_size:
+            break
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def normalize_reviews(df: pd.DataFrame) -> pd.DataFrame:
+    """리뷰 테이블 행 정리 (날짜 변환)"""
     if df.empty:
         return df
     
-    # 날짜 변환
     df['collected_at'] = pd.to_datetime(df['collected_at'])
     df['review_date'] = df['collected_at'].dt.date
     
     return df
 
 
+def load_reviews_from_supabase() -> pd.DataFrame:
+    """Supabase에서 리뷰 데이터 로드"""
+    return normalize_reviews(fetch_from_supabase("catchtable_reviews"))
+
+
 def load_population_from_supabase(start_date: str = None, end_date: str = None) -> pd.DataFrame:
     """Supabase에서 유동인구 데이터 로드"""
     filters = {}
@@ -89,8 +137,11 @@ def load_population_from_supabase(start_date: str = None, end_date: str = None)
     if end_date:
         filters["sensing_time"] = f"lte.{end_date}"
     
-    df = fetch_from_supabase("seoul_floating_population", filters=filters)
-    
+    return normalize_population(fetch_from_supabase("seoul_floating_population", filters=filters))
+
+
+def normalize_population(df: pd.DataFrame) -> pd.DataFrame:
+    """유동인구 테이블 행 정리 (컬럼명 통일 + 날짜 변환)"""
     if df.empty:
         return df
     
@@ -197,6 +248,47 @@ def get_daily_population_supabase(df_pop: pd.DataFrame) -> pd.DataFrame:
     return daily_pop
 
 
+def append_reviews(df_reviews: pd.DataFrame, df_changes: pd.DataFrame, new_rows: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    새로 들어온 리뷰 행을 이어 붙이고 해당 가게의 방영일별 변화만 다시 계산
+    
+    기존 DataFrame은 수정하지 않고 새 DataFrame을 반환합니다 (화면에서 읽는 중인 데이터 보호).
+    """
+    new_rows = normalize_reviews(new_rows)
+    if new_rows.empty:
+        return df_reviews, df_changes
+    
+    reviews = pd.concat([df_reviews, new_rows], ignore_index=True)
+    affected = new_rows['restaurant_name'].unique()
+    updated = calculate_review_changes_supabase(reviews[reviews['restaurant_name'].isin(affected)])
+    
+    if df_changes.empty:
+        return reviews, updated
+    unchanged = df_changes[~df_changes['restaurant'].isin(affected)]
+    return reviews, pd.concat([unchanged, updated], ignore_index=True)
+
+
+def append_population(df_pop: pd.DataFrame, daily_pop: pd.DataFrame, new_rows: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    새로 들어온 유동인구 행을 이어 붙이고 일별 합계에 더함
+    
+    기존 DataFrame은 수정하지 않고 새 DataFrame을 반환합니다 (화면에서 읽는 중인 데이터 보호).
+    """
+    new_rows = normalize_population(new_rows)
+    if new_rows.empty:
+        return df_pop, daily_pop
+    
+    population = pd.concat([df_pop, new_rows], ignore_index=True)
+    new_daily = get_daily_population_supabase(new_rows)
+    if daily_pop.empty:
+        return population, new_daily
+    
+    # 합계는 더하기만 하면 되므로 새 행의 (날짜, 자치구) 합계만 기존 합계에 더함
+    merged = pd.concat([daily_pop, new_daily], ignore_index=True)
+    merged = merged.groupby(['date', 'district'], as_index=False)['population'].sum()
+    return population, merged
+
+
 
 def load_chef_survival_results_from_supabase() -> pd.DataFrame:
     """Supabase에서 셰프 서바이벌 결과 데이터 로드"""
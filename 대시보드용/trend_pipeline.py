@@ -0,0 +1,391 @@
+"""
+흑백요리사2 대시보드 - 트렌드 파이프라인 증분 빌드 모듈
+
+트렌드 원본 파일 -> 저장소 반영(ingest) -> long-format 변환(long) -> Supabase 업로드(upload)
+단계를 make처럼 실행합니다.
+
+- 단계마다 입력(원본 파일 목록 또는 앞 단계 출력)의 해시를 기록하고, 입력이 바뀐 단계만 다시 실행
+- 앞 단계를 다시 실행했어도 출력 내용 해시가 같으면 뒤 단계는 건너뜀
+- 단계 사이에는 Arrow 테이블을 메모리로 넘기고, 다음 실행을 위해 Arrow(Feather) 파일로만 캐시
+  (merge_trends.py -> merged_trends.csv -> reshape_to_long.py -> CSV 다시 읽기 왕복 없음)
+- 업로드는 지난번 업로드한 행과 비교해 새 행/바뀐 행만 보냄 (iterrows 없이 레코드 목록으로 일괄 변환)
+
+사용법:
+    python 대시보드용/trend_pipeline.py                  # 바뀐 단계만 실행 (업로드 포함)
+    python 대시보드용/trend_pipeline.py long             # long 단계까지만
+    python 대시보드용/trend_pipeline.py --force          # 전체 다시 실행
+    python 대시보드용/trend_pipeline.py --mark-uploaded  # 이미 Supabase에 있는 데이터를 업로드한 것으로 기록
+
+chief_trend_value에는 이미 데이터가 있고 고유 키가 없어서, 업로드 기록이 없는 첫 실행은
+업로드하지 않고 멈춥니다. 처음 한 번은 --mark-uploaded로 현재 데이터를 기준으로 기록하세요.
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from data_processor import DATA_DIR
+from trend_store import (
+    TREND_SOURCE_DIR,
+    TREND_STORE_DIR,
+    ingest_trends,
+    trend_source_fingerprint,
+    trend_store_parts
+)
+
+# 단계 상태/출력 캐시 폴더
+PIPELINE_DIR = os.path.join(DATA_DIR, 'trend_pipeline')
+STATE_FILE = 'state.json'
+# artifact_bundle._load_local_trend()가 읽는 long-format CSV
+TREND_LONG_CSV = os.path.join(DATA_DIR, '흑백요리사트렌드추이', 'merged_trends_long.csv')
+# 저장소 소스 이름 -> Supabase chief_trend_value 소스 이름
+SUPABASE_SOURCES = {'Naver': 'datalab', 'Google': 'google', 'YouTube': 'youtube'}
+# 저장소 셰프 이름 -> Supabase 셰프 이름 (다른 것만, 업로드할 때만 바꿈 - CSV는 저장소 이름 유지)
+SUPABASE_CHEF_NAMES = {'윤준모': '윤주모'}
+TREND_KEY_COLUMNS = ['날짜', '출연자', '소스']
+# 업로드할 소스 (datalab은 collect_trend_data.py가 네이버 API로 직접 저장)
+UPLOAD_SOURCES = ['google', 'youtube']
+UPLOAD_BATCH_SIZE = 100
+
+
+class StageIncomplete(Exception):
+    """단계가 일부만 끝남 (output까지는 기록하고 다음 실행 때 다시 시도)"""
+
+    def __init__(self, message: str, output: pa.Table):
+        super().__init__(message)
+        self.output = output
+
+
+def table_hash(table: pa.Table) -> str:
+    """테이블 내용 해시 (컬럼 이름 + 값, 청크 구성과 무관)"""
+    df = table.to_pandas()
+    digest = hashlib.sha1(json.dumps(list(df.columns), ensure_ascii=False).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+class StagePipeline:
+    """
+    입력 해시 기반 증분 단계 실행기
+
+    사용 예:
+        pipeline = StagePipeline(PIPELINE_DIR)
+        pipeline.add('ingest', run_ingest, version=lambda: trend_source_fingerprint(source_dir))
+        pipeline.add('long', to_long, deps=['ingest'], outputs=[TREND_LONG_CSV])
+        pipeline.run()
+
+    Args (add):
+        func: 단계 함수, func(*입력 단계 출력 테이블) -> pa.Table
+              (incremental=True면 previous=지난번 출력 테이블도 전달)
+        deps: 입력 단계 이름 목록 (먼저 등록된 단계만)
+        version: 외부 입력 지문 함수 (원본 파일 목록 등)
+        outputs: 단계가 만드는 파일 (없어지면 다시 실행)
+    """
+
+    def __init__(self, work_dir: str = PIPELINE_DIR):
+        self.work_dir = work_dir
+        self._stages: Dict[str, Tuple[Callable, Tuple[str, ...], Optional[Callable], Tuple[str, ...], bool]] = {}
+        self.state: Dict[str, Dict] = self._load_state()
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., pa.Table],
+        deps: Iterable[str] = (),
+        version: Optional[Callable[[], Any]] = None,
+        outputs: Iterable[str] = (),
+        incremental: bool = False
+    ):
+        for dep in deps:
+            if dep not in self._stages:
+                raise KeyError(f"'{name}'의 입력 단계 '{dep}'가 등록되지 않았습니다")
+        self._stages[name] = (func, tuple(deps), version, tuple(outputs), incremental)
+
+    # === 상태/캐시 파일 ===
+    def _load_state(self) -> Dict[str, Dict]:
+        path = os.path.join(self.work_dir, STATE_FILE)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 파이프라인 상태 읽기 실패 (전체 다시 실행): {e}")
+            return {}
+
+    def _save_state(self):
+        os.makedirs(self.work_dir, exist_ok=True)
+        tmp_path = os.path.join(self.work_dir, STATE_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, os.path.join(self.work_dir, STATE_FILE))
+
+    def _cache_path(self, name: str) -> str:
+        return os.path.join(self.work_dir, f'{name}.arrow')
+
+    def _read_output(self, name: str) -> Optional[pa.Table]:
+        path = self._cache_path(name)
+        return feather.read_table(path, memory_map=True) if os.path.exists(path) else None
+
+    def _write_output(self, name: str, table: pa.Table):
+        os.makedirs(self.work_dir, exist_ok=True)
+        tmp_path = self._cache_path(name) + '.tmp'
+        feather.write_feather(table, tmp_path)
+        os.replace(tmp_path, self._cache_path(name))
+
+    # === 실행 ===
+    def _required(self, targets: Iterable[str]) -> List[str]:
+        """대상 단계 + 입력 단계 (등록 순서)"""
+        required = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self._stages:
+                raise KeyError(f"등록되지 않은 단계: {name}")
+            if name not in required:
+                required.add(name)
+                stack.extend(self._stages[name][1])
+        return [name for name in self._stages if name in required]
+
+    def _input_key(self, name: str) -> str:
+        _, deps, version, _, _ = self._stages[name]
+        key = {
+            'version': version() if version is not None else None,
+            'deps': [self.state.get(dep, {}).get('output_hash') for dep in deps]
+        }
+        return hashlib.sha1(json.dumps(key, default=str, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def run(self, targets: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, str]:
+        """
+        입력이 바뀐 단계만 실행
+
+        Returns:
+            단계 이름 -> 'ran' / 'skipped' / 'failed' / 'blocked'(입력 단계 실패)
+        """
+        results: Dict[str, str] = {}
+        tables: Dict[str, pa.Table] = {}  # 이번 실행에서 만든 출력 (메모리로 전달)
+
+        for name in self._required(targets or list(self._stages)):
+            func, deps, _, outputs, incremental = self._stages[name]
+            if any(results.get(dep) in ('failed', 'blocked') for dep in deps):
+                results[name] = 'blocked'
+                continue
+
+            input_key = self._input_key(name)
+            previous = self.state.get(name, {})
+            up_to_date = (
+                previous.get('input_key') == input_key
+                and os.path.exists(self._cache_path(name))
+                and all(os.path.exists(path) for path in outputs)
+            )
+            if up_to_date and not force:
+                results[name] = 'skipped'
+                print(f"  - {name}: 변경 없음")
+                continue
+
+            start = time.perf_counter()
+            inputs = [tables[dep] if dep in tables else self._read_output(dep) for dep in deps]
+            kwargs = {'previous': self._read_output(name)} if incremental else {}
+            try:
+                output = func(*inputs, **kwargs)
+                completed = True
+            except StageIncomplete as e:
+                print(f"⚠️ {name} 일부만 완료: {e}")
+                output, completed = e.output, False
+            except Exception as e:
+                print(f"❌ {name} 실패: {e}")
+                results[name] = 'failed'
+                continue
+
+            output_hash = table_hash(output)
+            if output_hash != previous.get('output_hash') or not os.path.exists(self._cache_path(name)):
+                self._write_output(name, output)
+            tables[name] = output
+            # 일부만 끝났으면 입력 키를 기록하지 않아 다음 실행 때 다시 시도
+            self.state[name] = {
+                'input_key': input_key if completed else None,
+                'output_hash': output_hash,
+                'rows': output.num_rows,
+                'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')
+            }
+            self._save_state()
+
+            results[name] = 'ran' if completed else 'failed'
+            changed = '' if output_hash != previous.get('output_hash') else ', 출력 동일'
+            print(f"  ✓ {name}: {output.num_rows:,}행 ({time.perf_counter() - start:.2f}초{changed})")
+        return results
+
+
+# === 트렌드 단계 ===
+def run_ingest(source_dir: str = TREND_SOURCE_DIR, store_dir: str = TREND_STORE_DIR) -> pa.Table:
+    """원본 파일 -> 저장소 (바뀐 파일만) -> 전체 long 테이블 (date, chef, source, value)"""
+    result = ingest_trends(source_dir, store_dir)
+    if result['failed']:
+        print(f"⚠️ 읽지 못한 파일: {', '.join(result['failed'])}")
+    parts = trend_store_parts(store_dir=store_dir)
+    if not parts:
+        raise ValueError(f"트렌드 파일이 없습니다: {source_dir}")
+    return pa.concat_tables([pq.read_table(path) for path in parts], promote_options='default')
+
+
+def to_supabase_long(table: pa.Table, out_csv: Optional[str] = TREND_LONG_CSV) -> pa.Table:
+    """
+    저장소 테이블 -> chief_trend_value 형식 long 테이블 (날짜, 출연자, 소스, 값)
+
+    예전 merge_trends.py(outer concat) + reshape_to_long.py(melt, NaN -> 0)와 같게
+    모든 (셰프, 소스)에 전체 날짜를 채우고, out_csv가 있으면 CSV로도 저장합니다.
+    """
+    df = table.to_pandas()
+    series = df[['chef', 'source']].drop_duplicates()
+    dates = pd.DataFrame({'date': df['date'].drop_duplicates()})
+    grid = series.merge(dates, how='cross').merge(df, on=['chef', 'source', 'date'], how='left')
+
+    long_df = pd.DataFrame({
+        '날짜': grid['date'].dt.strftime('%Y-%m-%d'),
+        '출연자': grid['chef'],
+        '소스': grid['source'].map(SUPABASE_SOURCES),
+        '값': grid['value'].fillna(0).astype('float64')
+    }).sort_values(TREND_KEY_COLUMNS).reset_index(drop=True)
+
+    if out_csv:
+        os.makedirs(os.path.dirname(out_csv), exist_ok=True)
+        long_df.to_csv(out_csv, index=False, encoding='utf-8-sig')
+    return pa.Table.from_pandas(long_df, preserve_index=False)
+
+
+def diff_trend_rows(current: pd.DataFrame, uploaded: Optional[pd.DataFrame]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """지난번 업로드한 행과 비교 -> (새 행, 값이 바뀐 행)"""
+    if uploaded is None or uploaded.empty:
+        return current, current.iloc[0:0]
+    merged = current.merge(uploaded, on=TREND_KEY_COLUMNS, how='left', suffixes=('', '_uploaded'), indicator=True)
+    new_rows = merged[merged['_merge'] == 'left_only'][current.columns]
+    changed = merged[(merged['_merge'] == 'both') & (merged['값'] != merged['값_uploaded'])][current.columns]
+    return new_rows, changed
+
+
+def upload_trends(table: pa.Table, previous: Optional[pa.Table] = None, dry_run: bool = False) -> pa.Table:
+    """
+    새 행은 일괄 POST, 값이 바뀐 행은 (날짜, 출연자, 소스) 조건으로 PATCH
+
+    비교 기준과 반환 테이블은 저장소 셰프 이름을 쓰고, Supabase로 보내는 값과 조건에만
+    SUPABASE_CHEF_NAMES를 적용합니다.
+
+    Returns:
+        Supabase에 반영된 행 테이블 (다음 실행의 비교 기준)
+    """
+    current = table.to_pandas()
+    current = current[current['소스'].isin(UPLOAD_SOURCES)].reset_index(drop=True)
+    if previous is None and not dry_run:
+        # 기준이 없으면 전체가 새 행이 되어 이미 있는 행이 중복으로 들어감
+        raise ValueError(
+            "업로드 기록이 없습니다. chief_trend_value에 이미 있는 데이터가 중복되지 않도록 "
+            "먼저 --mark-uploaded로 현재 데이터를 업로드한 것으로 기록하세요"
+        )
+    uploaded = previous.to_pandas() if previous is not None else None
+    new_rows, changed = diff_trend_rows(current, uploaded)
+    print(f"    업로드 대상: 새 행 {len(new_rows):,}개, 바뀐 행 {len(changed):,}개")
+    if dry_run or (new_rows.empty and changed.empty):
+        return pa.Table.from_pandas(current, preserve_index=False)
+
+    import requests
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_KEY")
+    if not supabase_url or not supabase_key:
+        raise ValueError(".env 파일에 SUPABASE_URL, SUPABASE_KEY가 필요합니다")
+    url = f"{supabase_url}/rest/v1/chief_trend_value"
+    headers = {
+        "apikey": supabase_key,
+        "Authorization": f"Bearer {supabase_key}",
+        "Content-Type": "application/json",
+        "Prefer": "return=minimal"
+    }
+
+    # 반영된 행만 기준에 추가 (실패한 배치는 다음 실행 때 다시 보냄)
+    done = [uploaded] if uploaded is not None else []
+    failed = 0
+    records = new_rows.assign(출연자=new_rows['출연자'].replace(SUPABASE_CHEF_NAMES)).to_dict('records')
+    for i in range(0, len(records), UPLOAD_BATCH_SIZE):
+        batch = records[i:i + UPLOAD_BATCH_SIZE]
+        try:
+            response = requests.post(url, headers=headers, json=batch, timeout=30)
+            response.raise_for_status()
+            done.append(new_rows.iloc[i:i + UPLOAD_BATCH_SIZE])
+        except Exception as e:
+            print(f"⚠️ 업로드 실패 (배치 {i // UPLOAD_BATCH_SIZE + 1}): {e}")
+            failed += len(batch)
+
+    patched = []
+    for record in changed.to_dict('records'):
+        params = {col: f"eq.{record[col]}" for col in TREND_KEY_COLUMNS}
+        params['출연자'] = f"eq.{SUPABASE_CHEF_NAMES.get(record['출연자'], record['출연자'])}"
+        try:
+            response = requests.patch(url, headers=headers, params=params, json={'값': record['값']}, timeout=30)
+            response.raise_for_status()
+            patched.append(record)
+        except Exception as e:
+            print(f"⚠️ 수정 실패 ({record['출연자']} {record['소스']} {record['날짜']}): {e}")
+            failed += 1
+
+    result = pd.concat(done, ignore_index=True) if done else current.iloc[0:0]
+    if patched:
+        patched_df = pd.DataFrame(patched, columns=current.columns)
+        result = pd.concat([result, patched_df]).drop_duplicates(TREND_KEY_COLUMNS, keep='last')
+    result = pa.Table.from_pandas(
+        result.sort_values(TREND_KEY_COLUMNS).reset_index(drop=True), preserve_index=False
+    )
+    if failed:
+        raise StageIncomplete(f"{failed:,}행 반영 실패", result)
+    return result
+
+
+def build_trend_pipeline(
+    source_dir: str = TREND_SOURCE_DIR,
+    store_dir: str = TREND_STORE_DIR,
+    out_csv: Optional[str] = TREND_LONG_CSV,
+    work_dir: str = PIPELINE_DIR,
+    mark_uploaded: bool = False
+) -> StagePipeline:
+    """트렌드 파이프라인 (ingest -> long -> upload)"""
+    pipeline = StagePipeline(work_dir)
+    pipeline.add('ingest', lambda: run_ingest(source_dir, store_dir),
+                 version=lambda: [trend_source_fingerprint(source_dir), os.path.abspath(store_dir)])
+    pipeline.add('long', lambda table: to_supabase_long(table, out_csv),
+                 deps=['ingest'], outputs=[out_csv] if out_csv else [])
+    pipeline.add('upload', lambda table, previous: upload_trends(table, previous, dry_run=mark_uploaded),
+                 deps=['long'], incremental=True)
+    return pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description='트렌드 파이프라인 증분 실행 (ingest -> long -> upload)')
+    parser.add_argument('targets', nargs='*', help='실행할 단계 (기본: 전체, 입력 단계도 함께 확인)')
+    parser.add_argument('--source-dir', default=TREND_SOURCE_DIR, help='트렌드 원본 폴더')
+    parser.add_argument('--force', action='store_true', help='입력이 같아도 다시 실행')
+    parser.add_argument('--mark-uploaded', action='store_true',
+                        help='업로드하지 않고 현재 데이터를 업로드한 것으로 기록 (기존 데이터가 이미 Supabase에 있을 때)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pipeline = build_trend_pipeline(source_dir=args.source_dir, mark_uploaded=args.mark_uploaded)
+    print("트렌드 파이프라인 실행 중...")
+    results = pipeline.run(args.targets or None, force=args.force)
+    print(f"완료 ({time.perf_counter() - start:.2f}초)")
+    if any(status in ('failed', 'blocked') for status in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
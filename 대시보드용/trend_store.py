@@ -0,0 +1,356 @@
+"""
+흑백요리사2 대시보드 - 트렌드 저장소 모듈
+
+구글 트렌드 / 유튜브 / 네이버 데이터랩 내보내기 파일을 한 단계에서 읽어
+long-format Parquet 저장소(date, chef, source, value)로 정리합니다.
+
+- 파일마다 한 번만 읽고 인코딩(utf-8 -> cp949)과 형식을 판별합니다
+    - 구글 트렌드/유튜브 CSV: '카테고리: ...' 메타데이터 줄과 빈 줄 건너뛰기, '<1' -> 0
+    - 네이버 데이터랩 .xlsx: '날짜' 헤더 행을 찾아 그 아래만 사용
+    - 이미 정리된 CSV ('날짜,최강록' 등)는 그대로
+- 원본 파일 1개 = Parquet 파트 1개이며, 해시가 같은 파일은 다시 처리하지 않습니다
+  (셰프나 날짜가 추가되면 해당 파일의 파트만 다시 씀)
+- 대시보드 워커 여러 개가 동시에 반영하지 않도록 저장소별 파일 잠금(shared_cache.file_lock) 안에서 씀
+
+예전의 process_trends.py / process_trends_files.py / merge_trends.py / reshape_to_long.py /
+convert_youtube_csv_to_standard_format() 단계를 대신합니다.
+
+사용법 (수집 후 실행, 대시보드에서도 바뀐 파일이 있으면 자동 반영):
+    python 대시보드용/trend_store.py
+    python 대시보드용/trend_store.py --source-dir 트렌드분석 --out 대시보드용/data/trend_store
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+import sys
+
+import pandas as pd
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from data_processor import DATA_DIR
+from shared_cache import file_lock
+
+# 트렌드 원본 폴더 (환경변수로 변경 가능)
+TREND_SOURCE_DIR = os.environ.get(
+    'TREND_DATA_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '흑백요리사트렌드추이')
+)
+# 저장소 폴더 (원본 파일별 Parquet 파트 + 매니페스트)
+TREND_STORE_DIR = os.path.join(DATA_DIR, 'trend_store')
+# '_'로 시작하는 파일은 pyarrow가 데이터 파일로 읽지 않음
+MANIFEST_FILE = '_manifest.json'
+
+# 쉐프 이름 매핑 (파일 프리픽스 -> 한글 이름)
+CHEF_MAPPING = {
+    'akrl': '아기맹수',
+    'choi': '최강록',
+    'hoo': '후덕죽',
+    'im': '임성근',
+    'jeong': '정호영',
+    'sam': '샘킴',
+    'seon': '선재스님',
+    'son': '손종원',
+    'yo': '요리괴물',
+    'yoon': '윤준모'
+}
+# 파일 접미사 -> 소스 이름
+SOURCE_MAPPING = {
+    'datalab': 'Naver',
+    'naver': 'Naver',
+    '네이버': 'Naver',
+    'google': 'Google',
+    '구글': 'Google',
+    'youtube': 'YouTube',
+    '유튜브': 'YouTube'
+}
+TREND_EXTENSIONS = ('.csv', '.xlsx')
+STORE_COLUMNS = ['date', 'chef', 'source', 'value']
+
+
+def parse_trend_filename(filename: str) -> Optional[Tuple[str, str]]:
+    """
+    파일명 -> (셰프, 소스), 트렌드 파일이 아니면 None
+
+    예: 'choi_google.csv' -> ('최강록', 'Google'), '샘킴_youtube.csv' -> ('샘킴', 'YouTube'),
+        '최강록.csv' -> ('최강록', 'YouTube') (유튜브 원본 내보내기 이름)
+    """
+    stem, ext = os.path.splitext(filename)
+    if ext.lower() not in TREND_EXTENSIONS:
+        return None
+
+    prefix, _, suffix = stem.rpartition('_')
+    if prefix and suffix.lower() in SOURCE_MAPPING:
+        return CHEF_MAPPING.get(prefix, prefix), SOURCE_MAPPING[suffix.lower()]
+    if stem in CHEF_MAPPING.values():
+        return stem, 'YouTube'
+    return None
+
+
+def decode_text(raw: bytes) -> str:
+    """utf-8(BOM 포함) -> cp949 순서로 디코딩"""
+    try:
+        return raw.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return raw.decode('cp949')
+
+
+def _read_text_table(raw: bytes) -> pd.DataFrame:
+    """CSV 내보내기 -> DataFrame (헤더 위의 메타데이터 줄과 빈 줄 건너뛰기)"""
+    lines = decode_text(raw).splitlines()
+    # 구글 트렌드/유튜브: '카테고리: 모든 카테고리', 빈 줄 다음에 '일,샘킴: (대한민국)' 헤더
+    start = next((i for i, line in enumerate(lines) if ',' in line), None)
+    if start is None:
+        return pd.DataFrame()
+    return pd.read_csv(io.StringIO('\n'.join(lines[start:])), dtype=str)
+
+
+def _read_excel_table(raw: bytes) -> pd.DataFrame:
+    """네이버 데이터랩 .xlsx -> DataFrame ('날짜' 헤더 행을 찾아 그 아래 날짜/값 2개 컬럼)"""
+    sheet = pd.read_excel(io.BytesIO(raw), header=None, dtype=str)
+    for i, row in sheet.iterrows():
+        cells = [str(cell).strip() for cell in row.tolist()]
+        if '날짜' in cells:
+            col = cells.index('날짜')
+            data = sheet.iloc[i + 1:, col:col + 2].copy()
+            data.columns = cells[col:col + 2]
+            return data.reset_index(drop=True)
+    return pd.DataFrame()
+
+
+def read_trend_file(path: str, raw: bytes, chef: str, source: str) -> pd.DataFrame:
+    """트렌드 파일 1개 -> long-format DataFrame (date, chef, source, value)"""
+    if path.lower().endswith('.xlsx'):
+        table = _read_excel_table(raw)
+    else:
+        table = _read_text_table(raw)
+    if table.shape[1] < 2:
+        return pd.DataFrame(columns=STORE_COLUMNS)
+
+    # 첫 컬럼: 날짜, 두 번째 컬럼: 검색량 (구글 트렌드의 '<1'은 0으로)
+    values = table.iloc[:, 1].astype(str).str.strip().str.replace(',', '').replace('<1', '0')
+    df = pd.DataFrame({
+        'date': pd.to_datetime(table.iloc[:, 0].astype(str).str.strip(), errors='coerce'),
+        'chef': chef,
+        'source': source,
+        'value': pd.to_numeric(values, errors='coerce')
+    }).dropna(subset=['date', 'value'])
+
+    # 파트마다 스키마가 같도록 타입 고정
+    df['date'] = df['date'].astype('datetime64[ns]')
+    df['value'] = df['value'].astype('float64')
+    return df.sort_values('date').reset_index(drop=True)
+
+
+def _find_trend_files(source_dir: str) -> Dict[str, Tuple[str, str]]:
+    """
+    원본 폴더의 트렌드 파일 -> (셰프, 소스)
+
+    같은 셰프/소스 파일이 여러 개면 (예: choi_datalab.xlsx와 변환된 choi_datalab.csv) 가장 최근 파일만 사용
+    """
+    chosen: Dict[Tuple[str, str], str] = {}
+    for filename in sorted(os.listdir(source_dir)):
+        parsed = parse_trend_filename(filename)
+        if parsed is None:
+            continue
+        previous = chosen.get(parsed)
+        path = os.path.join(source_dir, filename)
+        if previous is None or os.path.getmtime(path) > os.path.getmtime(os.path.join(source_dir, previous)):
+            chosen[parsed] = filename
+    return {filename: key for key, filename in chosen.items()}
+
+
+def trend_source_fingerprint(source_dir: str = TREND_SOURCE_DIR) -> List[Tuple[str, int, int]]:
+    """원본 트렌드 파일 (파일명, 크기, 수정 시각) 목록 - 파일을 열지 않고 바뀌었는지 확인용"""
+    if not os.path.isdir(source_dir):
+        return []
+    fingerprint = []
+    for filename in sorted(_find_trend_files(source_dir)):
+        stat = os.stat(os.path.join(source_dir, filename))
+        fingerprint.append((filename, stat.st_size, stat.st_mtime_ns))
+    return fingerprint
+
+
+def _load_manifest(store_dir: str) -> Dict:
+    path = os.path.join(store_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {'files': {}}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 트렌드 저장소 매니페스트 읽기 실패 (전체 다시 처리): {e}")
+        return {'files': {}}
+
+
+def _tmp_path(path: str) -> str:
+    """프로세스/스레드별 임시 파일 경로 (잠금 대기 시간이 지나 잠금 없이 쓸 때도 겹치지 않도록)"""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _store_lock_key(store_dir: str) -> str:
+    """저장소 폴더별 잠금 키"""
+    return 'trend_store_' + hashlib.sha1(os.path.abspath(store_dir).encode('utf-8')).hexdigest()[:12]
+
+
+def _save_manifest(store_dir: str, manifest: Dict):
+    tmp_path = _tmp_path(os.path.join(store_dir, '.' + MANIFEST_FILE))
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, os.path.join(store_dir, MANIFEST_FILE))
+
+
+def ingest_trends(source_dir: str = TREND_SOURCE_DIR, store_dir: str = TREND_STORE_DIR) -> Dict[str, List[str]]:
+    """
+    원본 폴더 -> 저장소 증분 반영
+
+    크기/수정 시각이 같으면 파일을 열지 않고, 바뀌었어도 해시가 같으면 파트를 다시 쓰지 않습니다.
+    원본에서 사라진 파일의 파트는 삭제합니다.
+    다른 프로세스가 반영 중이면 끝날 때까지 기다린 뒤 그 결과의 매니페스트부터 다시 확인합니다.
+
+    Returns:
+        {'updated': [...], 'skipped': [...], 'removed': [...], 'failed': [...]} (원본 파일명)
+    """
+    if not os.path.isdir(source_dir):
+        print(f"⚠️ 트렌드 원본 폴더가 없습니다: {source_dir}")
+        return {'updated': [], 'skipped': [], 'removed': [], 'failed': []}
+
+    os.makedirs(store_dir, exist_ok=True)
+    with file_lock(_store_lock_key(store_dir)):
+        return _ingest_locked(source_dir, store_dir)
+
+
+def _ingest_locked(source_dir: str, store_dir: str) -> Dict[str, List[str]]:
+    """ingest_trends() 본체 (저장소 잠금 안에서 호출)"""
+    result = {'updated': [], 'skipped': [], 'removed': [], 'failed': []}
+    dirty = False
+    manifest = _load_manifest(store_dir)
+    entries = manifest.setdefault('files', {})
+    files = _find_trend_files(source_dir)
+
+    for filename, (chef, source) in files.items():
+        path = os.path.join(source_dir, filename)
+        stat = os.stat(path)
+        entry = entries.get(filename)
+        part_exists = entry is not None and os.path.exists(os.path.join(store_dir, entry['part']))
+        if part_exists and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            result['skipped'].append(filename)
+            continue
+
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if part_exists and entry['sha1'] == digest:
+            # 내용은 그대로 (touch, 다시 복사 등) -> 수정 시각만 기록
+            entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            result['skipped'].append(filename)
+            dirty = True
+            continue
+
+        try:
+            df = read_trend_file(path, raw, chef, source)
+        except Exception as e:
+            print(f"⚠️ 트렌드 파일 읽기 실패 ({filename}): {e}")
+            result['failed'].append(filename)
+            continue
+
+        part = filename + '.parquet'
+        tmp_path = _tmp_path(os.path.join(store_dir, '.' + part))
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, os.path.join(store_dir, part))
+        entries[filename] = {
+            'part': part, 'chef': chef, 'source': source, 'rows': len(df),
+            'sha1': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns
+        }
+        result['updated'].append(filename)
+
+    # 원본에서 사라졌거나 다른 파일로 대체된 파트 삭제
+    for filename in [name for name in entries if name not in files]:
+        part_path = os.path.join(store_dir, entries.pop(filename)['part'])
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        result['removed'].append(filename)
+
+    if dirty or result['updated'] or result['removed']:
+        _save_manifest(store_dir, manifest)
+    return result
+
+
+def ensure_trend_store(source_dir: str = TREND_SOURCE_DIR, store_dir: str = TREND_STORE_DIR) -> bool:
+    """바뀐 원본 파일만 반영 (저장소를 쓸 수 있으면 True)"""
+    if os.path.isdir(source_dir):
+        ingest_trends(source_dir, store_dir)
+    return bool(_load_manifest(store_dir)['files'])
+
+
+def list_trend_chefs(store_dir: str = TREND_STORE_DIR) -> List[str]:
+    """저장소의 셰프 목록 (매니페스트만 읽음)"""
+    if not ensure_trend_store(store_dir=store_dir):
+        return []
+    entries = _load_manifest(store_dir)['files'].values()
+    return sorted({entry['chef'] for entry in entries if entry['rows'] > 0})
+
+
+def trend_store_parts(
+    chefs: Optional[Sequence[str]] = None,
+    sources: Optional[Sequence[str]] = None,
+    store_dir: str = TREND_STORE_DIR
+) -> List[str]:
+    """매니페스트로 요청한 셰프/소스의 Parquet 파트 경로만 고르기 (필요 없는 파일은 열지 않음)"""
+    return [
+        os.path.join(store_dir, entry['part'])
+        for _, entry in sorted(_load_manifest(store_dir)['files'].items())
+        if entry['rows'] > 0
+        and (not chefs or entry['chef'] in chefs)
+        and (not sources or entry['source'] in sources)
+    ]
+
+
+def load_trend_store(
+    chefs: Optional[Sequence[str]] = None,
+    sources: Optional[Sequence[str]] = None,
+    store_dir: str = TREND_STORE_DIR
+) -> pd.DataFrame:
+    """
+    저장소에서 요청한 셰프/소스 파트만 읽기
+
+    Args:
+        chefs: 셰프 목록 (None 또는 빈 목록이면 전체)
+        sources: 소스 목록 ('Naver', 'Google', 'YouTube', None 또는 빈 목록이면 전체)
+
+    Returns:
+        대시보드 컬럼 (Date, Chef, Source, Value) DataFrame
+    """
+    if not ensure_trend_store(store_dir=store_dir):
+        return pd.DataFrame()
+
+    parts = trend_store_parts(chefs, sources, store_dir)
+    if not parts:
+        return pd.DataFrame(columns=['Date', 'Chef', 'Source', 'Value'])
+
+    df = pd.concat([pd.read_parquet(path, columns=STORE_COLUMNS) for path in parts], ignore_index=True)
+    return df.rename(columns={'date': 'Date', 'chef': 'Chef', 'source': 'Source', 'value': 'Value'})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='트렌드 내보내기 파일 -> Parquet 저장소 (바뀐 파일만)')
+    parser.add_argument('--source-dir', default=TREND_SOURCE_DIR, help='트렌드 원본 폴더')
+    parser.add_argument('--out', default=TREND_STORE_DIR, help='저장소 폴더')
+    args = parser.parse_args()
+
+    print(f"트렌드 저장소 반영 중... ({args.source_dir})")
+    result = ingest_trends(args.source_dir, args.out)
+    for filename in result['updated']:
+        print(f"  ✓ {filename}")
+    print(f"✅ 갱신 {len(result['updated'])}개, 그대로 {len(result['skipped'])}개, "
+          f"삭제 {len(result['removed'])}개, 실패 {len(result['failed'])}개")
+    if result['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
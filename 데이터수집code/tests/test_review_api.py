@@ -0,0 +1,134 @@
+"""
+캐치테이블_식당리뷰.py 리뷰 API 파싱 테스트
+
+    python -m pytest 데이터수집code/tests
+
+- 아래 SAMPLE_PAGES는 손으로 만든 응답 예시로, 빈 작성자/에러 응답/키 이름 변경 같은
+  경계 조건만 확인합니다 (실제 API 구조를 검증하지는 않음)
+- 실제 응답은 `python 캐치테이블_식당리뷰.py --record-reviews <가게 URL>`로
+  fixtures/review_api/에 녹화하면 test_recorded_pages가 함께 확인합니다
+"""
+import datetime
+import glob
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("selenium")  # 수집 모듈이 selenium을 모듈 맨 위에서 import
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import 캐치테이블_식당리뷰 as crawler
+
+
+def review(seq, nickname, date, score=None, meal_time=None):
+    item = {"reviewSeq": seq, "writer": {"userSeq": seq, "nickname": nickname}, "reviewDate": date}
+    if score is not None:
+        item["totalScore"] = score
+    if meal_time is not None:
+        item["mealTime"] = meal_time
+    return item
+
+
+def page(reviews, has_next):
+    return {"resultCode": "0000", "data": {"hasNext": has_next, "reviews": reviews}}
+
+
+# 손으로 만든 응답 예시 ({alias}_{page}.json 이름 그대로 재생용 폴더에 저장)
+SAMPLE_PAGES = {
+    "yyw_0.json": page([
+        review(1, "먹보곰 ", "2026-01-16T19:42:10+09:00", 5, "DINNER"),
+        review(2, "바베큐러버", "2026.01.12", 4.5, "LUNCH"),
+        review(3, "", "2026-01-11T12:05:00+09:00", 3, "LUNCH"),  # 탈퇴 회원
+        review(4, "서울미식가", "2026-01-05T20:11:31+09:00", meal_time="DINNER"),
+    ], True),
+    "yyw_1.json": page([
+        review(5, "주말외식", "2025-12-20T18:30:00+09:00", 4, "DINNER"),
+        review(6, "오래된손님", "2025-11-28T13:00:00+09:00", 5, "LUNCH"),  # 기준일 이전
+    ], True),
+    # 에러 응답 (HTTP 200)
+    "imok_0.json": {"resultCode": "E401", "resultMsg": "인증 정보가 유효하지 않습니다.", "data": None},
+    # 키 이름이 바뀐 응답
+    "lamantsecret_0.json": {"data": {"contents": [{"author": {"displayName": "파스타왕"}, "writtenDate": "2026-01-15"}]}},
+    # 빈 목록
+    "original_numbers_0.json": page([], False),
+}
+
+
+def sample(name):
+    return json.dumps(SAMPLE_PAGES[name], ensure_ascii=False).encode('utf-8')
+
+
+@pytest.fixture
+def replay(tmp_path, monkeypatch):
+    """HTTP 대신 SAMPLE_PAGES를 저장한 폴더에서 응답을 읽도록 설정"""
+    for name in SAMPLE_PAGES:
+        (tmp_path / name).write_bytes(sample(name))
+    monkeypatch.setattr(crawler, 'REVIEW_FIXTURE_DIR', str(tmp_path))
+
+
+def test_parse_review_page():
+    reviews, has_next = crawler.parse_review_page(sample('yyw_0.json'))
+
+    # 작성자가 빈 리뷰(탈퇴 회원)는 건너뜀
+    assert reviews == [
+        {"reviewer": "먹보곰", "review_date": "2026.01.16", "reviewer_rating": "5.0", "day_night": "저녁"},
+        {"reviewer": "바베큐러버", "review_date": "2026.01.12", "reviewer_rating": "4.5", "day_night": "점심"},
+        {"reviewer": "서울미식가", "review_date": "2026.01.05", "reviewer_rating": "", "day_night": "저녁"},
+    ]
+    assert has_next is True
+
+
+def test_parse_review_page_withdrawn_reviewer_first():
+    # 작성자가 빈 리뷰가 맨 앞이어도 목록을 찾고 나머지 리뷰는 수집
+    data = json.loads(sample('yyw_0.json'))
+    items = data['data']['reviews']
+    items.insert(0, items.pop(2))
+    reviews, has_next = crawler.parse_review_page(json.dumps(data).encode('utf-8'))
+
+    assert [review["reviewer"] for review in reviews] == ["먹보곰", "바베큐러버", "서울미식가"]
+    assert has_next is True
+
+
+@pytest.mark.parametrize('name', ['imok_0.json', 'lamantsecret_0.json', 'original_numbers_0.json'])
+def test_parse_review_page_without_review_list(name):
+    # 에러 응답, 키 이름이 바뀐 응답, 빈 목록
+    assert crawler.parse_review_page(sample(name)) == ([], False)
+
+
+def test_fetch_reviews_api_stops_at_cutoff(replay):
+    url = "https://app.catchtable.co.kr/ct/shop/yyw?type=DINING"
+    reviews = crawler.fetch_reviews_api(url, "유용욱 바베큐 연구소", expected_count=268)
+
+    assert [review["reviewer"] for review in reviews] == ["먹보곰", "바베큐러버", "서울미식가", "주말외식"]
+    assert all(review["restaurant"] == "유용욱 바베큐 연구소" for review in reviews)
+
+
+def test_fetch_reviews_api_stops_at_existing_review(replay):
+    url = "https://app.catchtable.co.kr/ct/shop/yyw?type=DINING"
+    existing = {("유용욱 바베큐 연구소", "바베큐러버", "2026.01.12")}
+    reviews = crawler.fetch_reviews_api(url, "유용욱 바베큐 연구소", existing, expected_count=268)
+
+    assert [review["reviewer"] for review in reviews] == ["먹보곰"]
+
+
+@pytest.mark.parametrize('alias', ['imok', 'lamantsecret', 'original_numbers', 'no_recording'])
+def test_fetch_reviews_api_raises_without_review_list(replay, alias):
+    # 가게 페이지에 리뷰가 있는데 첫 페이지에서 목록을 못 찾으면 스크롤 수집으로 넘어가도록 예외
+    url = f"https://app.catchtable.co.kr/ct/shop/{alias}?type=DINING"
+    with pytest.raises(ValueError):
+        crawler.fetch_reviews_api(url, alias, expected_count=10)
+    assert crawler.fetch_reviews_api(url, alias, expected_count=0) == []
+
+
+@pytest.mark.parametrize('path', sorted(glob.glob(os.path.join(crawler.REVIEW_API_FIXTURES, '*_0.json'))))
+def test_recorded_pages(path):
+    # 녹화한 실제 응답의 첫 페이지: 리뷰 목록을 찾고 모든 리뷰의 작성자/날짜가 채워져야 함
+    with open(path, 'rb') as f:
+        reviews, _ = crawler.parse_review_page(f.read())
+
+    assert reviews
+    for review in reviews:
+        assert review["reviewer"]
+        datetime.datetime.strptime(review["review_date"], "%Y.%m.%d")
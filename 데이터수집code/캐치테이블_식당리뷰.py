@@ -9,8 +9,26 @@ from selenium.webdriver.support import expected_conditions as EC
 import time
 import datetime
 import os
+import sys
 import re
 import glob
+import queue
+import json
+import multiprocessing as mp
+from urllib.parse import urlparse
+
+try:
+    import orjson  # 빠른 JSON 디코더 (없으면 표준 json 사용)
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from curl_cffi import requests as http  # 브라우저 TLS 지문 (없으면 requests 사용)
+    HTTP_KWARGS = {"impersonate": "chrome"}
+except ImportError:
+    import requests as http
+    HTTP_KWARGS = {}
 
 # ==========================================
 # 설정
@@ -21,13 +39,53 @@ OUTPUT_FILE = f"reviews_collected_{datetime.datetime.now().strftime('%Y%m%d')}.c
 CUTOFF_DATE = datetime.datetime(2025, 12, 9)  # 이 날짜 이전 리뷰는 수집 중단
 FORCE_CRAWL = False # True: 히스토리 무시하고 무조건 크롤링, False: 변경된 것만 크롤링
 
+# 병렬 수집 설정 (CRAWL_WORKERS=1이면 드라이버 1개로 순차 수집)
+WORKERS = int(os.environ.get("CRAWL_WORKERS", 4))
+HOST_MAX_CONCURRENT = 2   # 같은 호스트에 동시에 페이지를 여는 워커 수
+HOST_MIN_INTERVAL = 1.0   # 같은 호스트 페이지 요청 사이 최소 간격 (초, 전체 워커 공통)
+
+# 스크롤 수집 시 카드 읽기 방식 (script: 스크롤 단계마다 execute_script 1회, webdriver: 카드별 find_element)
+CARD_EXTRACTION = os.environ.get("CARD_EXTRACTION", "script")
+# 리뷰 목록 JSON API (리뷰 페이지의 XHR 요청, 최신순)
+# 엔드포인트/응답 구조를 실제 응답으로 확인하기 전이라 수집(main)에는 연결하지 않음
+# (--record-reviews로 실제 응답을 fixtures/review_api/에 녹화하고 파서 테스트를 통과하면 연결)
+REVIEW_API_URL = "https://ct-api.catchtable.co.kr/api/review/v1/shops/{alias}/reviews"
+REVIEW_API_PAGE_SIZE = 20
+REVIEW_API_MAX_PAGES = 100
+REVIEW_API_TIMEOUT = 10
+REVIEW_API_HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "accept-language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "origin": "https://app.catchtable.co.kr",
+    "referer": "https://app.catchtable.co.kr/",
+    "x-requested-with": "XMLHttpRequest",
+}
+# 녹화/재생: REVIEW_RECORD_DIR이면 받은 응답을 {alias}_{page}.json으로 저장하고,
+# REVIEW_FIXTURE_DIR이면 HTTP 대신 저장된 응답을 읽음 (없는 페이지는 마지막 페이지로 처리)
+REVIEW_RECORD_DIR = os.environ.get("REVIEW_RECORD_DIR")
+REVIEW_FIXTURE_DIR = os.environ.get("REVIEW_FIXTURE_DIR")
+# --record-reviews 녹화 위치 (테스트가 읽는 fixture 폴더)
+REVIEW_API_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "review_api")
+# 응답 구조가 바뀌어도 찾을 수 있도록 후보 키를 순서대로 확인
+REVIEWER_KEYS = ('nickname', 'nickName', 'userName', 'writerName', 'reviewerName')
+REVIEW_DATE_KEYS = ('reviewDate', 'regDate', 'createdAt', 'writtenAt', 'visitDate')
+REVIEW_RATING_KEYS = ('totalScore', 'avgScore', 'score', 'rating')
+MEAL_TIME_KEYS = ('mealTime', 'mealType', 'visitType', 'diningType')
+HAS_NEXT_KEYS = ('hasNext', 'hasNextPage', 'hasMore')
+MEAL_TIME_NAMES = {'LUNCH': '점심', 'DINNER': '저녁'}
+
+# 검증된 셀렉터 (Notebook과 동일)
+CARD_SELECTOR = "#main > div.container.gutter-sm > div > div > div > div"
+REVIEW_COUNT_XPATH = '//*[@id="wrapperDiv"]/div[1]/div[1]/div[3]/div/span[3]'
+
 # ==========================================
 # 함수 정의
 # ==========================================
 
-def get_driver():
+def get_driver(headless=False):
     options = Options()
-    #options.add_argument("--headless") # Airflow 등 서버 환경에서는 주석 해제 필요
+    if headless:  # 병렬 수집 워커, Airflow 등 서버 환경
+        options.add_argument("--headless")
     options.add_argument("--window-size=1600,1000")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
@@ -61,6 +119,49 @@ def modify_url_for_reviews(url):
         new_url = f"{url}/review?sortingFilter=D"
     return new_url
 
+class HostThrottle:
+    """
+    호스트별 접속 제한 (워커 프로세스 간 공유)
+    - 동시에 페이지를 여는 워커 수를 max_concurrent개로 제한
+    - 페이지 요청 사이에 min_interval초 간격 유지
+    """
+    def __init__(self, max_concurrent, min_interval):
+        self.slots = mp.BoundedSemaphore(max_concurrent)
+        self._lock = mp.Lock()
+        self._last_request = mp.Value('d', 0.0, lock=False)
+        self.min_interval = min_interval
+
+    def wait_turn(self):
+        with self._lock:
+            wait = self._last_request.value + self.min_interval - time.time()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request.value = time.time()
+
+# 워커 프로세스에서 설정 (순차 모드에서는 비어 있어 제한 없이 접속)
+_host_throttles = {}
+
+def wait_for(driver, locator, timeout):
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+    except Exception:
+        pass  # 요소가 없는 페이지 (리뷰 0개 등)는 그대로 진행
+
+def open_page(driver, url, locator, timeout):
+    """
+    페이지를 열고 locator 요소가 뜰 때까지 최대 timeout초 대기
+    (고정 sleep 대신 요소가 뜨면 바로 다음 단계로 진행)
+    """
+    throttle = _host_throttles.get(urlparse(url).netloc)
+    if throttle is None:
+        driver.get(url)
+        wait_for(driver, locator, timeout)
+        return
+    with throttle.slots:
+        throttle.wait_turn()
+        driver.get(url)
+        wait_for(driver, locator, timeout)
+
 def parse_date(date_str):
     today = datetime.datetime.now()
     try:
@@ -76,6 +177,95 @@ def parse_date(date_str):
     except:
         return today
 
+# 카드 필드 셀렉터 (검증된 셀렉터, 앞의 것이 없으면 다음 대체 셀렉터 사용)
+REVIEWER_SELECTORS = ["article > div.__header > div.__user-info > a > h4 > span", "article h4 span"]
+RATING_SELECTORS = ["article > div.__header > div.__review-meta.__review-meta--with-rating > div > a > div",
+                    "article div.__review-meta div"]
+DATE_SELECTORS = ["article > div.__header > div.__review-meta.__review-meta--with-rating > span"]
+DAY_NIGHT_SELECTORS = ["article > div.__header > div.__review-meta.__review-meta--with-rating > div > p"]
+DATE_PATTERN = r'\d{4}\.\d{1,2}\.\d{1,2}|\d+일 전|어제|방금|시간 전|분 전'
+
+# start 번째 이후 카드의 필드를 한 번의 execute_script 호출로 읽는 스크립트
+# (arguments: 카드 셀렉터, 시작 인덱스, 필드별 셀렉터 목록)
+EXTRACT_CARDS_SCRIPT = """
+const [cardSelector, start, selectors] = arguments;
+const cards = document.querySelectorAll(cardSelector);
+const firstText = (card, list) => {
+    for (const selector of list) {
+        const el = card.querySelector(selector);
+        if (el) return el.innerText.trim();
+    }
+    return null;
+};
+const fields = [];
+for (let i = start; i < cards.length; i++) {
+    const card = cards[i];
+    if (!card.querySelector('article')) continue;  // 리뷰 카드가 아님 (광고, 빈 div 등)
+    const dateText = firstText(card, selectors.date);
+    fields.push({
+        reviewer: firstText(card, selectors.reviewer),
+        rating: firstText(card, selectors.rating) || '',
+        date_text: dateText,
+        day_night: firstText(card, selectors.day_night) || '',
+        text: dateText ? '' : card.innerText
+    });
+}
+return {total: cards.length, cards: fields, last: cards.length ? cards[cards.length - 1] : null};
+"""
+
+def first_text(card, selectors):
+    """WebDriver로 selectors 중 처음 찾은 요소의 텍스트 (없으면 None)"""
+    for selector in selectors:
+        try:
+            return card.find_element(By.CSS_SELECTOR, selector).text.strip()
+        except:
+            continue
+    return None
+
+def read_card_fields(card):
+    """카드 1개 필드 읽기 (WebDriver 방식, 리뷰 카드가 아니면 None)"""
+    # ★ 리뷰 카드 유효성 검증: article 태그가 없으면 리뷰 카드가 아님 (광고, 빈 div 등)
+    try:
+        card.find_element(By.CSS_SELECTOR, "article")
+    except:
+        return None
+    date_text = first_text(card, DATE_SELECTORS)
+    return {
+        "reviewer": first_text(card, REVIEWER_SELECTORS),
+        "rating": first_text(card, RATING_SELECTORS) or "",
+        "date_text": date_text,
+        "day_night": first_text(card, DAY_NIGHT_SELECTORS) or "",
+        "text": "" if date_text else card.text
+    }
+
+def read_new_cards(driver, start):
+    """
+    start 번째 이후 카드 필드 읽기
+
+    Returns:
+        (전체 카드 수, 새 카드 필드 리스트, 마지막 카드 WebElement)
+    """
+    if CARD_EXTRACTION == "script":
+        # 스크롤 단계마다 chromedriver 왕복 1회로 모든 새 카드를 읽음
+        result = driver.execute_script(EXTRACT_CARDS_SCRIPT, CARD_SELECTOR, start, {
+            "reviewer": REVIEWER_SELECTORS,
+            "rating": RATING_SELECTORS,
+            "date": DATE_SELECTORS,
+            "day_night": DAY_NIGHT_SELECTORS,
+        })
+        return result["total"], result["cards"], result["last"]
+
+    cards = driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)
+    fields = []
+    for card in cards[start:]:
+        try:
+            card_fields = read_card_fields(card)
+        except:
+            continue
+        if card_fields is not None:
+            fields.append(card_fields)
+    return len(cards), fields, cards[-1] if cards else None
+
 def scrape_reviews(driver, url, restaurant_name, existing_reviews_set=None):
     """리뷰 상세 페이지 크롤링 함수 - 최적화 버전
     
@@ -83,10 +273,10 @@ def scrape_reviews(driver, url, restaurant_name, existing_reviews_set=None):
     1. 기준일 이전 리뷰 발견 시 즉시 반환 (조기 종료)
     2. 이미 처리한 카드 인덱스 추적으로 중복 처리 방지
     3. 연속 오래된 리뷰 감지로 조기 중단
+    4. 새 카드 필드를 스크롤 단계마다 execute_script 한 번으로 읽기 (CARD_EXTRACTION=script)
     """
     review_url = modify_url_for_reviews(url)
-    driver.get(review_url)
-    time.sleep(5)
+    open_page(driver, review_url, (By.CSS_SELECTOR, f"{CARD_SELECTOR} article"), 5)
 
     collected_reviews = []
     processed_hashes = set()
@@ -101,21 +291,20 @@ def scrape_reviews(driver, url, restaurant_name, existing_reviews_set=None):
     
     while scroll_count < max_scrolls:
         try:
-            # 검증된 카드 셀렉터 (Notebook과 동일)
-            cards = driver.find_elements(By.CSS_SELECTOR, "#main > div.container.gutter-sm > div > div > div > div")
+            total_cards, new_cards, last_card = read_new_cards(driver, last_processed_index)
         except:
-            cards = []
+            total_cards, new_cards, last_card = 0, [], None
             
         # 첫 시도 시 카드 없으면 로딩 대기
-        if not cards and scroll_count == 0:
+        if total_cards == 0 and scroll_count == 0:
             time.sleep(3)
             try:
-                cards = driver.find_elements(By.CSS_SELECTOR, "#main > div.container.gutter-sm > div > div > div > div")
+                total_cards, new_cards, last_card = read_new_cards(driver, last_processed_index)
             except:
                 pass
         
         # 새로 로드된 카드만 처리 (이전에 처리한 카드 스킵)
-        if len(cards) <= last_processed_index:
+        if total_cards <= last_processed_index:
             # 새 카드가 없으면 스크롤 시도
             scroll_count += 1
             try:
@@ -125,53 +314,24 @@ def scrape_reviews(driver, url, restaurant_name, existing_reviews_set=None):
                 pass
             continue
         
-        should_stop = False
-        
-        for i, card in enumerate(cards[last_processed_index:], start=last_processed_index):
+        for card in new_cards:
             try:
-                # ★ 리뷰 카드 유효성 검증: article 태그가 없으면 리뷰 카드가 아님 (광고, 빈 div 등)
-                try:
-                    article = card.find_element(By.CSS_SELECTOR, "article")
-                except:
-                    continue  # 리뷰 카드가 아니면 스킵
-
-                # 1. 작성자
-                try:
-                    reviewer = card.find_element(By.CSS_SELECTOR, "article > div.__header > div.__user-info > a > h4 > span").text.strip()
-                except:
-                    try:
-                        # 대체 셀렉터 시도
-                        reviewer = card.find_element(By.CSS_SELECTOR, "article h4 span").text.strip()
-                    except:
-                        continue  # 작성자 없으면 스킵 (유효한 리뷰가 아님)
-
-                # 작성자가 비어있으면 스킵
-                if not reviewer or reviewer == "":
+                # 1. 작성자 (없거나 비어있으면 유효한 리뷰가 아님)
+                reviewer = card["reviewer"]
+                if not reviewer:
                     continue
 
                 # 2. 평점
-                try:
-                    rating_el = card.find_element(By.CSS_SELECTOR, "article > div.__header > div.__review-meta.__review-meta--with-rating > div > a > div")
-                    rating = rating_el.text.strip()
-                except:
-                    try:
-                        # 대체 셀렉터 시도
-                        rating_el = card.find_element(By.CSS_SELECTOR, "article div.__review-meta div")
-                        rating = rating_el.text.strip()
-                    except:
-                        rating = ""  # 평점 없으면 빈 문자열
-
-                # 3. 날짜
-                try:
-                    date_el = card.find_element(By.CSS_SELECTOR, "article > div.__header > div.__review-meta.__review-meta--with-rating > span")
-                    date_text = date_el.text.strip()
-                except:
-                    # 대체: 카드 텍스트에서 날짜 패턴 추출
-                    match = re.search(r'\d{4}\.\d{1,2}\.\d{1,2}|\d+일 전|어제|방금|시간 전|분 전', card.text)
+                rating = card["rating"]
+
+                # 3. 날짜 (셀렉터로 못 찾으면 카드 텍스트에서 날짜 패턴 추출)
+                date_text = card["date_text"]
+                if not date_text:
+                    match = re.search(DATE_PATTERN, card["text"] or "")
                     date_text = match.group(0) if match else ""
 
                 # 날짜가 없으면 스킵 (유효한 리뷰가 아님)
-                if not date_text or date_text == "":
+                if not date_text:
                     continue
 
                 # ★ 핵심 최적화: 기준일 이전 리뷰 발견 시 즉시 함수 반환
@@ -179,17 +339,14 @@ def scrape_reviews(driver, url, restaurant_name, existing_reviews_set=None):
                 if review_date < CUTOFF_DATE:
                     consecutive_old_reviews += 1
                     if consecutive_old_reviews >= max_consecutive_old:
-                        print(f"\n   >>> 기준일({CUTOFF_DATE.strftime('%Y-%m-%d')}) 이전 리뷰 {max_consecutive_old}개 연속 발견 - 즉시 중단")
+                        print(f"\n   >>> [{restaurant_name}] 기준일({CUTOFF_DATE.strftime('%Y-%m-%d')}) 이전 리뷰 {max_consecutive_old}개 연속 발견 - 즉시 중단")
                         return collected_reviews  # 즉시 함수 반환!
                     continue
                 else:
                     consecutive_old_reviews = 0  # 새로운 리뷰면 리셋
 
                 # 4. 방문 유형(점심/저녁)
-                try:
-                    day_night = card.find_element(By.CSS_SELECTOR, "article > div.__header > div.__review-meta.__review-meta--with-rating > div > p").text.strip()
-                except:
-                    day_night = ""  # 방문 유형 없으면 빈 문자열
+                day_night = card["day_night"]
 
                 # 중복 수집 방지
                 msg_hash = hash(f"{reviewer}_{date_text}_{restaurant_name}")
@@ -198,7 +355,7 @@ def scrape_reviews(driver, url, restaurant_name, existing_reviews_set=None):
                 # ★ 핵심: 이미 수집된 리뷰 1개만 발견해도 즉시 중단!
                 # 최신순 정렬이므로, 기존 리뷰가 나타나면 그 이후는 모두 수집된 것임
                 if existing_reviews_set and review_key in existing_reviews_set:
-                    print(f"\n   >>> 기존 수집 리뷰 발견 ({reviewer}, {date_text}) - 이 가게 수집 즉시 종료")
+                    print(f"\n   >>> [{restaurant_name}] 기존 수집 리뷰 발견 ({reviewer}, {date_text}) - 이 가게 수집 즉시 종료")
                     return collected_reviews  # 즉시 함수 반환!
 
                 # 새로운 리뷰 발견
@@ -215,12 +372,11 @@ def scrape_reviews(driver, url, restaurant_name, existing_reviews_set=None):
                 continue
         
         # 처리한 인덱스 업데이트
-        last_processed_index = len(cards)
+        last_processed_index = total_cards
             
         # 스크롤 동작 (ActionChains)
         try:
-            if cards:
-                last_card = cards[-1]
+            if last_card is not None:
                 actions = ActionChains(driver)
                 actions.move_to_element(last_card).perform()
                 time.sleep(0.5)
@@ -236,18 +392,192 @@ def scrape_reviews(driver, url, restaurant_name, existing_reviews_set=None):
         
     return collected_reviews
 
-def main():
-    if not os.path.exists(INPUT_FILE):
-        print(f"오류: {INPUT_FILE} 파일이 없습니다.")
-        return
+# ==========================================
+# JSON API 리뷰 수집
+# ==========================================
 
-    df = pd.read_csv(INPUT_FILE)
-    history_df = load_history()
+def shop_alias(url):
+    """가게 URL에서 alias 추출 (https://app.catchtable.co.kr/ct/shop/yyw?type=DINING -> yyw)"""
+    match = re.search(r'/ct/shop/([^/?#]+)', str(url))
+    return match.group(1) if match else None
+
+def review_api_params(page):
+    return {"page": page, "size": REVIEW_API_PAGE_SIZE, "sortingFilter": "D"}
+
+def fetch_review_page(alias, page, record_dir=None):
+    """리뷰 목록 1페이지 원본 응답 (bytes, 재생 모드에서 파일이 없으면 None, record_dir: 녹화 위치)"""
+    file_name = f"{alias}_{page}.json"
+    if REVIEW_FIXTURE_DIR:
+        path = os.path.join(REVIEW_FIXTURE_DIR, file_name)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    response = http.get(
+        REVIEW_API_URL.format(alias=alias),
+        params=review_api_params(page),
+        headers=REVIEW_API_HEADERS,
+        timeout=REVIEW_API_TIMEOUT,
+        **HTTP_KWARGS
+    )
+    response.raise_for_status()
+    raw = response.content
+
+    record_dir = record_dir or REVIEW_RECORD_DIR
+    if record_dir:
+        os.makedirs(record_dir, exist_ok=True)
+        with open(os.path.join(record_dir, file_name), 'wb') as f:
+            f.write(raw)
+    return raw
+
+def find_value(node, keys):
+    """dict 하위에서 keys 중 처음 발견되는 값 (리스트 안으로는 내려가지 않음)"""
+    nodes = [node]
+    while nodes:
+        current = nodes.pop(0)
+        for key in keys:
+            if current.get(key) not in (None, ''):
+                return current[key]
+        nodes.extend(value for value in current.values() if isinstance(value, dict))
+    return None
+
+def has_key(node, keys):
+    """dict 하위에 keys 중 하나가 있는지 (값이 비어 있어도 키가 있으면 True, 리스트 안으로는 내려가지 않음)"""
+    nodes = [node]
+    while nodes:
+        current = nodes.pop(0)
+        if any(key in current for key in keys):
+            return True
+        nodes.extend(value for value in current.values() if isinstance(value, dict))
+    return False
+
+def find_review_items(data):
+    """
+    응답에서 리뷰 dict 리스트 찾기 (작성자 키가 있는 dict들로 된 첫 리스트)
+    - 작성자 값이 비어 있는 리뷰(탈퇴 회원 등)가 맨 앞이어도 찾도록 값이 아니라 키로 판단
+    """
+    nodes = [data]
+    while nodes:
+        current = nodes.pop(0)
+        if isinstance(current, list):
+            if current and all(isinstance(item, dict) for item in current) \
+                    and any(has_key(item, REVIEWER_KEYS) for item in current):
+                return current
+            nodes.extend(current)
+        elif isinstance(current, dict):
+            nodes.extend(current.values())
+    return []
+
+def format_review_date(value):
+    """API 날짜(epoch ms, ISO 문자열, 'YYYY.MM.DD', 'N일 전')를 화면과 같은 'YYYY.MM.DD'로 변환"""
+    if isinstance(value, (int, float)):
+        date = datetime.datetime.fromtimestamp(value / 1000 if value > 1e11 else value)
+    else:
+        text = str(value).strip()
+        match = re.match(r'(\d{4})[-.](\d{1,2})[-.](\d{1,2})', text)
+        if match:
+            date = datetime.datetime(*map(int, match.groups()))
+        else:
+            date = parse_date(text)
+    return date.strftime("%Y.%m.%d")
 
-    # ★ 핵심: 기존 수집된 리뷰 모두 로드 (모든 reviews_collected_*.csv 파일)
+def parse_review_page(raw):
+    """
+    리뷰 목록 1페이지 파싱
+
+    Returns:
+        (리뷰 리스트 [{reviewer, review_date, reviewer_rating, day_night}], 다음 페이지 여부)
+    """
+    data = json_loads(raw)
+    items = find_review_items(data)
+
+    reviews = []
+    for item in items:
+        reviewer = find_value(item, REVIEWER_KEYS)
+        date_value = find_value(item, REVIEW_DATE_KEYS)
+        if not reviewer or date_value is None:
+            continue
+        rating = find_value(item, REVIEW_RATING_KEYS)
+        meal_time = find_value(item, MEAL_TIME_KEYS)
+        reviews.append({
+            "reviewer": str(reviewer).strip(),
+            "review_date": format_review_date(date_value),
+            "reviewer_rating": f"{float(rating):.1f}" if rating is not None else "",
+            "day_night": MEAL_TIME_NAMES.get(str(meal_time).upper(), str(meal_time)) if meal_time else ""
+        })
+
+    has_next = find_value(data, HAS_NEXT_KEYS) if isinstance(data, dict) else None
+    if has_next is None:
+        has_next = len(items) >= REVIEW_API_PAGE_SIZE
+    return reviews, bool(has_next)
+
+def fetch_reviews_api(url, restaurant_name, existing_reviews_set=None, expected_count=0):
+    """
+    JSON API로 리뷰 수집 (최신순으로 페이지를 넘기며 scrape_reviews와 같은 형식으로 반환)
+    - 기준일 이전 리뷰가 나오면 중단
+    - 이미 수집된 리뷰가 나오면 중단 (최신순이므로 이후는 모두 수집된 것)
+    - 가게 페이지의 리뷰 수(expected_count)가 있는데 첫 페이지에서 리뷰 목록을 찾지 못하면
+      (에러 응답, 키 이름 변경 등) ValueError -> 호출한 쪽에서 스크롤 수집으로 대체
+    """
+    alias = shop_alias(url)
+    if not alias:
+        raise ValueError(f"가게 alias를 찾을 수 없음: {url}")
+
+    collected_reviews = []
+    seen_keys = set()
+    for page in range(REVIEW_API_MAX_PAGES):
+        raw = fetch_review_page(alias, page)
+        if raw is None:
+            if page == 0 and expected_count > 0:
+                raise ValueError("저장된 응답 없음")
+            break
+        reviews, has_next = parse_review_page(raw)
+        if page == 0 and not reviews and (has_next or expected_count > 0):
+            raise ValueError(f"응답에서 리뷰 목록을 찾을 수 없음 (가게 페이지 리뷰 {expected_count}개)")
+
+        for review in reviews:
+            if datetime.datetime.strptime(review["review_date"], "%Y.%m.%d") < CUTOFF_DATE:
+                print(f"\n   >>> [{restaurant_name}] 기준일({CUTOFF_DATE.strftime('%Y-%m-%d')}) 이전 리뷰 도달 - 수집 종료")
+                return collected_reviews
+
+            review_key = (restaurant_name, review["reviewer"], review["review_date"])
+            if existing_reviews_set and review_key in existing_reviews_set:
+                print(f"\n   >>> [{restaurant_name}] 기존 수집 리뷰 발견 ({review['reviewer']}, {review['review_date']}) - 이 가게 수집 즉시 종료")
+                return collected_reviews
+
+            if review_key not in seen_keys:
+                seen_keys.add(review_key)
+                collected_reviews.append({"restaurant": restaurant_name, **review})
+
+        if not has_next:
+            break
+
+    return collected_reviews
+
+def record_review_pages(url, out_dir=REVIEW_API_FIXTURES, max_pages=2):
+    """
+    리뷰 API 실제 응답을 {alias}_{page}.json으로 녹화 (파서 테스트 fixture용)
+    녹화한 페이지마다 파싱 결과를 출력해 화면의 리뷰와 비교할 수 있게 함
+    """
+    alias = shop_alias(url)
+    if not alias:
+        print(f"가게 alias를 찾을 수 없음: {url}")
+        return
+    for page in range(max_pages):
+        raw = fetch_review_page(alias, page, record_dir=out_dir)
+        reviews, has_next = parse_review_page(raw)
+        print(f"{alias}_{page}.json: 리뷰 {len(reviews)}개, 다음 페이지 {has_next}")
+        for review in reviews[:3]:
+            print(f"   {review}")
+        if not has_next:
+            break
+
+def load_existing_reviews():
+    """기존 수집된 리뷰 키 로드 (모든 reviews_collected_*.csv 파일)"""
     existing_reviews_set = set()
     existing_files = glob.glob("reviews_collected_*.csv")
-    
+
     if existing_files:
         print(f"기존 수집 파일 {len(existing_files)}개 발견, 로드 중...")
         for file_path in existing_files:
@@ -262,76 +592,182 @@ def main():
         print(f"총 {len(existing_reviews_set)}개 기존 리뷰 로드 완료 (중복 방지용)\n")
     else:
         print("기존 수집 파일 없음 - 전체 수집 시작\n")
+    return existing_reviews_set
 
-    driver = get_driver()
+def process_restaurant(driver, url, restaurant_name, label, history_df, existing_reviews_set):
+    """식당 1곳 처리: 리뷰 개수 확인 -> 변경 감지 -> 필요 시 리뷰 수집
 
-    all_collected_data = []
-    history_updates = []
+    Returns:
+        (history 갱신 행, 수집한 리뷰 리스트)
+    """
+    # 1. 메인 접속
+    open_page(driver, url, (By.XPATH, REVIEW_COUNT_XPATH), 3)
 
-    print(f"총 {len(df)}개 식당 처리 시작...")
-    
+    # 2. 리뷰 개수 확인 (Notebook의 검증된 XPath 사용)
     try:
-        for idx, row in df.iterrows():
-            url = row['URL']
-            restaurant_name = row['restaurant'] if 'restaurant' in row else str(idx)
-            
+        count_el = driver.find_element(By.XPATH, REVIEW_COUNT_XPATH)
+        count_text = count_el.text
+        review_count = int(re.search(r'(\d+)', count_text.replace(',', '')).group(1))
+    except:
+        review_count = 0
+
+    status = f"{label} {restaurant_name}: {review_count}개"
+
+    # 3. 변경 감지
+    prev_record = history_df[history_df['url'] == url]
+    need_crawl = False
+
+    if FORCE_CRAWL:
+        status += " -> [강제 수집]"
+        need_crawl = True
+    elif prev_record.empty:
+        status += " -> [신규]"
+        need_crawl = True
+    else:
+        last_count = int(prev_record.iloc[0]['review_count'])
+        if last_count != review_count:
+            status += f" -> [변동: {last_count}->{review_count}]"
+            if review_count > 0: need_crawl = True
+        else:
+            status += " -> [변동없음]"
+
+    history_update = {
+        'url': url,
+        'restaurant_name': restaurant_name,
+        'review_count': review_count,
+        'last_updated': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+    # 4. 크롤링 수행
+    if not need_crawl:
+        print(status, flush=True)
+        return history_update, []
+
+    print(status + " -> 수집 시작", flush=True)
+    reviews = scrape_reviews(driver, url, restaurant_name, existing_reviews_set)
+    if reviews:
+        print(f"   >>> {restaurant_name}: {len(reviews)}건 수집 완료", flush=True)
+    else:
+        print(f"   >>> {restaurant_name}: 수집된 리뷰 없음", flush=True)
+    return history_update, reviews
+
+def crawl_sequential(tasks, history_df, existing_reviews_set):
+    """드라이버 1개로 순차 수집 -> {idx: (history 갱신 행, 리뷰 리스트)}"""
+    results = {}
+    driver = get_driver()
+    try:
+        for idx, url, restaurant_name, label in tasks:
             try:
-                # 1. 메인 접속
-                driver.get(url)
-                time.sleep(3)
-                
-                # 2. 리뷰 개수 확인 (Notebook의 검증된 XPath 사용)
-                try:
-                    count_el = driver.find_element(By.XPATH, '//*[@id="wrapperDiv"]/div[1]/div[1]/div[3]/div/span[3]')
-                    count_text = count_el.text
-                    review_count = int(re.search(r'(\d+)', count_text.replace(',', '')).group(1))
-                except:
-                    review_count = 0
-                
-                print(f"[{idx+1}/{len(df)}] {restaurant_name}: {review_count}개", end=" ")
-                
-                # 3. 변경 감지
-                prev_record = history_df[history_df['url'] == url]
-                need_crawl = False
-
-                if FORCE_CRAWL:
-                    print("-> [강제 수집]", end=" ")
-                    need_crawl = True
-                elif prev_record.empty:
-                    print("-> [신규]", end=" ")
-                    need_crawl = True
-                else:
-                    last_count = int(prev_record.iloc[0]['review_count'])
-                    if last_count != review_count:
-                        print(f"-> [변동: {last_count}->{review_count}]", end=" ")
-                        if review_count > 0: need_crawl = True
-                    else:
-                        print("-> [변동없음]", end=" ")
-                
-                history_updates.append({
-                    'url': url,
-                    'restaurant_name': restaurant_name,
-                    'review_count': review_count,
-                    'last_updated': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                # 4. 크롤링 수행
-                if need_crawl:
-                    print("-> 수집 시작")
-                    reviews = scrape_reviews(driver, url, restaurant_name, existing_reviews_set)
-                    if reviews:
-                        all_collected_data.extend(reviews)
-                        print(f"   >>> {len(reviews)}건 수집 완료")
-                    else:
-                        print("   >>> 수집된 리뷰 없음")
-                else:
-                    print("") 
-                    
+                results[idx] = process_restaurant(driver, url, restaurant_name, label,
+                                                  history_df, existing_reviews_set)
             except Exception as e:
-                print(f"\n   !!! 에러 발생: {e}")
-
+                print(f"\n   !!! 에러 발생 ({restaurant_name}): {e}")
     finally:
         driver.quit()
+    return results
+
+def crawl_worker(worker_id, task_queue, result_queue, history_df, existing_reviews_set, host_throttles):
+    """워커 프로세스: headless 드라이버 1개로 공유 큐에서 식당을 하나씩 꺼내 처리"""
+    global _host_throttles
+    _host_throttles = host_throttles
+    driver = None
+    try:
+        driver = get_driver(headless=True)
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            idx, url, restaurant_name, label = task
+            try:
+                history_update, reviews = process_restaurant(driver, url, restaurant_name, label,
+                                                             history_df, existing_reviews_set)
+                result_queue.put(('result', idx, history_update, reviews))
+            except Exception as e:
+                print(f"\n   !!! 에러 발생 ({restaurant_name}): {e}", flush=True)
+    except Exception as e:
+        print(f"\n   !!! 워커 {worker_id} 종료: {e}", flush=True)
+    finally:
+        if driver is not None:
+            driver.quit()
+        result_queue.put(('done', worker_id))
+
+def crawl_parallel(tasks, history_df, existing_reviews_set, workers):
+    """워커 프로세스 N개로 병렬 수집 -> {idx: (history 갱신 행, 리뷰 리스트)}"""
+    hosts = {urlparse(url).netloc for _, url, _, _ in tasks}
+    host_throttles = {host: HostThrottle(HOST_MAX_CONCURRENT, HOST_MIN_INTERVAL) for host in hosts}
+
+    task_queue = mp.Queue()
+    result_queue = mp.Queue()
+    for task in tasks:
+        task_queue.put(task)
+    for _ in range(workers):
+        task_queue.put(None)  # 워커별 종료 신호
+
+    processes = [
+        mp.Process(target=crawl_worker, name=f"review-crawler-{i}",
+                   args=(i, task_queue, result_queue, history_df, existing_reviews_set, host_throttles))
+        for i in range(workers)
+    ]
+    for p in processes:
+        p.start()
+
+    results = {}
+    finished = 0
+    while finished < workers:
+        try:
+            message = result_queue.get(timeout=5)
+        except queue.Empty:
+            # 워커가 비정상 종료(종료 신호 없이)한 경우 남은 워커가 없으면 중단
+            if not any(p.is_alive() for p in processes):
+                break
+            continue
+        if message[0] == 'done':
+            finished += 1
+        else:
+            _, idx, history_update, reviews = message
+            results[idx] = (history_update, reviews)
+
+    for p in processes:
+        p.join(timeout=10)
+
+    missing = len(tasks) - len(results)
+    if missing:
+        print(f"\n⚠️ {missing}개 식당은 처리되지 않았습니다 (다음 실행에서 다시 확인)")
+    return results
+
+def main():
+    if not os.path.exists(INPUT_FILE):
+        print(f"오류: {INPUT_FILE} 파일이 없습니다.")
+        return
+
+    df = pd.read_csv(INPUT_FILE)
+    history_df = load_history()
+
+    # ★ 핵심: 기존 수집된 리뷰 모두 로드 (모든 reviews_collected_*.csv 파일)
+    existing_reviews_set = load_existing_reviews()
+
+    tasks = []
+    for idx, row in df.iterrows():
+        restaurant_name = row['restaurant'] if 'restaurant' in row else str(idx)
+        tasks.append((idx, row['URL'], restaurant_name, f"[{idx+1}/{len(df)}]"))
+
+    workers = max(1, min(WORKERS, len(tasks)))
+    start_time = time.time()
+    if workers > 1:
+        print(f"총 {len(df)}개 식당 처리 시작... (워커 {workers}개)")
+        results = crawl_parallel(tasks, history_df, existing_reviews_set, workers)
+    else:
+        print(f"총 {len(df)}개 식당 처리 시작...")
+        results = crawl_sequential(tasks, history_df, existing_reviews_set)
+    print(f"\n처리 완료: {len(results)}개 식당 ({time.time() - start_time:.0f}초)")
+
+    # 입력 파일 순서대로 병합 (워커 처리 순서와 무관하게 같은 결과)
+    all_collected_data = []
+    history_updates = []
+    for idx in sorted(results):
+        history_update, reviews = results[idx]
+        history_updates.append(history_update)
+        all_collected_data.extend(reviews)
 
     # 결과 저장 (기존 데이터 + 새 데이터 병합)
     if all_collected_data:
@@ -356,7 +792,7 @@ def main():
         print(f"결과 저장 완료: {OUTPUT_FILE}")
     else:
         print("\n새로 수집된 리뷰가 없습니다.")
-        
+
     # 히스토리 업데이트
     if history_updates:
         new_history = pd.DataFrame(history_updates)
@@ -369,4 +805,9 @@ def main():
         print("히스토리 업데이트 완료")
 
 if __name__ == "__main__":
-    main()
+    # python 캐치테이블_식당리뷰.py --record-reviews <가게 URL> ...  (리뷰 API 응답 녹화)
+    if len(sys.argv) > 1 and sys.argv[1] == "--record-reviews":
+        for shop_url in sys.argv[2:]:
+            record_review_pages(shop_url)
+    else:
+        main()